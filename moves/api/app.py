@@ -58,7 +58,7 @@ from api.routes import (
 )
 from api.websocket import create_websocket_router
 from broker.mock import MockBroker
-from config.settings import Mode, get_settings
+from config.settings import DATA_DIR, Mode, get_settings
 from db.database import Database
 from engine import pricing as pricing_module
 from engine.principles import PrinciplesEngine
@@ -108,7 +108,9 @@ def _start_scheduler(db: Database, container: Any) -> Any:
 
         analytics = AnalyticsEngine(db=db)
         whatif = WhatIfEngine(db=db)
-        congress = CongressTradesEngine(db=db, signal_engine=container.signal_engine)
+        congress = CongressTradesEngine(
+            db=db, signal_engine=container.signal_engine, cache_dir=DATA_DIR / "cache"
+        )
         signal_generator = SignalGenerator(
             db=db,
             signal_engine=container.signal_engine,
@@ -88,6 +88,10 @@ class Database:
         _conn: Internal SQLite connection (None until first connect() call).
     """
 
+    # Compiled statements kept per connection, keyed by SQL text. Engines hold
+    # their fixed queries in module-level constants so repeat calls hit this.
+    STATEMENT_CACHE_SIZE = 256
+
     def __init__(self, db_path: str | Path) -> None:
         """Initialize the Database with a file path.
 
@@ -109,8 +113,11 @@ class Database:
         On first call, creates a new connection with:
             - Dictionary row factory (results as dicts instead of tuples)
             - WAL journal mode (concurrent reads during writes)
+            - synchronous=NORMAL (fsync at checkpoints, not every commit; safe
+              against corruption in WAL mode)
             - Foreign key enforcement (referential integrity)
             - check_same_thread=False (allows multi-threaded access)
+            - A prepared-statement cache of STATEMENT_CACHE_SIZE entries
 
         Subsequent calls return the same connection instance.
 
@@ -118,12 +125,37 @@ class Database:
             The SQLite connection object.
         """
         if self._conn is None:
-            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
-            self._conn.row_factory = dict_row_factory
-            self._conn.execute("PRAGMA journal_mode = WAL")
-            self._conn.execute("PRAGMA foreign_keys = ON")
+            self._conn = self.open_connection()
         return self._conn
 
+    def open_connection(self, timeout: float = 5.0) -> sqlite3.Connection:
+        """Open a new connection to the same database file.
+
+        Configured like the shared connection (see connect()) but owned by the
+        caller, so its transactions never interleave with the shared one. WAL
+        mode lets it read alongside the shared connection; writes still wait
+        for any open write transaction to finish. Used by background writers;
+        the caller is responsible for closing it.
+
+        Args:
+            timeout: Seconds to wait for the write lock before raising
+                "database is locked".
+
+        Returns:
+            A new SQLite connection object.
+        """
+        conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=timeout,
+            check_same_thread=False,
+            cached_statements=self.STATEMENT_CACHE_SIZE,
+        )
+        conn.row_factory = dict_row_factory
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA foreign_keys = ON")
+        return conn
+
     def close(self) -> None:
         """Close the database connection.
 
@@ -137,7 +169,7 @@ class Database:
             self._conn = None
 
     @contextmanager
-    def transaction(self) -> Generator[sqlite3.Connection, None, None]:
+    def transaction(self, immediate: bool = False) -> Generator[sqlite3.Connection, None, None]:
         """Context manager for database transactions with automatic commit/rollback.
 
         Yields the connection for use within a with-block. On successful completion,
@@ -150,6 +182,12 @@ class Database:
                 conn.execute("UPDATE ...")
             # Auto-committed if no exception
 
+        Args:
+            immediate: Open with BEGIN IMMEDIATE so the write lock is taken up
+                front rather than on the first write. Use for bulk writes so
+                the batch can't fail midway on SQLITE_BUSY. Ignored if a
+                transaction is already open on the connection.
+
         Yields:
             The SQLite connection object.
 
@@ -157,6 +195,8 @@ class Database:
             Any exception that occurs within the with-block (after rollback).
         """
         conn = self.connect()
+        if immediate and not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
         try:
             yield conn
             conn.commit()
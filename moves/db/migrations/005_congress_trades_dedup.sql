@@ -0,0 +1,15 @@
+-- Migration 005: Enforce congress trade uniqueness in the database
+-- store_trades relies on INSERT OR IGNORE against this index instead of a
+-- Python-side dedup SELECT. Collapse any pre-existing duplicates first,
+-- keeping the earliest row for each (politician, symbol, date_traded).
+
+DELETE FROM congress_trades
+WHERE id NOT IN (
+    SELECT MIN(id) FROM congress_trades
+    GROUP BY politician, symbol, date_traded
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS ux_congress_trades_dedup
+    ON congress_trades(politician, symbol, date_traded);
+
+-- schema_version insert handled by apply_migration()
@@ -0,0 +1,11 @@
+-- Migration 006: Indexes for hot read paths
+-- congress_trades: check_overlap / get_summary filter by symbol and group by
+--   action; ux_congress_trades_dedup leads with politician so cannot serve them.
+-- portfolio_value: "latest NAV" lookups order by date DESC LIMIT 1.
+
+CREATE INDEX IF NOT EXISTS idx_congress_trades_symbol
+    ON congress_trades(symbol, action);
+CREATE INDEX IF NOT EXISTS idx_portfolio_value_date
+    ON portfolio_value(date);
+
+-- schema_version insert handled by apply_migration()
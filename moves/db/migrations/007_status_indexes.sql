@@ -0,0 +1,11 @@
+-- Migration 007: Indexes for status and discovery reads
+-- signals: pending-signal counts in startup/get_system_status filter by status.
+-- positions: the discovery scan lists symbols of open positions only, so a
+--   partial index keeps closed (shares = 0) rows out of it.
+
+CREATE INDEX IF NOT EXISTS idx_signals_status
+    ON signals(status);
+CREATE INDEX IF NOT EXISTS idx_positions_open_symbol
+    ON positions(symbol) WHERE shares > 0;
+
+-- schema_version insert handled by apply_migration()
@@ -53,6 +53,8 @@ CREATE TABLE IF NOT EXISTS positions (
     updated_at  TEXT DEFAULT (datetime('now'))
 );
 
+CREATE INDEX IF NOT EXISTS idx_positions_open_symbol ON positions(symbol) WHERE shares > 0;
+
 CREATE TABLE IF NOT EXISTS lots (
     id              INTEGER PRIMARY KEY AUTOINCREMENT,
     position_id     INTEGER REFERENCES positions(id),
@@ -124,6 +126,8 @@ CREATE TABLE IF NOT EXISTS signals (
     expired_at      TEXT
 );
 
+CREATE INDEX IF NOT EXISTS idx_signals_status ON signals(status);
+
 CREATE TABLE IF NOT EXISTS signal_scores (
     id          INTEGER PRIMARY KEY AUTOINCREMENT,
     source_type TEXT NOT NULL UNIQUE,
@@ -179,6 +183,8 @@ CREATE TABLE IF NOT EXISTS portfolio_value (
     daily_return_pct REAL DEFAULT 0
 );
 
+CREATE INDEX IF NOT EXISTS idx_portfolio_value_date ON portfolio_value(date);
+
 CREATE TABLE IF NOT EXISTS exposure_snapshots (
     id              INTEGER PRIMARY KEY AUTOINCREMENT,
     date            TEXT NOT NULL,
@@ -245,6 +251,8 @@ CREATE TABLE IF NOT EXISTS congress_trades (
     created_at  TEXT DEFAULT (datetime('now'))
 );
 
+CREATE INDEX IF NOT EXISTS idx_congress_trades_symbol ON congress_trades(symbol, action);
+
 CREATE TABLE IF NOT EXISTS what_if (
     id                  INTEGER PRIMARY KEY AUTOINCREMENT,
     signal_id           INTEGER REFERENCES signals(id),
@@ -9,13 +9,22 @@ from __future__ import annotations
 import json
 import logging
 import math
+from collections import defaultdict
 from datetime import UTC, datetime
 from typing import Any
 
+import numpy as np
+
 from db.database import Database
 
 logger = logging.getLogger(__name__)
 
+# Minimum return observations before VaR switches from parametric to historical
+VAR_MIN_HISTORICAL_OBS = 30
+
+# Calibration bucket labels, indexed by floor(confidence * 10)
+_CALIBRATION_BUCKETS = tuple(f"{i * 10}%-{(i + 1) * 10}%" for i in range(10))
+
 
 class AnalyticsEngine:
     """Computes portfolio performance metrics from database history.
@@ -46,14 +55,13 @@ class AnalyticsEngine:
             Annualized Sharpe ratio. Returns 0.0 if insufficient data.
         """
         returns = self._daily_returns(days)
-        if len(returns) < 2:
+        if returns.size < 2:
             return 0.0
 
-        daily_rf = rf / 252
-        excess = [r - daily_rf for r in returns]
-        mean_excess = sum(excess) / len(excess)
-        variance = sum((r - mean_excess) ** 2 for r in excess) / (len(excess) - 1)
-        std = math.sqrt(variance) if variance > 0 else 0.0
+        # Subtracting the constant daily rf does not change the spread, so the
+        # std is taken on the raw returns (exactly 0.0 for a flat NAV).
+        mean_excess = float(returns.mean()) - rf / 252
+        std = float(returns.std(ddof=1))
 
         if std == 0:
             return 0.0
@@ -73,19 +81,19 @@ class AnalyticsEngine:
         port_returns = self._daily_returns(252)
         bench_returns = self._benchmark_returns(benchmark, len(port_returns))
 
-        n = min(len(port_returns), len(bench_returns))
+        n = min(port_returns.size, bench_returns.size)
         if n < 2:
             return {"alpha": 0.0, "beta": 0.0, "correlation": 0.0}
 
         pr = port_returns[-n:]
         br = bench_returns[-n:]
 
-        mean_p = sum(pr) / n
-        mean_b = sum(br) / n
+        mean_p = float(pr.mean())
+        mean_b = float(br.mean())
 
-        cov = sum((pr[i] - mean_p) * (br[i] - mean_b) for i in range(n)) / (n - 1)
-        var_b = sum((b - mean_b) ** 2 for b in br) / (n - 1)
-        var_p = sum((p - mean_p) ** 2 for p in pr) / (n - 1)
+        cov = float(np.dot(pr - mean_p, br - mean_b)) / (n - 1)
+        var_b = float(br.var(ddof=1))
+        var_p = float(pr.var(ddof=1))
 
         beta = cov / var_b if var_b > 0 else 0.0
         alpha = (mean_p - beta * mean_b) * 252  # annualized
@@ -122,10 +130,11 @@ class AnalyticsEngine:
                 "losses": len(trades) - wins,
             }
 
-        groups: dict[str, list[dict]] = {}
+        key_field = self._group_key(group_by)
+        groups: defaultdict[str, list[dict]] = defaultdict(list)
         for t in trades:
-            key = str(t.get(self._group_key(group_by), "unknown"))
-            groups.setdefault(key, []).append(t)
+            value = t.get(key_field)
+            groups["unknown" if value is None else str(value)].append(t)
 
         result: dict[str, Any] = {}
         for key, group_trades in groups.items():
@@ -142,37 +151,34 @@ class AnalyticsEngine:
         """Analyze confidence calibration: predicted confidence vs actual win rates.
 
         Buckets signals by confidence into 10% ranges and compares predicted
-        vs actual win rates.
+        vs actual win rates. Confidence 1.0 falls in the top 90%-100% bucket.
 
         Returns:
-            List of dicts with bucket, predicted, actual, count.
+            List of dicts with bucket, predicted, actual, count, ordered by bucket.
         """
-        trades = self.db.fetchall(
+        rows = self._fetchrows(
             "SELECT s.confidence, t.realized_pnl "
             "FROM trades t JOIN signals s ON t.signal_id = s.id "
             "WHERE t.realized_pnl IS NOT NULL AND s.confidence IS NOT NULL"
         )
+        if not rows:
+            return []
 
-        buckets: dict[str, list[dict]] = {}
-        for t in trades:
-            conf = t["confidence"]
-            bucket_val = int(conf * 10) / 10  # floor to nearest 0.1
-            bucket_label = f"{bucket_val:.0%}-{bucket_val + 0.1:.0%}"
-            buckets.setdefault(bucket_label, []).append(t)
-
-        result = []
-        for label, bucket_trades in sorted(buckets.items()):
-            wins = sum(1 for t in bucket_trades if t["realized_pnl"] > 0)
-            confs = [t["confidence"] for t in bucket_trades]
-            result.append(
-                {
-                    "bucket": label,
-                    "predicted": sum(confs) / len(confs),
-                    "actual": wins / len(bucket_trades),
-                    "count": len(bucket_trades),
-                }
-            )
-        return result
+        conf, pnl = np.array(rows, dtype=np.float64).T
+        idx = np.clip(np.floor(conf * 10), 0, 9).astype(np.intp)
+        counts = np.bincount(idx, minlength=10)
+        wins = np.bincount(idx, weights=(pnl > 0).astype(np.float64), minlength=10)
+        conf_sums = np.bincount(idx, weights=conf, minlength=10)
+
+        return [
+            {
+                "bucket": _CALIBRATION_BUCKETS[b],
+                "predicted": float(conf_sums[b] / counts[b]),
+                "actual": float(wins[b] / counts[b]),
+                "count": int(counts[b]),
+            }
+            for b in np.flatnonzero(counts).tolist()
+        ]
 
     def max_drawdown(self) -> dict[str, Any]:
         """Calculate maximum and current drawdown from NAV history.
@@ -180,7 +186,7 @@ class AnalyticsEngine:
         Returns:
             Dict with max_dd, current_dd, days_underwater, peak_date, trough_date.
         """
-        navs = self.db.fetchall("SELECT date, total_value FROM portfolio_value ORDER BY date")
+        navs = self._fetchrows("SELECT date, total_value FROM portfolio_value ORDER BY date")
 
         if not navs:
             return {
@@ -191,19 +197,17 @@ class AnalyticsEngine:
                 "trough_date": None,
             }
 
-        peak = navs[0]["total_value"]
-        peak_date = navs[0]["date"]
+        peak_date, peak = navs[0]
         max_dd = 0.0
         max_dd_peak_date = peak_date
         max_dd_trough_date = peak_date
         current_dd = 0.0
         days_underwater = 0
 
-        for nav in navs:
-            val = nav["total_value"]
+        for date, val in navs:
             if val >= peak:
                 peak = val
-                peak_date = nav["date"]
+                peak_date = date
                 days_underwater = 0
             else:
                 dd = (peak - val) / peak
@@ -212,7 +216,7 @@ class AnalyticsEngine:
                 if dd > max_dd:
                     max_dd = dd
                     max_dd_peak_date = peak_date
-                    max_dd_trough_date = nav["date"]
+                    max_dd_trough_date = date
 
         return {
             "max_dd": max_dd,
@@ -223,23 +227,26 @@ class AnalyticsEngine:
         }
 
     def var_95(self) -> float:
-        """Calculate parametric 95% Value-at-Risk.
+        """Calculate 95% Value-at-Risk from daily returns.
 
-        Uses daily returns to estimate the 5th percentile loss.
+        With at least VAR_MIN_HISTORICAL_OBS returns, uses the empirical 5th
+        percentile (historical VaR), which captures fat tails the normal
+        approximation misses. With shorter histories the percentile is too
+        noisy, so it falls back to parametric mean - 1.645 * std.
 
         Returns:
             VaR as a positive fraction (e.g., 0.02 = 2% daily loss at 95% confidence).
         """
         returns = self._daily_returns(252)
-        if len(returns) < 2:
+        if returns.size < 2:
             return 0.0
 
-        mean = sum(returns) / len(returns)
-        variance = sum((r - mean) ** 2 for r in returns) / (len(returns) - 1)
-        std = math.sqrt(variance)
-
-        # 95% VaR = mean - 1.645 * std (parametric, normal assumption)
-        var = -(mean - 1.645 * std)
+        if returns.size >= VAR_MIN_HISTORICAL_OBS:
+            var = -float(np.percentile(returns, 5))
+        else:
+            mean = float(returns.mean())
+            std = float(returns.std(ddof=1))
+            var = -(mean - 1.645 * std)
         return max(var, 0.0)
 
     def stress_test(self, market_drop: float = -0.20) -> dict[str, Any]:
@@ -315,12 +322,12 @@ class AnalyticsEngine:
         Returns:
             List of dicts with date and nav keys.
         """
-        rows = self.db.fetchall(
+        rows = self._fetchrows(
             "SELECT date, total_value FROM portfolio_value "
             "WHERE date >= date('now', ? || ' days') ORDER BY date",
             (f"-{days}",),
         )
-        return [{"date": r["date"], "nav": r["total_value"]} for r in rows]
+        return [{"date": date, "nav": nav} for date, nav in rows]
 
     def snapshot_nav(self) -> None:
         """Record current NAV to portfolio_value table.
@@ -382,12 +389,7 @@ class AnalyticsEngine:
         gross_exp = gross / nav if nav > 0 else 0.0
         net_exp = net / nav if nav > 0 else 0.0
 
-        # Group by thesis
-        by_thesis: dict[str, float] = {}
-        for p in positions:
-            tid = str(p.get("thesis_id", "none"))
-            val = p["shares"] * p["price"]
-            by_thesis[tid] = by_thesis.get(tid, 0.0) + val
+        by_thesis = _sum_by_thesis(positions)
 
         self.db.execute(
             "INSERT INTO exposure_snapshots "
@@ -400,32 +402,23 @@ class AnalyticsEngine:
 
     # --- Private helpers ---
 
-    def _daily_returns(self, days: int) -> list[float]:
+    def _daily_returns(self, days: int) -> np.ndarray:
         """Extract daily return percentages from portfolio_value table.
 
         Args:
             days: Number of days to look back.
 
         Returns:
-            List of daily return fractions.
+            float32 array of daily return fractions (empty if < 2 NAV rows).
         """
-        rows = self.db.fetchall(
+        navs = self._fetchcol(
             "SELECT total_value FROM portfolio_value "
             "WHERE date >= date('now', ? || ' days') ORDER BY date",
             (f"-{days}",),
         )
-        if len(rows) < 2:
-            return []
+        return _pct_returns(navs)
 
-        returns = []
-        for i in range(1, len(rows)):
-            prev = rows[i - 1]["total_value"]
-            curr = rows[i]["total_value"]
-            if prev > 0:
-                returns.append((curr - prev) / prev)
-        return returns
-
-    def _benchmark_returns(self, symbol: str, count: int) -> list[float]:
+    def _benchmark_returns(self, symbol: str, count: int) -> np.ndarray:
         """Fetch benchmark daily returns from price_history.
 
         Args:
@@ -433,23 +426,47 @@ class AnalyticsEngine:
             count: Approximate number of returns needed.
 
         Returns:
-            List of daily return fractions.
+            float32 array of daily return fractions (empty if < 2 closes).
         """
-        rows = self.db.fetchall(
+        closes = self._fetchcol(
             "SELECT close FROM price_history WHERE symbol = ? "
             "AND interval = '1d' ORDER BY timestamp LIMIT ?",
             (symbol, count + 1),
         )
-        if len(rows) < 2:
-            return []
+        return _pct_returns(closes)
 
-        returns = []
-        for i in range(1, len(rows)):
-            prev = rows[i - 1]["close"]
-            curr = rows[i]["close"]
-            if prev > 0:
-                returns.append((curr - prev) / prev)
-        return returns
+    def _fetchrows(self, sql: str, params: tuple = ()) -> list[tuple]:
+        """Run a read query on a cursor that yields plain tuples.
+
+        The shared connection uses dict_row_factory; for the columnar analytics
+        reads the per-row dict construction is pure overhead, so this cursor
+        overrides the row factory locally without affecting other callers.
+
+        Args:
+            sql: SQL SELECT statement.
+            params: Parameters to bind.
+
+        Returns:
+            List of row tuples in SELECT column order.
+        """
+        cur = self.db.connect().cursor()
+        cur.row_factory = None
+        return cur.execute(sql, params).fetchall()
+
+    def _fetchcol(self, sql: str, params: tuple = ()) -> np.ndarray:
+        """Stream the first column of a numeric query into a float64 array.
+
+        Args:
+            sql: SQL SELECT statement whose first column is numeric.
+            params: Parameters to bind.
+
+        Returns:
+            float64 array of the first column's values.
+        """
+        cur = self.db.connect().cursor()
+        cur.row_factory = None
+        cur.execute(sql, params)
+        return np.fromiter((r[0] for r in cur), dtype=np.float64)
 
     @staticmethod
     def _group_key(group_by: str) -> str:
@@ -471,15 +488,54 @@ class AnalyticsEngine:
             y: Second series of values.
 
         Returns:
-            Correlation coefficient in [-1, 1].
+            Correlation coefficient in [-1, 1]; 0.0 when either series is constant.
         """
-        n = len(x)
-        mean_x = sum(x) / n
-        mean_y = sum(y) / n
+        with np.errstate(invalid="ignore", divide="ignore"):
+            corr = np.corrcoef(np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64))
+        return float(np.nan_to_num(corr[0, 1], nan=0.0))
+
+
+def _sum_by_thesis(positions: list[dict[str, Any]]) -> dict[str, float]:
+    """Sum position market values (shares * price) per thesis.
 
-        cov = sum((x[i] - mean_x) * (y[i] - mean_y) for i in range(n)) / (n - 1)
-        var_x = sum((v - mean_x) ** 2 for v in x) / (n - 1)
-        var_y = sum((v - mean_y) ** 2 for v in y) / (n - 1)
+    Thesis labels are factorized with np.unique and the values summed with a
+    weighted np.bincount, so the multiply-accumulate runs in C regardless of
+    portfolio size. Positions whose thesis_id is NULL are grouped under
+    "None"; positions with no thesis_id key at all are grouped under "none".
 
-        denom = math.sqrt(var_x * var_y)
-        return cov / denom if denom > 0 else 0.0
+    Args:
+        positions: Rows with shares and price keys and, usually, thesis_id.
+
+    Returns:
+        Dict mapping str(thesis_id) to total market value.
+    """
+    if not positions:
+        return {}
+    labels = [str(p.get("thesis_id", "none")) for p in positions]
+    vals = np.fromiter(
+        (p["shares"] * p["price"] for p in positions), dtype=np.float64, count=len(positions)
+    )
+    keys, inverse = np.unique(labels, return_inverse=True)
+    sums = np.bincount(inverse, weights=vals)
+    return dict(zip(keys.tolist(), sums.tolist()))
+
+
+def _pct_returns(series: np.ndarray) -> np.ndarray:
+    """Convert a price/NAV series into period-over-period return fractions.
+
+    Returns are computed in float64 and stored as float32: display metrics
+    (Sharpe, VaR, correlation) only need ~5 significant figures, and float32
+    halves the memory traffic of the reductions that consume these arrays.
+    Periods whose previous value is non-positive are skipped.
+
+    Args:
+        series: Ordered float64 series of prices or NAVs.
+
+    Returns:
+        float32 array of returns; empty when fewer than two values are given.
+    """
+    if series.size < 2:
+        return np.empty(0, dtype=np.float32)
+    prev, curr = series[:-1], series[1:]
+    valid = prev > 0
+    return ((curr[valid] - prev[valid]) / prev[valid]).astype(np.float32)
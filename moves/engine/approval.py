@@ -7,7 +7,14 @@ that don't meet auto-approve criteria are routed to the user via Telegram.
 
 from __future__ import annotations
 
+import atexit
+import json
 import logging
+import math
+import queue
+import sqlite3
+import threading
+import time
 from datetime import UTC, datetime
 from typing import Any
 
@@ -20,14 +27,218 @@ logger = logging.getLogger(__name__)
 DEFAULT_MAX_AUTO_VALUE = 500.0
 DEFAULT_MIN_AUTO_CONFIDENCE = 0.9
 
+# How long a settings-table lookup is reused before re-querying
+SETTINGS_CACHE_TTL_SECONDS = 60.0
 
-def _audit(db: Database, action: str, detail: str) -> None:
-    """Create an audit log entry."""
-    now = datetime.now(UTC).isoformat()
-    db.execute(
-        "INSERT INTO audit_log (actor, action, detail, timestamp) VALUES (?, ?, ?, ?)",
-        (ActorType.ENGINE, action, detail, now),
-    )
+# Fixed statements, kept byte-identical so the connection's statement cache
+# (see Database.STATEMENT_CACHE_SIZE) reuses the compiled form on every call.
+_SQL_GET_SETTING = "SELECT value FROM settings WHERE key = ?"
+_SQL_GET_PORTFOLIO_VALUE = "SELECT total_value FROM portfolio_value ORDER BY date DESC LIMIT 1"
+_SQL_GET_THESIS_STATUS = "SELECT status FROM theses WHERE id = ?"
+_SQL_GET_SIGNAL = "SELECT id, status, symbol, funding_plan FROM signals WHERE id = ?"
+_SQL_UPDATE_SIGNAL_APPROVED = "UPDATE signals SET status = ?, decided_at = ? WHERE id = ?"
+_SQL_INSERT_AUDIT = "INSERT INTO audit_log (actor, action, details, timestamp) VALUES (?, ?, ?, ?)"
+
+
+# Write-behind audit logging (see AuditWriter)
+AUDIT_QUEUE_MAXSIZE = 10_000
+AUDIT_BATCH_SIZE = 100
+# The writer thread can afford to wait out other writers' transactions
+AUDIT_BUSY_TIMEOUT_SECONDS = 30.0
+
+AuditRow = tuple[Any, ...]  # e.g. (actor, action, details, timestamp)
+
+
+class AuditWriter:
+    """Write-behind audit_log writer backed by a queue and a daemon thread.
+
+    Callers enqueue their audit rows and return immediately; the writer thread
+    drains the queue and inserts up to AUDIT_BATCH_SIZE rows per executemany.
+    Rows are written and committed on the writer's own connection (see
+    Database.open_connection), never inside another caller's transaction on
+    the shared one. The thread starts on first use and the queue is flushed
+    at interpreter exit. If the queue is full the row is written
+    synchronously rather than dropped.
+
+    A batch the thread fails to write is kept (see failed_count) rather than
+    discarded; the next flush() or close() retries it on the caller's thread
+    and raises if it still cannot be written.
+
+    Args:
+        db: Database the rows are written to.
+        sql: INSERT statement matching the shape of the queued rows.
+        name: Name of the writer thread.
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        sql: str = _SQL_INSERT_AUDIT,
+        *,
+        name: str = "approval-audit-writer",
+    ) -> None:
+        self.db = db
+        self.sql = sql
+        self.name = name
+        self._queue: queue.Queue[AuditRow] = queue.Queue(maxsize=AUDIT_QUEUE_MAXSIZE)
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._write_lock = threading.Lock()
+        self._failed: list[AuditRow] = []
+        self._failed_lock = threading.Lock()
+
+    @property
+    def failed_count(self) -> int:
+        """Number of rows whose background write failed and await a retry."""
+        with self._failed_lock:
+            return len(self._failed)
+
+    def put(self, row: AuditRow) -> None:
+        """Enqueue one audit row for the background writer."""
+        if self._thread is None:
+            self._start()
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            logger.warning("Audit queue full, writing entry synchronously")
+            self._write([row])
+
+    def flush(self) -> None:
+        """Block until every queued row has been written and committed.
+
+        Rows from batches the thread failed to write are retried here.
+
+        Raises:
+            sqlite3.Error: If the retried rows still cannot be written; they
+                stay queued for the next flush.
+        """
+        if self._thread is not None:
+            self._queue.join()
+        with self._failed_lock:
+            rows, self._failed = self._failed, []
+        if not rows:
+            return
+        try:
+            self._write(rows)
+        except Exception:
+            with self._failed_lock:
+                self._failed[:0] = rows
+            raise
+
+    def close(self) -> None:
+        """Flush queued rows and close the writer's connection.
+
+        Raises:
+            sqlite3.Error: If failed rows still cannot be written (see flush);
+                the connection is closed either way.
+        """
+        try:
+            self.flush()
+        finally:
+            with self._write_lock:
+                if self._conn is not None:
+                    self._conn.close()
+                    self._conn = None
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+                atexit.register(self.flush)
+
+    def _write(self, rows: list[AuditRow]) -> None:
+        """Insert and commit rows on the writer's own connection."""
+        with self._write_lock:
+            if self._conn is None:
+                self._conn = self.db.open_connection(timeout=AUDIT_BUSY_TIMEOUT_SECONDS)
+            try:
+                self._conn.executemany(self.sql, rows)
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < AUDIT_BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write(batch)
+            except Exception:
+                logger.exception("Failed to write %d audit entries, keeping them", len(batch))
+                with self._failed_lock:
+                    self._failed.extend(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+
+def _is_rebalance(signal: Signal) -> bool:
+    """Rule 3: rebalance signals maintain target weights and are always approved."""
+    if str(signal.source) == "rebalance":
+        logger.info("Auto-approve: rebalance signal for %s", signal.symbol)
+        return True
+    return False
+
+
+def _is_confirmed_high_confidence(
+    signal: Signal, min_confidence: float, thesis_status: str | None
+) -> bool:
+    """Rule 2: confidence at/above threshold on a signal whose thesis is confirmed."""
+    if signal.thesis_id and signal.confidence >= min_confidence and thesis_status == "confirmed":
+        logger.info(
+            "Auto-approve: %s %s confidence=%.2f with confirmed thesis",
+            signal.action,
+            signal.symbol,
+            signal.confidence,
+        )
+        return True
+    return False
+
+
+def _is_low_value(signal: Signal, portfolio_value: float, max_value: float) -> bool:
+    """Rule 1: estimated trade value (size_pct of portfolio) below the threshold."""
+    if signal.size_pct is None:
+        return False
+    trade_value = portfolio_value * (signal.size_pct / 100)
+    if trade_value < max_value:
+        logger.info(
+            "Auto-approve: %s %s value $%.0f < $%.0f threshold",
+            signal.action,
+            signal.symbol,
+            trade_value,
+            max_value,
+        )
+        return True
+    return False
+
+
+def _with_limit_price(funding_plan: str | None, limit_price: float) -> str:
+    """Return funding_plan JSON with limit_price set, keeping any other keys.
+
+    Args:
+        funding_plan: Existing funding_plan column value (JSON object or None).
+        limit_price: Finite limit price to store.
+
+    Returns:
+        JSON object string.
+    """
+    plan: dict[str, Any] = {}
+    if funding_plan:
+        try:
+            loaded = json.loads(funding_plan)
+        except (json.JSONDecodeError, TypeError):
+            loaded = None
+        if isinstance(loaded, dict):
+            plan = loaded
+    plan["limit_price"] = limit_price
+    return json.dumps(plan)
 
 
 class ApprovalWorkflow:
@@ -63,10 +274,25 @@ class ApprovalWorkflow:
         self.signal_engine = signal_engine
         self.broker = broker
         self.risk_manager = risk_manager
+        self._setting_cache: dict[str, tuple[float, float]] = {}
+        self._audit_writer = AuditWriter(db)
+
+    def _audit(self, action: str, detail: str) -> None:
+        """Queue an audit log entry for the background writer."""
+        now = datetime.now(UTC).isoformat()
+        self._audit_writer.put((ActorType.ENGINE, action, detail, now))
+
+    def flush_audit(self) -> None:
+        """Wait until all queued audit entries are written (tests, shutdown)."""
+        self._audit_writer.flush()
 
     def _get_setting(self, key: str, default: float) -> float:
         """Retrieve a numeric setting from the settings table.
 
+        Results (including fallbacks to the default) are memoized per key for
+        SETTINGS_CACHE_TTL_SECONDS, since thresholds change rarely but are read
+        for every signal routed through the workflow.
+
         Args:
             key: Setting key name.
             default: Default value if key not found.
@@ -74,13 +300,27 @@ class ApprovalWorkflow:
         Returns:
             The setting value as a float.
         """
-        row = self.db.fetch_one("SELECT value FROM settings WHERE key = ?", (key,))
+        now = time.monotonic()
+        cached = self._setting_cache.get(key)
+        if cached is not None and now - cached[1] < SETTINGS_CACHE_TTL_SECONDS:
+            return cached[0]
+
+        value = default
+        row = self.db.fetch_one(_SQL_GET_SETTING, (key,))
         if row:
             try:
-                return float(row["value"])
+                value = float(row["value"])
             except (ValueError, TypeError):
                 pass
-        return default
+        self._setting_cache[key] = (value, now)
+        return value
+
+    def invalidate_settings(self) -> None:
+        """Drop memoized settings so the next lookup re-reads the settings table.
+
+        Call after writing auto-approve thresholds so new values apply immediately.
+        """
+        self._setting_cache.clear()
 
     def should_auto_approve(self, signal: Signal) -> bool:
         """Check if a signal meets auto-approve criteria.
@@ -90,53 +330,39 @@ class ApprovalWorkflow:
         2. Confidence > threshold AND thesis is confirmed
         3. Signal is a rebalance action (maintaining target weights)
 
+        Rules are evaluated cheapest-first so the database is only touched when
+        a cheaper rule could not decide: Rule 3 is a pure string check, Rule 2
+        needs at most one thesis lookup, and Rule 1 needs the portfolio value.
+
         Args:
             signal: The signal to evaluate.
 
         Returns:
             True if the signal should be auto-approved.
         """
-        # Rule 1: Low-value trades
-        max_value = self._get_setting("auto_approve_max_value", DEFAULT_MAX_AUTO_VALUE)
-        if signal.size_pct is not None:
-            portfolio = self.db.fetch_one(
-                "SELECT total_value FROM portfolio_value ORDER BY timestamp DESC LIMIT 1"
-            )
-            if portfolio:
-                trade_value = portfolio["total_value"] * (signal.size_pct / 100)
-                if trade_value < max_value:
-                    logger.info(
-                        "Auto-approve: %s %s value $%.0f < $%.0f threshold",
-                        signal.action,
-                        signal.symbol,
-                        trade_value,
-                        max_value,
-                    )
-                    return True
+        # Rule 3: Rebalance signals
+        if _is_rebalance(signal):
+            return True
 
         # Rule 2: High confidence + confirmed thesis
-        min_confidence = self._get_setting(
-            "auto_approve_min_confidence", DEFAULT_MIN_AUTO_CONFIDENCE
-        )
-        if signal.confidence >= min_confidence and signal.thesis_id:
-            thesis = self.db.fetch_one(
-                "SELECT status FROM theses WHERE id = ?", (signal.thesis_id,)
+        if signal.thesis_id:
+            min_confidence = self._get_setting(
+                "auto_approve_min_confidence", DEFAULT_MIN_AUTO_CONFIDENCE
             )
-            if thesis and thesis["status"] == "confirmed":
-                logger.info(
-                    "Auto-approve: %s %s confidence=%.2f with confirmed thesis",
-                    signal.action,
-                    signal.symbol,
-                    signal.confidence,
-                )
-                return True
-
-        # Rule 3: Rebalance signals
-        if str(signal.source) == "rebalance":
-            logger.info("Auto-approve: rebalance signal for %s", signal.symbol)
-            return True
+            if signal.confidence >= min_confidence:
+                thesis = self.db.fetch_one(_SQL_GET_THESIS_STATUS, (signal.thesis_id,))
+                status = thesis["status"] if thesis else None
+                if _is_confirmed_high_confidence(signal, min_confidence, status):
+                    return True
 
-        return False
+        # Rule 1: Low-value trades
+        if signal.size_pct is None:
+            return False
+        portfolio = self.db.fetch_one(_SQL_GET_PORTFOLIO_VALUE)
+        if not portfolio:
+            return False
+        max_value = self._get_setting("auto_approve_max_value", DEFAULT_MAX_AUTO_VALUE)
+        return _is_low_value(signal, portfolio["total_value"], max_value)
 
     def process_signal(self, signal: Signal) -> dict[str, Any]:
         """Route a signal through the approval flow.
@@ -152,24 +378,106 @@ class ApprovalWorkflow:
         """
         if self.should_auto_approve(signal):
             now = datetime.now(UTC).isoformat()
-            self.db.execute(
-                "UPDATE signals SET status = ?, decided_at = ? WHERE id = ?",
-                (SignalStatus.APPROVED, now, signal.id),
-            )
-            _audit(
-                self.db,
+            self.db.execute(_SQL_UPDATE_SIGNAL_APPROVED, (SignalStatus.APPROVED, now, signal.id))
+            # Commit so the audit writer's connection isn't left waiting on this lock
+            self.db.connect().commit()
+            self._audit(
                 "signal_auto_approved",
                 f"Signal {signal.id}: {signal.action} {signal.symbol}",
             )
             return {"status": "auto_approved", "signal_id": signal.id}
 
-        _audit(
-            self.db,
+        self._audit(
             "signal_pending_approval",
             f"Signal {signal.id}: {signal.action} {signal.symbol} awaiting manual review",
         )
         return {"status": "pending", "signal_id": signal.id}
 
+    def process_signals(self, signals: list[Signal]) -> list[dict[str, Any]]:
+        """Route a burst of signals through the approval flow in bulk.
+
+        Equivalent to calling process_signal for each signal, but reads the
+        portfolio value, thresholds, and all referenced thesis statuses once,
+        approves every qualifying signal with a single UPDATE, and hands all
+        audit rows to the background writer. Use this when a strategy emits
+        many signals at once.
+
+        Args:
+            signals: Signals to process (all expected to be pending).
+
+        Returns:
+            One result dict per input signal, in input order, with 'status'
+            ('auto_approved' or 'pending') and 'signal_id'.
+        """
+        if not signals:
+            return []
+
+        min_confidence = self._get_setting(
+            "auto_approve_min_confidence", DEFAULT_MIN_AUTO_CONFIDENCE
+        )
+        max_value = self._get_setting("auto_approve_max_value", DEFAULT_MAX_AUTO_VALUE)
+        portfolio = self.db.fetch_one(_SQL_GET_PORTFOLIO_VALUE)
+        portfolio_value = portfolio["total_value"] if portfolio else None
+        statuses = self._get_thesis_statuses({s.thesis_id for s in signals if s.thesis_id})
+
+        now = datetime.now(UTC).isoformat()
+        approved_ids: list[int | None] = []
+        audit_rows: list[AuditRow] = []
+        results: list[dict[str, Any]] = []
+        for signal in signals:
+            approved = (
+                _is_rebalance(signal)
+                or _is_confirmed_high_confidence(
+                    signal, min_confidence, statuses.get(signal.thesis_id)
+                )
+                or (
+                    portfolio_value is not None
+                    and _is_low_value(signal, portfolio_value, max_value)
+                )
+            )
+            if approved:
+                approved_ids.append(signal.id)
+                action = "signal_auto_approved"
+                detail = f"Signal {signal.id}: {signal.action} {signal.symbol}"
+            else:
+                action = "signal_pending_approval"
+                detail = (
+                    f"Signal {signal.id}: {signal.action} {signal.symbol} awaiting manual review"
+                )
+            audit_rows.append((ActorType.ENGINE, action, detail, now))
+            results.append(
+                {"status": "auto_approved" if approved else "pending", "signal_id": signal.id}
+            )
+
+        if approved_ids:
+            placeholders = ",".join("?" for _ in approved_ids)
+            self.db.execute(
+                f"UPDATE signals SET status = ?, decided_at = ? WHERE id IN ({placeholders})",
+                (SignalStatus.APPROVED, now, *approved_ids),
+            )
+            self.db.connect().commit()
+        for row in audit_rows:
+            self._audit_writer.put(row)
+        return results
+
+    def _get_thesis_statuses(self, thesis_ids: set[int]) -> dict[int, str]:
+        """Fetch the status of several theses in one query.
+
+        Args:
+            thesis_ids: Thesis IDs to look up.
+
+        Returns:
+            Dict mapping thesis ID to status; missing theses are omitted.
+        """
+        if not thesis_ids:
+            return {}
+        ids = list(thesis_ids)
+        placeholders = ",".join("?" for _ in ids)
+        rows = self.db.fetch_all(
+            f"SELECT id, status FROM theses WHERE id IN ({placeholders})", tuple(ids)
+        )
+        return {row["id"]: row["status"] for row in rows}
+
     def modify_signal(
         self,
         signal_id: int,
@@ -188,7 +496,7 @@ class ApprovalWorkflow:
         Returns:
             Dictionary with 'success' flag and 'message'.
         """
-        row = self.db.fetch_one("SELECT id, status, symbol FROM signals WHERE id = ?", (signal_id,))
+        row = self.db.fetch_one(_SQL_GET_SIGNAL, (signal_id,))
         if not row:
             return {"success": False, "message": f"Signal {signal_id} not found"}
 
@@ -206,8 +514,10 @@ class ApprovalWorkflow:
             params.append(size_override)
 
         if price_override is not None:
+            if not math.isfinite(price_override):
+                return {"success": False, "message": f"Invalid limit price: {price_override}"}
             updates.append("funding_plan = ?")
-            params.append(f'{{"limit_price": {price_override}}}')
+            params.append(_with_limit_price(row.get("funding_plan"), price_override))
 
         if not updates:
             return {"success": False, "message": "No modifications specified"}
@@ -217,12 +527,13 @@ class ApprovalWorkflow:
             f"UPDATE signals SET {', '.join(updates)} WHERE id = ?",
             tuple(params),
         )
+        self.db.connect().commit()
 
         detail = f"Signal {signal_id} modified:"
         if size_override is not None:
             detail += f" size_pct={size_override}"
         if price_override is not None:
             detail += f" limit_price={price_override}"
-        _audit(self.db, "signal_modified", detail)
+        self._audit("signal_modified", detail)
 
         return {"success": True, "message": detail}
@@ -10,17 +10,29 @@ Data sources (tried in order):
 
 from __future__ import annotations
 
+import importlib.util
+import json
 import logging
+import re
+import string
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import UTC, datetime, timedelta
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import httpx
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 
 from db.database import Database
 from engine import Signal, SignalAction, SignalSource, SignalStatus
-from engine.congress_scoring import PoliticianScorer, calculate_disclosure_lag, parse_amount_bucket
+from engine.congress_scoring import (
+    PoliticianScorer,
+    calculate_disclosure_lag,
+    parse_amount_bucket,
+)
 
 if TYPE_CHECKING:
     from engine.signals import SignalEngine
@@ -32,66 +44,304 @@ HOUSE_STOCK_WATCHER_URL = (
     "https://house-stock-watcher-data.s3-us-west-2.amazonaws.com/data/all_transactions.json"
 )
 REQUEST_TIMEOUT = 30
-RATE_LIMIT_DELAY = 1.0  # seconds between requests
+RATE_LIMIT_DELAY = 1.0  # min seconds between requests to the same host
+HTTP_HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; MoneyMoves/1.0)"}
+# HTTP/2 needs the optional h2 package; without it the pooled client stays on HTTP/1.1.
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+OVERLAP_CACHE_TTL_SECONDS = 60.0  # how long a user's check_overlap result is reused
+SUMMARY_RECENT_LIMIT = 20  # max recent buys/sells returned by get_summary
+HSW_CACHE_FILE = "house_stock_watcher.json"  # S3 body, cached under cache_dir
+# Head start S3 gets before the Capitol Trades fallback is started alongside it
+CAPITOL_HEDGE_DELAY = 2.0
+HSW_CACHE_MAX_AGE_SECONDS = 6 * 60 * 60  # after this, re-download without validators
+
+# Fixed statements, kept byte-identical so the connection's statement cache
+# reuses the compiled form. IN (...) queries are built per call.
+_SQL_INSERT_TRADE = """INSERT OR IGNORE INTO congress_trades
+    (politician, symbol, action, amount_range, date_filed,
+     date_traded, source_url, politician_score,
+     disclosure_lag_days, trade_size_bucket, committee_relevant)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+# Which of a batch's (politician, symbol, date_traded) keys, passed as a JSON
+# array of triples, are already stored; probes ux_congress_trades_dedup.
+_SQL_STORED_TRADE_KEYS = """SELECT t.politician, t.symbol, t.date_traded
+    FROM json_each(?) AS k JOIN congress_trades AS t
+    ON t.politician = json_extract(k.value, '$[0]')
+    AND t.symbol = json_extract(k.value, '$[1]')
+    AND t.date_traded = json_extract(k.value, '$[2]')"""
+_SQL_OPEN_THESES = (
+    "SELECT id, symbols FROM theses "
+    "WHERE status IN ('active', 'strengthening', 'confirmed') AND user_id = ?"
+)
+_SQL_COUNT_TRADES = "SELECT COUNT(*) as cnt FROM congress_trades"
+# A user's watched symbols: position symbols plus every symbol on an open
+# thesis, expanded from the JSON symbols column by SQLite's json_each.
+# Malformed JSON is treated as an empty list, as the Python parser did.
+_CTE_WATCHED = """WITH watched(symbol) AS (
+    SELECT symbol FROM positions WHERE user_id = :user_id
+    UNION
+    SELECT j.value FROM theses t,
+        json_each(CASE WHEN json_valid(t.symbols) THEN t.symbols ELSE '[]' END) j
+    WHERE t.status IN ('active', 'strengthening', 'confirmed') AND t.user_id = :user_id
+)
+"""
+_SQL_OVERLAPPING_TRADES = (
+    _CTE_WATCHED
+    + "SELECT ct.* FROM congress_trades ct JOIN watched w ON ct.symbol = w.symbol ORDER BY ct.id"
+)
+_SQL_WATCHED_NET = (
+    _CTE_WATCHED
+    + "SELECT ct.symbol, COUNT(*) AS c, "
+    "SUM(CASE ct.action WHEN 'buy' THEN 1 WHEN 'sell' THEN -1 ELSE 0 END) AS net, "
+    "SUM(ct.action IN ('buy', 'sell')) AS directional "
+    "FROM congress_trades ct JOIN watched w ON ct.symbol = w.symbol GROUP BY ct.symbol"
+)
+_SQL_WATCHED_RECENT = (
+    _CTE_WATCHED
+    + "SELECT ct.* FROM congress_trades ct JOIN watched w ON ct.symbol = w.symbol "
+    "WHERE ct.action = :action ORDER BY ct.date_traded DESC LIMIT :limit"
+)
+
+
+# host -> monotonic time of its most recently reserved request slot
+_last_request: dict[str, float] = {}
+_last_request_lock = threading.Lock()
+
+
+def _throttle(host: str, min_gap: float = RATE_LIMIT_DELAY) -> None:
+    """Space requests to one host at least min_gap seconds apart.
+
+    Only sleeps for the remainder of the gap since the last request to the
+    same host, so requests to other hosts (or the first one) never wait.
+
+    Args:
+        host: Hostname the request is about to go to.
+        min_gap: Minimum seconds between consecutive requests to host.
+    """
+    with _last_request_lock:
+        now = time.monotonic()
+        previous = _last_request.get(host)
+        slot = now if previous is None else max(now, previous + min_gap)
+        _last_request[host] = slot
+    if slot > now:
+        time.sleep(slot - now)
+
+
+# Exact transaction-type labels seen from both sources -> canonical action.
+_ACTION_MAP = {
+    "purchase": "buy",
+    "buy": "buy",
+    "p": "buy",
+    "sale": "sell",
+    "sale (full)": "sell",
+    "sale (partial)": "sell",
+    "sale_full": "sell",
+    "sale_partial": "sell",
+    "sell": "sell",
+    "s": "sell",
+    "exchange": "exchange",
+}
+
+
+def _normalize_action(action_raw: str) -> str:
+    """Map a lowercased transaction type to buy/sell/exchange.
+
+    Known labels resolve with one dict lookup; anything else falls back to
+    substring matching and is returned unchanged if nothing matches.
+
+    Args:
+        action_raw: Lowercased transaction type from the source.
+
+    Returns:
+        Canonical action string.
+    """
+    action = _ACTION_MAP.get(action_raw)
+    if action is not None:
+        return action
+    if "purchase" in action_raw or "buy" in action_raw:
+        return "buy"
+    if "sale" in action_raw or "sell" in action_raw:
+        return "sell"
+    if "exchange" in action_raw:
+        return "exchange"
+    return action_raw
+
+
+_ISO_DATE_RE = re.compile(r"([0-9]{4})-([0-9]{1,2})-([0-9]{1,2})")
+_US_DATE_RE = re.compile(r"([0-9]{1,2})/([0-9]{1,2})/([0-9]{4}|[0-9]{2})")
+
+# Compiled once; tree.xpath("...") would re-compile the expression on every call.
+_XPATH_TRADE_ROWS = etree.XPath("//table/tbody/tr")
+_XPATH_ROW_CELLS = etree.XPath(".//td")
+
+_ASCII_UPPER = str.maketrans(string.ascii_lowercase, string.ascii_uppercase)
+_TICKER_CHARS = frozenset(string.ascii_uppercase)
+
+
+def _normalize_ticker(raw: str) -> str | None:
+    """Uppercase a ticker and check it is purely A-Z.
+
+    Args:
+        raw: Stripped ticker text from the source.
+
+    Returns:
+        The uppercased ticker, or None if empty or containing anything but
+        ASCII letters (e.g. '--', 'BRK.B', digits).
+    """
+    symbol = raw.translate(_ASCII_UPPER)
+    if not symbol or not _TICKER_CHARS.issuperset(symbol):
+        return None
+    return symbol
 
 
 class CongressTradesEngine:
     """Scrapes and analyzes congressional trading activity."""
 
-    def __init__(self, db: Database, signal_engine: SignalEngine | None = None) -> None:
+    def __init__(
+        self,
+        db: Database,
+        signal_engine: SignalEngine | None = None,
+        cache_dir: Path | None = None,
+    ) -> None:
+        """Initialize the engine.
+
+        Args:
+            db: Database instance.
+            signal_engine: Engine used to persist generated signals.
+            cache_dir: Directory for the on-disk House Stock Watcher cache.
+                None disables it, so every fetch downloads the full dataset.
+        """
         self.db = db
         self.signal_engine = signal_engine
+        self.cache_dir = cache_dir
         self.scorer = PoliticianScorer(db)
+        self._thesis_map_cache: dict[int, tuple[tuple, dict[str, int]]] = {}
+        self._overlap_cache: dict[int, tuple[float, list[dict]]] = {}
+        self._client: httpx.Client | None = None
+
+    def __enter__(self) -> CongressTradesEngine:
+        return self
 
-    def fetch_recent(self, days: int = 7) -> list[dict]:
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _http_client(self) -> httpx.Client:
+        """Return the shared HTTP client, creating it on first use.
+
+        One pooled client is kept for the engine's lifetime so scheduled
+        scrapes reuse the TCP/TLS connection instead of handshaking each run.
+        """
+        if self._client is None:
+            self._client = httpx.Client(
+                timeout=REQUEST_TIMEOUT,
+                follow_redirects=True,
+                headers=HTTP_HEADERS,
+                http2=_HTTP2_AVAILABLE,
+            )
+        return self._client
+
+    def close(self) -> None:
+        """Close the shared HTTP client, if one was opened."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def fetch_recent(self, days: int = 7, force: bool = False) -> list[dict]:
         """Fetch recent congressional trades from available sources.
 
-        Tries House Stock Watcher S3 first, falls back to Capitol Trades HTML.
+        Prefers House Stock Watcher S3 and falls back to Capitol Trades HTML.
+        S3 gets a CAPITOL_HEDGE_DELAY head start: if it answers in time the
+        scrape never runs, and only a slow S3 request has the fallback started
+        alongside it. The method does not return while a worker is still using
+        the shared client.
 
         Args:
             days: How many days back to look for trades.
+            force: Bypass the on-disk House Stock Watcher cache.
 
         Returns:
             List of trade dicts with politician, symbol, action, amount_range,
             date_filed, date_traded, source_url keys.
         """
-        # Try House Stock Watcher S3 dataset first (most reliable free source)
         try:
-            trades = self._fetch_house_stock_watcher(days)
-            if trades:
-                return trades
+            # Create the shared client up front so both workers reuse one pool.
+            self._http_client()
         except Exception:
-            logger.warning("House Stock Watcher fetch failed", exc_info=True)
+            logger.warning("Could not create HTTP client for congress sources", exc_info=True)
+            return []
 
-        # Fallback to Capitol Trades HTML scraping
-        try:
-            time.sleep(RATE_LIMIT_DELAY)
-            return self._scrape_capitol_trades(days)
-        except Exception:
-            logger.warning("Capitol Trades scrape failed", exc_info=True)
+        # Leaving the block waits for any scrape still in flight.
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="congress-fetch") as pool:
+            house = pool.submit(self._fetch_house_stock_watcher, days, force)
+            wait([house], timeout=CAPITOL_HEDGE_DELAY)
+            capitol = None if house.done() else pool.submit(self._scrape_capitol_trades, days)
+
+            # House Stock Watcher S3 dataset first (most reliable free source)
+            try:
+                trades = house.result()
+                if trades:
+                    return trades
+            except Exception:
+                logger.warning("House Stock Watcher fetch failed", exc_info=True)
+
+            # Fallback to Capitol Trades HTML scraping
+            if capitol is None:
+                capitol = pool.submit(self._scrape_capitol_trades, days)
+            try:
+                return capitol.result()
+            except Exception:
+                logger.warning("Capitol Trades scrape failed", exc_info=True)
 
         logger.warning("All congress trade sources failed, returning empty")
         return []
 
-    def _fetch_house_stock_watcher(self, days: int) -> list[dict]:
+    def _fetch_house_stock_watcher(self, days: int, force: bool = False) -> list[dict]:
         """Fetch trades from the House Stock Watcher S3 dataset.
 
+        With a cache_dir, the request is a conditional GET against the last
+        stored copy; a 304 reuses the file on disk instead of re-downloading
+        the full multi-megabyte dataset.
+
         Args:
             days: Only return trades from the last N days.
+            force: Ignore the cached copy and download unconditionally.
 
         Returns:
             List of parsed trade dicts.
         """
-        headers = {"User-Agent": "Mozilla/5.0 (compatible; MoneyMoves/1.0)"}
-        with httpx.Client(timeout=REQUEST_TIMEOUT, follow_redirects=True) as client:
-            resp = client.get(HOUSE_STOCK_WATCHER_URL, headers=headers)
+        cached = None if force else self._load_hsw_cache()
+        headers: dict[str, str] = {}
+        if cached is not None:
+            meta, _ = cached
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        resp = self._http_client().get(HOUSE_STOCK_WATCHER_URL, headers=headers)
+        if cached is not None and resp.status_code == 304:
+            logger.debug("House Stock Watcher not modified, using cached copy")
+            raw_trades = json.loads(cached[1])
+        else:
             resp.raise_for_status()
-
-        raw_trades = resp.json()
+            raw_trades = resp.json()
+            self._save_hsw_cache(resp)
         cutoff = datetime.now(UTC) - timedelta(days=days)
+        # ISO dates sort lexicographically, so most of the (multi-year)
+        # dataset is rejected by a string compare before any per-row parsing.
+        cutoff_iso = cutoff.date().isoformat()
         trades: list[dict] = []
 
         for raw in raw_trades:
+            date_traded = raw.get("transaction_date")
+            if (
+                isinstance(date_traded, str)
+                and len(date_traded) == 10
+                and date_traded[4] == "-"
+                and date_traded[7] == "-"
+                and date_traded < cutoff_iso
+            ):
+                continue
             trade = self._parse_house_stock_watcher_entry(raw, cutoff)
             if trade:
                 trades.append(trade)
@@ -102,6 +352,53 @@ class CongressTradesEngine:
         )
         return trades
 
+    def _load_hsw_cache(self) -> tuple[dict, bytes] | None:
+        """Read the cached S3 body and its validators, if still usable.
+
+        Returns:
+            (metadata, body) or None when caching is disabled, nothing is
+            cached, the files are unreadable, or the copy is older than
+            HSW_CACHE_MAX_AGE_SECONDS.
+        """
+        if self.cache_dir is None:
+            return None
+        body_path = self.cache_dir / HSW_CACHE_FILE
+        try:
+            meta = json.loads(body_path.with_suffix(".meta.json").read_text())
+            if time.time() - meta["fetched_at"] > HSW_CACHE_MAX_AGE_SECONDS:
+                return None
+            return meta, body_path.read_bytes()
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _save_hsw_cache(self, resp: httpx.Response) -> None:
+        """Persist a full S3 response and its ETag/Last-Modified validators.
+
+        Failures are logged and ignored; the cache only saves bandwidth.
+
+        Args:
+            resp: Successful (200) response from the S3 dataset.
+        """
+        if self.cache_dir is None:
+            return
+        body_path = self.cache_dir / HSW_CACHE_FILE
+        meta = {
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+            "fetched_at": time.time(),
+        }
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Body first, then metadata, each via rename, so a crash can't
+            # leave validators pointing at a partially written body.
+            tmp = body_path.with_suffix(".tmp")
+            tmp.write_bytes(resp.content)
+            tmp.replace(body_path)
+            tmp.write_text(json.dumps(meta))
+            tmp.replace(body_path.with_suffix(".meta.json"))
+        except OSError:
+            logger.warning("Could not write House Stock Watcher cache", exc_info=True)
+
     def _parse_house_stock_watcher_entry(self, raw: dict, cutoff: datetime) -> dict | None:
         """Parse a single entry from the House Stock Watcher JSON dataset.
 
@@ -123,19 +420,11 @@ class CongressTradesEngine:
             if trade_dt and trade_dt < cutoff:
                 return None
 
-            ticker = raw.get("ticker", "").strip().upper()
-            if not ticker or ticker == "--" or not ticker.isalpha() or len(ticker) > 6:
+            ticker = _normalize_ticker(raw.get("ticker", "").strip())
+            if ticker is None or len(ticker) > 6:
                 return None
 
-            action_raw = raw.get("type", "").lower()
-            if "purchase" in action_raw or "buy" in action_raw:
-                action = "buy"
-            elif "sale" in action_raw or "sell" in action_raw:
-                action = "sell"
-            elif "exchange" in action_raw:
-                action = "exchange"
-            else:
-                action = action_raw
+            action = _normalize_action(raw.get("type", "").lower())
 
             return {
                 "politician": raw.get("representative", "Unknown"),
@@ -153,18 +442,31 @@ class CongressTradesEngine:
     def _parse_date(date_str: str) -> datetime | None:
         """Parse a date string in common formats.
 
+        Matches precompiled patterns instead of trying strptime formats in
+        turn, so unparseable or US-style dates don't cost a raised ValueError
+        per attempted format.
+
         Args:
-            date_str: Date string like '2024-01-15' or '01/15/2024'.
+            date_str: Date string like '2024-01-15', '01/15/2024', or '01/15/24'.
 
         Returns:
             Datetime object or None if unparseable.
         """
-        for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%m/%d/%y"):
-            try:
-                return datetime.strptime(date_str, fmt).replace(tzinfo=UTC)
-            except ValueError:
-                continue
-        return None
+        m = _ISO_DATE_RE.fullmatch(date_str)
+        if m:
+            year, month, day = int(m[1]), int(m[2]), int(m[3])
+        else:
+            m = _US_DATE_RE.fullmatch(date_str)
+            if not m:
+                return None
+            month, day, year = int(m[1]), int(m[2]), int(m[3])
+            if len(m[3]) == 2:
+                # Same pivot as strptime's %y: 69-99 -> 19xx, 00-68 -> 20xx
+                year += 1900 if year >= 69 else 2000
+        try:
+            return datetime(year, month, day, tzinfo=UTC)
+        except ValueError:
+            return None
 
     def _scrape_capitol_trades(self, days: int) -> list[dict]:
         """Scrape trades from Capitol Trades HTML.
@@ -175,54 +477,61 @@ class CongressTradesEngine:
         Returns:
             List of parsed trade dicts.
         """
-        headers = {
-            "User-Agent": "Mozilla/5.0 (compatible; MoneyMoves/1.0)",
-            "Accept": "text/html",
-        }
-        with httpx.Client(timeout=REQUEST_TIMEOUT, follow_redirects=True) as client:
-            resp = client.get(CAPITOL_TRADES_URL, headers=headers)
-            resp.raise_for_status()
+        _throttle(httpx.URL(CAPITOL_TRADES_URL).host)
+        resp = self._http_client().get(CAPITOL_TRADES_URL, headers={"Accept": "text/html"})
+        resp.raise_for_status()
 
-        soup = BeautifulSoup(resp.text, "html.parser")
         cutoff = datetime.now(UTC) - timedelta(days=days)
-        trades: list[dict] = []
+        trades = self._parse_capitol_trades_html(resp.text, cutoff)
+
+        logger.info("Scraped %d congress trades from Capitol Trades", len(trades))
+        return trades
+
+    def _parse_capitol_trades_html(self, text: str, cutoff: datetime) -> list[dict]:
+        """Parse the Capitol Trades results table into trade dicts.
 
-        rows = soup.select("table tbody tr")
-        for row in rows:
+        Uses lxml's C HTML parser; the page is a single large table and the
+        parse dominates scrape time once the response has arrived.
+
+        Args:
+            text: Raw HTML of the trades page.
+            cutoff: Only return trades after this datetime.
+
+        Returns:
+            List of parsed trade dicts.
+        """
+        if not text.strip():
+            return []
+        tree = lxml_html.fromstring(text)
+        trades: list[dict] = []
+        for row in _XPATH_TRADE_ROWS(tree):
             trade = self._parse_trade_row(row, cutoff)
             if trade:
                 trades.append(trade)
-
-        logger.info("Scraped %d congress trades from Capitol Trades", len(trades))
         return trades
 
-    def _parse_trade_row(self, row: BeautifulSoup, cutoff: datetime) -> dict | None:
+    def _parse_trade_row(self, row: lxml_html.HtmlElement, cutoff: datetime) -> dict | None:
         """Parse a single trade row from the Capitol Trades HTML table.
 
         Args:
-            row: BeautifulSoup element for a table row.
+            row: lxml element for a table row.
             cutoff: Only return trades after this datetime.
 
         Returns:
             Parsed trade dict or None if invalid.
         """
-        cells = row.select("td")
+        cells = _XPATH_ROW_CELLS(row)
         if len(cells) < 5:
             return None
 
         try:
-            member_name = cells[0].get_text(strip=True)
-            symbol = cells[1].get_text(strip=True).upper()
-            action = cells[2].get_text(strip=True).lower()
-            amount_range = cells[3].get_text(strip=True)
-            date_text = cells[4].get_text(strip=True)
-
-            if "purchase" in action or "buy" in action:
-                action = "buy"
-            elif "sale" in action or "sell" in action:
-                action = "sell"
-
-            if not symbol or not symbol.isalpha():
+            member_name = cells[0].text_content().strip()
+            symbol = _normalize_ticker(cells[1].text_content().strip())
+            action = _normalize_action(cells[2].text_content().strip().lower())
+            amount_range = cells[3].text_content().strip()
+            date_text = cells[4].text_content().strip()
+
+            if symbol is None:
                 return None
 
             return {
@@ -238,31 +547,35 @@ class CongressTradesEngine:
             return None
 
     def store_trades(self, trades: list[dict]) -> int:
-        """Insert new trades into the database, skipping duplicates. Global (no user_id)."""
-        inserted = 0
-        for trade in trades:
-            politician = trade.get("politician") or trade.get("member_name", "")
-            symbol = trade["symbol"]
-            date_traded = trade.get("date_traded") or trade.get("transaction_date", "")
-            date_filed = trade.get("date_filed") or trade.get("disclosure_date", "")
+        """Insert new trades into the database, skipping duplicates. Global (no user_id).
 
-            existing = self.db.fetchone(
-                """SELECT id FROM congress_trades
-                   WHERE politician = ? AND symbol = ? AND date_traded = ?""",
-                (politician, symbol, date_traded),
-            )
-            if existing:
-                continue
+        Duplicates (same politician, symbol, and trade date) within the batch
+        and rows already stored are dropped up front, with one lookup against
+        the ux_congress_trades_dedup index, so known trades are never enriched
+        or rescored. New rows are written with a single INSERT OR IGNORE
+        executemany inside one BEGIN IMMEDIATE transaction, so a scrape costs
+        one commit and a failure leaves no partial batch behind.
 
-            enriched = self.scorer.enrich_trade(trade)
-            lag = calculate_disclosure_lag(date_traded, date_filed)
-            bucket = parse_amount_bucket(trade.get("amount_range", ""))
-            self.db.execute(
-                """INSERT INTO congress_trades
-                   (politician, symbol, action, amount_range, date_filed,
-                    date_traded, source_url, politician_score,
-                    disclosure_lag_days, trade_size_bucket, committee_relevant)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+        Args:
+            trades: Parsed trade dicts from fetch_recent (or legacy key names).
+
+        Returns:
+            Number of trades inserted.
+        """
+        keyed: dict[tuple[str, str, str], dict] = {}
+        for trade in trades:
+            keyed.setdefault(self._trade_key(trade), trade)
+        if keyed:
+            stored = self.db.fetchall(_SQL_STORED_TRADE_KEYS, (json.dumps(list(keyed)),))
+            for row in stored:
+                keyed.pop((row["politician"], row["symbol"], row["date_traded"]), None)
+        unique = list(keyed.values())
+
+        rows: list[tuple] = []
+        for trade, enriched in zip(unique, self.scorer.enrich_many(unique), strict=True):
+            politician, symbol, date_traded = self._trade_key(trade)
+            date_filed = trade.get("date_filed") or trade.get("disclosure_date", "")
+            rows.append(
                 (
                     politician,
                     symbol,
@@ -272,31 +585,45 @@ class CongressTradesEngine:
                     date_traded,
                     trade.get("source_url", ""),
                     enriched.get("politician_score"),
-                    lag,
-                    bucket,
+                    calculate_disclosure_lag(date_traded, date_filed),
+                    parse_amount_bucket(trade.get("amount_range", "")),
                     enriched.get("committee_relevant", 0),
-                ),
+                )
             )
-            inserted += 1
 
+        inserted = 0
+        if rows:
+            # ux_congress_trades_dedup (migration 005) drops already-stored rows.
+            with self.db.transaction(immediate=True) as conn:
+                cur = conn.executemany(_SQL_INSERT_TRADE, rows)
+                inserted = max(cur.rowcount, 0)
         if inserted:
-            self.db.connect().commit()
-            # Refresh politician scores after new trades
-            self._refresh_politician_scores(trades)
+            self._overlap_cache.clear()
+            # Refresh scores only for politicians with newly stored trades
+            self._refresh_politician_scores(unique)
         logger.info("Stored %d new congress trades (of %d fetched)", inserted, len(trades))
         return inserted
 
+    @staticmethod
+    def _trade_key(trade: dict) -> tuple[str, str, str]:
+        """Return the (politician, symbol, date_traded) dedup key for a trade dict."""
+        politician = trade.get("politician") or trade.get("member_name", "")
+        date_traded = trade.get("date_traded") or trade.get("transaction_date", "")
+        return politician, trade["symbol"], date_traded
+
     def _refresh_politician_scores(self, trades: list[dict]) -> None:
-        """Refresh politician scores for politicians seen in the batch."""
-        politicians = {
-            t.get("politician") or t.get("member_name", "") for t in trades
-        }
-        for name in politicians:
-            if name:
-                try:
-                    self.scorer.score_politician(name)
-                except Exception:
-                    logger.warning("Failed to score politician: %s", name, exc_info=True)
+        """Refresh politician scores for politicians seen in the batch.
+
+        All affected politicians are rescored together and saved in a single
+        transaction rather than one commit per politician.
+        """
+        politicians = {t.get("politician") or t.get("member_name", "") for t in trades}
+        try:
+            self.scorer.score_politicians(politicians)
+        except Exception:
+            logger.warning(
+                "Failed to score %d politicians", len(politicians), exc_info=True
+            )
 
     def refresh_all_scores(self) -> int:
         """Re-score all politicians with trades. Returns count scored."""
@@ -309,41 +636,24 @@ class CongressTradesEngine:
         Args:
             user_id: ID of the owning user.
 
+        Positions, open-thesis symbols (expanded in SQL via json_each), and the
+        trade join are resolved in a single query.
+
+        Results are memoized per user for OVERLAP_CACHE_TTL_SECONDS and dropped
+        whenever store_trades inserts new rows, so back-to-back callers share
+        one positions/theses/trades read. Position changes show up once the
+        TTL lapses.
+
         Returns:
             List of congress trade dicts that overlap with the user's portfolio/thesis symbols.
         """
-        position_rows = self.db.fetchall(
-            "SELECT DISTINCT symbol FROM positions WHERE user_id = ?",
-            (user_id,),
-        )
-        position_symbols = {r["symbol"] for r in position_rows}
-
-        thesis_rows = self.db.fetchall(
-            "SELECT symbols FROM theses WHERE status IN "
-            "('active', 'strengthening', 'confirmed') AND user_id = ?",
-            (user_id,),
-        )
-        thesis_symbols: set[str] = set()
-        for r in thesis_rows:
-            import json
-
-            try:
-                syms = json.loads(r["symbols"]) if r["symbols"] else []
-                thesis_symbols.update(syms)
-            except (json.JSONDecodeError, TypeError):
-                continue
-
-        all_symbols = position_symbols | thesis_symbols
-
-        if not all_symbols:
-            return []
-
-        placeholders = ",".join("?" for _ in all_symbols)
-        overlapping = self.db.fetchall(
-            f"SELECT * FROM congress_trades WHERE symbol IN ({placeholders})",
-            tuple(all_symbols),
-        )
+        now = time.monotonic()
+        cached = self._overlap_cache.get(user_id)
+        if cached is not None and now - cached[0] < OVERLAP_CACHE_TTL_SECONDS:
+            return [dict(t) for t in cached[1]]
 
+        overlapping = self.db.fetchall(_SQL_OVERLAPPING_TRADES, {"user_id": user_id})
+        self._overlap_cache[user_id] = (now, overlapping)
         return [dict(t) for t in overlapping]
 
     def _should_skip_trade_for_signal(self, trade: dict, enriched: dict) -> bool:
@@ -415,6 +725,9 @@ class CongressTradesEngine:
     def generate_signals(self, user_id: int) -> list[Signal]:
         """Create low-confidence signals for congress trades overlapping user's portfolio.
 
+        Signals are collected first and persisted with one
+        SignalEngine.create_signals_bulk call (single transaction).
+
         Args:
             user_id: ID of the owning user.
 
@@ -425,12 +738,12 @@ class CongressTradesEngine:
             return []
 
         overlapping = self.check_overlap(user_id)
-        signals: list[Signal] = []
-        thesis_map = self._build_thesis_map(user_id)
-
-        for trade in overlapping:
-            enriched = self.scorer.enrich_trade(trade)
+        pending: list[Signal] = []
+        thesis_map = self._load_thesis_map(user_id)
 
+        for trade, enriched in zip(
+            overlapping, self.scorer.enrich_many(overlapping), strict=True
+        ):
             if self._should_skip_trade_for_signal(trade, enriched):
                 continue
 
@@ -441,29 +754,32 @@ class CongressTradesEngine:
             confidence = self._get_confidence_for_politician_tier(tier)
             reasoning = self.scorer.build_reasoning(enriched)
 
-            signal = self._create_congress_signal(symbol, thesis_id, confidence, reasoning)
-            created = self.signal_engine.create_signal(signal)
-            signals.append(created)
+            pending.append(self._create_congress_signal(symbol, thesis_id, confidence, reasoning))
 
+        signals = self.signal_engine.create_signals_bulk(pending)
         logger.info("Generated %d signals from congress trades", len(signals))
         return signals
 
-    def _build_thesis_map(self, user_id: int) -> dict[str, int]:
-        """Build a mapping from symbol to thesis_id for a user's active theses.
+    def _load_thesis_map(self, user_id: int) -> dict[str, int]:
+        """Build a user's symbol -> thesis ID map from their open theses.
+
+        The parsed map is memoized per user against the raw (id, symbols)
+        rows it was built from, so the JSON is only decoded again when a
+        thesis is added, edited or closed, whichever code path wrote it.
 
         Args:
             user_id: ID of the owning user.
 
         Returns:
-            Dict mapping symbol strings to the thesis ID.
+            Dict mapping each symbol on an active/strengthening/confirmed
+            thesis to that thesis's ID.
         """
-        import json
+        thesis_rows = self.db.fetchall(_SQL_OPEN_THESES, (user_id,))
+        signature = tuple((row["id"], row["symbols"]) for row in thesis_rows)
+        cached = self._thesis_map_cache.get(user_id)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
 
-        thesis_rows = self.db.fetchall(
-            "SELECT id, symbols FROM theses "
-            "WHERE status IN ('active', 'strengthening', 'confirmed') AND user_id = ?",
-            (user_id,),
-        )
         mapping: dict[str, int] = {}
         for row in thesis_rows:
             try:
@@ -472,38 +788,41 @@ class CongressTradesEngine:
                     mapping[s] = row["id"]
             except (json.JSONDecodeError, TypeError):
                 continue
+        self._thesis_map_cache[user_id] = (signature, mapping)
         return mapping
 
     def get_summary(self, user_id: int) -> dict:
         """Get net buying/selling summary for a user's portfolio-adjacent tickers.
 
+        Net counts are aggregated in SQL (one GROUP BY over the watched-symbol
+        CTE) rather than by pulling every overlapping trade into Python; the
+        recent buy/sell lists are bounded, newest-first queries.
+
         Args:
             user_id: ID of the owning user.
 
         Returns:
-            Dict with total_trades, overlapping, net_by_symbol, recent_buys, recent_sells.
+            Dict with total_trades, overlapping, net_by_symbol, recent_buys
+            (up to SUMMARY_RECENT_LIMIT), recent_sells (likewise).
         """
-        total = self.db.fetchone("SELECT COUNT(*) as cnt FROM congress_trades")
+        total = self.db.fetchone(_SQL_COUNT_TRADES)
         total_count = total["cnt"] if total else 0
 
-        overlapping = self.check_overlap(user_id)
-
-        net_by_symbol: dict[str, int] = {}
-        recent_buys: list[dict] = []
-        recent_sells: list[dict] = []
-
-        for trade in overlapping:
-            symbol = trade["symbol"]
-            if trade["action"] == "buy":
-                net_by_symbol[symbol] = net_by_symbol.get(symbol, 0) + 1
-                recent_buys.append(dict(trade))
-            elif trade["action"] == "sell":
-                net_by_symbol[symbol] = net_by_symbol.get(symbol, 0) - 1
-                recent_sells.append(dict(trade))
+        rows = self.db.fetchall(_SQL_WATCHED_NET, {"user_id": user_id})
+        overlapping = sum(row["c"] for row in rows)
+        net_by_symbol = {row["symbol"]: row["net"] for row in rows if row["directional"]}
+        recent_buys = self.db.fetchall(
+            _SQL_WATCHED_RECENT,
+            {"user_id": user_id, "action": "buy", "limit": SUMMARY_RECENT_LIMIT},
+        )
+        recent_sells = self.db.fetchall(
+            _SQL_WATCHED_RECENT,
+            {"user_id": user_id, "action": "sell", "limit": SUMMARY_RECENT_LIMIT},
+        )
 
         return {
             "total_trades": total_count,
-            "overlapping": len(overlapping),
+            "overlapping": overlapping,
             "net_by_symbol": net_by_symbol,
             "recent_buys": recent_buys,
             "recent_sells": recent_sells,
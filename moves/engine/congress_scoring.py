@@ -14,11 +14,16 @@ from __future__ import annotations
 import json
 import logging
 import re
+import time
+from collections import Counter
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from datetime import date, datetime
+from functools import lru_cache
+from typing import TYPE_CHECKING, NamedTuple
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
     from db.database import Database
 
 logger = logging.getLogger(__name__)
@@ -37,6 +42,13 @@ COMMITTEE_SECTORS: dict[str, list[str]] = {
     "Intelligence": ["defense", "cybersecurity", "technology"],
 }
 
+# Committees with a specific (non-"broad") sector mapping
+_RELEVANT_COMMITTEES: frozenset[str] = frozenset(
+    committee
+    for committee, sectors in COMMITTEE_SECTORS.items()
+    if sectors and sectors != ["broad"]
+)
+
 # Common ETF tickers to detect low-quality trades
 ETF_TICKERS: set[str] = {
     "SPY", "QQQ", "IWM", "DIA", "VOO", "VTI", "VEA", "VWO", "BND", "AGG",
@@ -44,6 +56,16 @@ ETF_TICKERS: set[str] = {
     "XLI", "XLP", "XLY", "XLU", "XLB", "XLRE", "XLC", "ARKK", "ARKW",
 }
 
+# Names per IN (...) query, well under SQLite's bound-parameter limit
+IN_QUERY_CHUNK = 500
+
+# How long a loaded politician profile is reused; another scorer instance
+# (API route, scheduler) may rescore without dropping this one's cache
+PROFILE_CACHE_TTL_SECONDS = 60.0
+
+# Tier label -> emoji used in signal reasoning
+TIER_EMOJI: dict[str, str] = {"whale": "🐋", "notable": "⭐", "average": "📊", "noise": "🔇"}
+
 # Score component weights
 WEIGHT_WIN_RATE = 0.40
 WEIGHT_TRADE_QUALITY = 0.25
@@ -56,6 +78,54 @@ TIER_NOTABLE = 60
 TIER_AVERAGE = 40
 
 
+# Dollar figures ("1,001", "15,000") in a disclosure amount range
+_AMOUNT_RE = re.compile(r"[\d,]+")
+
+_ETF_SQL_LIST = ", ".join(f"'{t}'" for t in sorted(ETF_TICKERS))
+# Per-politician aggregates over the stored trade_size_bucket/disclosure_lag_days
+# columns (see _backfill_trade_columns); {where} is "" or a politician filter.
+_SQL_TRADE_STATS = f"""SELECT politician,
+    COUNT(*) AS total,
+    SUM(action = 'buy') AS buys,
+    SUM(UPPER(symbol) NOT IN ({_ETF_SQL_LIST})) AS individual,
+    SUM(trade_size_bucket = 'small') AS small_n,
+    SUM(trade_size_bucket = 'medium') AS medium_n,
+    SUM(trade_size_bucket = 'large') AS large_n,
+    SUM(disclosure_lag_days) AS lag_total,
+    COUNT(disclosure_lag_days) AS lag_count,
+    GROUP_CONCAT(DISTINCT CASE WHEN UPPER(symbol) NOT IN ({_ETF_SQL_LIST}) THEN symbol END)
+        AS symbols
+    FROM congress_trades {{where}} GROUP BY politician"""
+_SQL_ALL_TRADE_STATS = _SQL_TRADE_STATS.format(where="")
+_SQL_POLITICIAN_TRADE_STATS = _SQL_TRADE_STATS.format(where="WHERE politician = ?")
+# Rows written without scoring columns (e.g. before they existed); the values
+# are parsed in Python and written back by id (see _backfill_trade_columns).
+_SQL_BACKFILL_CANDIDATES = (
+    "SELECT id, amount_range, date_traded, date_filed, trade_size_bucket, disclosure_lag_days "
+    "FROM congress_trades WHERE (trade_size_bucket IS NULL OR disclosure_lag_days IS NULL)"
+)
+_SQL_BACKFILL_ROW = (
+    "UPDATE congress_trades SET trade_size_bucket = ?, disclosure_lag_days = ? WHERE id = ?"
+)
+_PROFILE_COLUMNS = "score, tier, committees, win_rate, avg_return_90d"
+_SQL_GET_PROFILE = f"SELECT {_PROFILE_COLUMNS} FROM politician_scores WHERE politician = ?"
+_SQL_UPSERT_SCORE = """INSERT INTO politician_scores
+   (politician, total_trades, win_rate, score, tier,
+    trade_size_preference, filing_delay_avg_days, committees,
+    best_sectors, last_updated)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'))
+   ON CONFLICT(politician) DO UPDATE SET
+     total_trades = excluded.total_trades,
+     win_rate = excluded.win_rate,
+     score = excluded.score,
+     tier = excluded.tier,
+     trade_size_preference = excluded.trade_size_preference,
+     filing_delay_avg_days = excluded.filing_delay_avg_days,
+     committees = excluded.committees,
+     best_sectors = excluded.best_sectors,
+     last_updated = datetime('now')"""
+
+
 @dataclass
 class PoliticianScore:
     """Computed score and metadata for a politician.
@@ -89,9 +159,70 @@ class PoliticianScore:
     best_sectors: list[str] = field(default_factory=list)
 
 
+class PoliticianProfile(NamedTuple):
+    """Stored politician_scores fields used to enrich trades.
+
+    Attributes:
+        score: Composite score 0-100.
+        tier: Tier label.
+        committees: Decoded committee memberships.
+        win_rate: Stored win rate, if any.
+        avg_return_90d: Stored average 90-day return, if any.
+    """
+
+    score: float
+    tier: str
+    committees: list[str]
+    win_rate: float | None
+    avg_return_90d: float | None
+
+
+@dataclass(slots=True)
+class _TradeStats:
+    """Per-politician trade aggregates, as returned by _SQL_TRADE_STATS.
+
+    Attributes:
+        total: Number of trades.
+        buys: Trades with action 'buy'.
+        individual: Trades in individual stocks (not ETFs).
+        bucket_counts: Trade count per size bucket.
+        lag_total: Sum of disclosure lags over trades with parseable dates.
+        lag_count: Number of trades with a parseable disclosure lag.
+        symbols: Distinct non-ETF symbols traded.
+    """
+
+    total: int = 0
+    buys: int = 0
+    individual: int = 0
+    bucket_counts: Counter[str] = field(default_factory=Counter)
+    lag_total: int = 0
+    lag_count: int = 0
+    symbols: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_row(cls, row: dict) -> _TradeStats:
+        """Build stats from one _SQL_TRADE_STATS result row."""
+        buckets = {"small": row["small_n"], "medium": row["medium_n"], "large": row["large_n"]}
+        return cls(
+            total=row["total"],
+            buys=row["buys"],
+            individual=row["individual"],
+            bucket_counts=Counter({b: n for b, n in buckets.items() if n}),
+            lag_total=row["lag_total"] or 0,
+            lag_count=row["lag_count"],
+            symbols=row["symbols"].split(",") if row["symbols"] else [],
+        )
+
+
+@lru_cache(maxsize=256)
 def parse_amount_bucket(amount_range: str) -> str:
     """Parse a congressional disclosure amount range into a size bucket.
 
+    Disclosures use a handful of fixed range labels, so results are cached
+    and repeat calls during a scoring pass skip parsing entirely. Canonical
+    "$X - $Y" labels are read with plain string ops; the regex scan is only a
+    fallback for irregular input.
+
     Args:
         amount_range: Raw amount string like "$1,001 - $15,000" or "$100,001 - $250,000".
 
@@ -101,17 +232,21 @@ def parse_amount_bucket(amount_range: str) -> str:
     if not amount_range:
         return "small"
 
-    # Extract all dollar amounts from the string
-    amounts = re.findall(r"\$?([\d,]+)", amount_range)
-    if not amounts:
-        return "small"
-
-    # Use the upper bound if available, otherwise the first number
-    raw = amounts[-1].replace(",", "")
-    try:
-        upper = int(raw)
-    except ValueError:
-        return "small"
+    # Canonical labels end in "$<digits>": read the upper bound straight off the
+    # tail and only scan with the regex for anything else.
+    tail = amount_range[amount_range.rfind("$") + 1 :].rstrip().replace(",", "")
+    if "$" in amount_range and tail.isdigit():
+        upper = int(tail)
+    else:
+        amounts = _AMOUNT_RE.findall(amount_range)
+        if not amounts:
+            return "small"
+        # Use the upper bound if available, otherwise the first number
+        raw = amounts[-1].replace(",", "")
+        try:
+            upper = int(raw)
+        except ValueError:
+            return "small"
 
     if upper <= 15_000:
         return "small"
@@ -120,36 +255,54 @@ def parse_amount_bucket(amount_range: str) -> str:
     return "large"
 
 
-def calculate_disclosure_lag(date_traded: str, date_filed: str) -> int | None:
-    """Calculate the number of days between trade execution and disclosure filing.
+def _date_ordinal(value: str) -> int | None:
+    """Convert a trade/filing date string to a proleptic day ordinal.
+
+    ISO dates (the storage format) are sliced directly; other formats fall
+    back to strptime.
 
     Args:
-        date_traded: Trade date string (YYYY-MM-DD or MM/DD/YYYY).
-        date_filed: Filing date string (YYYY-MM-DD or MM/DD/YYYY).
+        value: Date string (YYYY-MM-DD, MM/DD/YYYY, or MM/DD/YY).
 
     Returns:
-        Number of days between trade and filing, or None if unparseable.
+        date.toordinal() of the parsed date, or None if unparseable.
     """
-    for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%m/%d/%y"):
+    if len(value) == 10 and value[4] == "-" and value[7] == "-":
         try:
-            traded = datetime.strptime(date_traded, fmt).replace(tzinfo=UTC)
-            break
+            return date(int(value[:4]), int(value[5:7]), int(value[8:])).toordinal()
         except ValueError:
-            continue
-    else:
-        return None
-
+            pass
     for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%m/%d/%y"):
         try:
-            filed = datetime.strptime(date_filed, fmt).replace(tzinfo=UTC)
-            break
+            return datetime.strptime(value, fmt).toordinal()
         except ValueError:
             continue
-    else:
-        return None
+    return None
 
-    lag = (filed - traded).days
-    return max(0, lag)
+
+@lru_cache(maxsize=4096)
+def calculate_disclosure_lag(date_traded: str, date_filed: str) -> int | None:
+    """Calculate the number of days between trade execution and disclosure filing.
+
+    Cached, since a politician's trades repeat the same date pairs across
+    every scoring pass.
+
+    Args:
+        date_traded: Trade date string (YYYY-MM-DD or MM/DD/YYYY).
+        date_filed: Filing date string (YYYY-MM-DD or MM/DD/YYYY).
+
+    Returns:
+        Number of days between trade and filing, or None if unparseable.
+    """
+    if not isinstance(date_traded, str) or not isinstance(date_filed, str):
+        return None
+    traded = _date_ordinal(date_traded)
+    if traded is None:
+        return None
+    filed = _date_ordinal(date_filed)
+    if filed is None:
+        return None
+    return max(0, filed - traded)
 
 
 def assign_tier(score: float) -> str:
@@ -173,13 +326,18 @@ def assign_tier(score: float) -> str:
 def is_etf(symbol: str) -> bool:
     """Check if a symbol is a known ETF.
 
+    Stored symbols are already uppercase, so only mixed/lowercase input
+    pays for building an uppercased copy.
+
     Args:
         symbol: Ticker symbol to check.
 
     Returns:
         True if the symbol is a known ETF.
     """
-    return symbol.upper() in ETF_TICKERS
+    if symbol in ETF_TICKERS:
+        return True
+    return not symbol.isupper() and symbol.upper() in ETF_TICKERS
 
 
 def check_committee_relevance(committees: list[str], symbol: str) -> bool:
@@ -195,14 +353,46 @@ def check_committee_relevance(committees: list[str], symbol: str) -> bool:
     Returns:
         True if there's potential committee relevance.
     """
-    if is_etf(symbol):
-        return False
+    return not is_etf(symbol) and not _RELEVANT_COMMITTEES.isdisjoint(committees)
+
 
-    for committee in committees:
-        sectors = COMMITTEE_SECTORS.get(committee, [])
-        if sectors and sectors != ["broad"]:
-            return True
-    return False
+def _decode_committees(row: dict | None) -> list[str]:
+    """Decode the JSON committees column of a politician_scores row.
+
+    Args:
+        row: politician_scores row (or None if the politician is unscored).
+
+    Returns:
+        Committee names, or an empty list if missing or malformed.
+    """
+    if row and row.get("committees"):
+        try:
+            return json.loads(row["committees"])
+        except (json.JSONDecodeError, TypeError):
+            pass
+    return []
+
+
+def _profile_from_row(row: dict) -> PoliticianProfile:
+    """Build a PoliticianProfile from a _SQL_GET_PROFILE-shaped row."""
+    return PoliticianProfile(
+        row["score"], row["tier"], _decode_committees(row), row["win_rate"], row["avg_return_90d"]
+    )
+
+
+def _score_params(ps: PoliticianScore) -> tuple:
+    """Bind parameters for _SQL_UPSERT_SCORE."""
+    return (
+        ps.politician,
+        ps.total_trades,
+        ps.win_rate,
+        ps.score,
+        ps.tier,
+        ps.trade_size_preference,
+        ps.filing_delay_avg_days,
+        json.dumps(ps.committees),
+        json.dumps(ps.best_sectors),
+    )
 
 
 class PoliticianScorer:
@@ -220,24 +410,62 @@ class PoliticianScorer:
 
     def __init__(self, db: Database) -> None:
         self.db = db
+        # politician -> (stored profile or None if unscored, loaded_at); dropped
+        # on this scorer's score writes and expired after PROFILE_CACHE_TTL_SECONDS
+        self._profile_cache: dict[str, tuple[PoliticianProfile | None, float]] = {}
         self._ensure_columns()
 
     def _ensure_columns(self) -> None:
-        """Add scoring columns to congress_trades if they don't exist."""
+        """Add scoring columns to congress_trades if they don't exist.
+
+        Reads the table's columns once and only issues ALTERs for missing
+        ones, so constructing a scorer against an up-to-date schema writes
+        nothing.
+        """
         migrations = [
             ("politician_score", "REAL"),
             ("disclosure_lag_days", "INTEGER"),
             ("trade_size_bucket", "TEXT"),
             ("committee_relevant", "INTEGER DEFAULT 0"),
         ]
-        for col, col_type in migrations:
-            try:
-                self.db.execute(
-                    f"ALTER TABLE congress_trades ADD COLUMN {col} {col_type}"
-                )
-                self.db.connect().commit()
-            except Exception:
-                pass  # Column already exists
+        existing = {r["name"] for r in self.db.fetchall("PRAGMA table_info(congress_trades)")}
+        missing = [(col, col_type) for col, col_type in migrations if col not in existing]
+        if not missing:
+            return
+        with self.db.transaction() as conn:
+            for col, col_type in missing:
+                conn.execute(f"ALTER TABLE congress_trades ADD COLUMN {col} {col_type}")
+
+    def _backfill_trade_columns(self, politicians: Sequence[str] | None = None) -> None:
+        """Populate missing trade_size_bucket/disclosure_lag_days values.
+
+        store_trades fills both on insert; this covers older or externally
+        inserted rows so the SQL aggregates see every trade. The values are
+        parsed in Python (no SQL functions to register per connection) and a
+        write transaction is only opened when some row actually changes, so
+        the common case is a single read. Unparseable dates stay NULL.
+
+        Args:
+            politicians: Restrict the backfill to these politicians' trades
+                (at most IN_QUERY_CHUNK names).
+        """
+        where = ""
+        params: tuple[str, ...] = ()
+        if politicians is not None:
+            where = f" AND politician IN ({', '.join('?' * len(politicians))})"
+            params = tuple(politicians)
+        updates = []
+        for row in self.db.fetchall(_SQL_BACKFILL_CANDIDATES + where, params):
+            bucket = row["trade_size_bucket"] or parse_amount_bucket(row["amount_range"] or "")
+            lag = row["disclosure_lag_days"]
+            if lag is None:
+                lag = calculate_disclosure_lag(row["date_traded"], row["date_filed"])
+            if (bucket, lag) != (row["trade_size_bucket"], row["disclosure_lag_days"]):
+                updates.append((bucket, lag, row["id"]))
+        if not updates:
+            return
+        with self.db.transaction() as conn:
+            conn.executemany(_SQL_BACKFILL_ROW, updates)
 
     def score_politician(self, name: str) -> PoliticianScore:
         """Calculate the composite score for a single politician.
@@ -248,38 +476,45 @@ class PoliticianScorer:
         Returns:
             PoliticianScore with all computed metrics.
         """
-        trades = self.db.fetchall(
-            "SELECT * FROM congress_trades WHERE politician = ? ORDER BY date_traded DESC",
-            (name,),
-        )
+        self._backfill_trade_columns([name])
+        row = self.db.fetchone(_SQL_POLITICIAN_TRADE_STATS, (name,))
 
-        if not trades:
+        if not row:
             return PoliticianScore(politician=name)
 
         # Load existing score record for committee/party info
         existing = self.db.fetchone(
             "SELECT * FROM politician_scores WHERE politician = ?", (name,)
         )
-        committees: list[str] = []
-        if existing and existing.get("committees"):
-            try:
-                committees = json.loads(existing["committees"])
-            except (json.JSONDecodeError, TypeError):
-                pass
+        result = self._compute_score(name, _TradeStats.from_row(row), _decode_committees(existing))
+        self._save_score(result)
+        return result
 
-        total = len(trades)
+    def _compute_score(
+        self, name: str, stats: _TradeStats, committees: list[str]
+    ) -> PoliticianScore:
+        """Compute a politician's composite score from their trade aggregates.
+
+        Args:
+            name: Politician name.
+            stats: Aggregates over the politician's trades.
+            committees: Known committee memberships.
+
+        Returns:
+            PoliticianScore with all computed metrics (not persisted).
+        """
 
         # Win rate component (simplified: buy count vs sell count ratio as proxy)
-        win_rate = self._estimate_win_rate(trades)
+        win_rate = self._estimate_win_rate(stats)
 
         # Trade quality component
-        quality_score = self._score_trade_quality(trades)
+        quality_score = self._score_trade_quality(stats)
 
         # Committee relevance component
-        relevance_score = self._score_committee_relevance(trades, committees)
+        relevance_score = self._score_committee_relevance(stats, committees)
 
         # Timing pattern component
-        timing_score = self._score_timing_pattern(trades)
+        timing_score = self._score_timing_pattern(stats)
 
         # Composite score
         raw_score = (
@@ -291,28 +526,20 @@ class PoliticianScorer:
         score = min(100.0, max(0.0, raw_score))
 
         # Determine trade size preference
-        buckets = [parse_amount_bucket(t.get("amount_range", "")) for t in trades]
-        size_pref = max(set(buckets), key=buckets.count) if buckets else "unknown"
+        counts = stats.bucket_counts
+        size_pref = max(counts, key=counts.__getitem__) if counts else "unknown"
 
         # Average filing delay
-        lags = []
-        for t in trades:
-            lag = calculate_disclosure_lag(
-                t.get("date_traded", ""), t.get("date_filed", "")
-            )
-            if lag is not None:
-                lags.append(lag)
-        avg_lag = sum(lags) / len(lags) if lags else 0.0
+        avg_lag = stats.lag_total / stats.lag_count if stats.lag_count else 0.0
 
         # Best sectors (from unique symbols, excluding ETFs)
-        symbols = {t["symbol"] for t in trades if not is_etf(t.get("symbol", ""))}
-        best_sectors = list(symbols)[:5]
+        best_sectors = stats.symbols[:5]
 
-        result = PoliticianScore(
+        return PoliticianScore(
             politician=name,
             score=score,
             tier=assign_tier(score),
-            total_trades=total,
+            total_trades=stats.total,
             win_rate=win_rate,
             trade_size_preference=size_pref,
             filing_delay_avg_days=avg_lag,
@@ -320,55 +547,45 @@ class PoliticianScorer:
             best_sectors=best_sectors,
         )
 
-        self._save_score(result)
-        return result
-
-    def _estimate_win_rate(self, trades: list[dict]) -> float:
+    def _estimate_win_rate(self, stats: _TradeStats) -> float:
         """Estimate win rate from trade history.
 
         Without price data, we use heuristics: buy count, trade frequency,
         and size as proxies for profitable trading behavior.
 
         Args:
-            trades: List of trade dicts.
+            stats: Aggregated trade features.
 
         Returns:
             Estimated win rate as a score 0-100.
         """
-        if not trades:
+        if not stats.total:
             return 0.0
 
-        buy_count = sum(1 for t in trades if t.get("action") == "buy")
-        total = len(trades)
-        buy_ratio = buy_count / total if total > 0 else 0.5
+        buy_ratio = stats.buys / stats.total
 
         # More buys than sells suggests conviction (bullish bias in bull market)
         # Scale: 50% buys = 50 score, 80% buys = 70 score
         base = 40.0 + (buy_ratio * 40.0)
 
         # Larger trades suggest more conviction/information advantage
-        large_count = sum(
-            1 for t in trades if parse_amount_bucket(t.get("amount_range", "")) == "large"
-        )
-        large_bonus = min(20.0, (large_count / max(total, 1)) * 40.0)
+        large_bonus = min(20.0, (stats.bucket_counts["large"] / stats.total) * 40.0)
 
         return min(100.0, base + large_bonus)
 
-    def _score_trade_quality(self, trades: list[dict]) -> float:
+    def _score_trade_quality(self, stats: _TradeStats) -> float:
         """Score trade quality based on individual stocks vs ETFs and trade sizes.
 
         Args:
-            trades: List of trade dicts.
+            stats: Aggregated trade features.
 
         Returns:
             Quality score 0-100.
         """
-        if not trades:
+        if not stats.total:
             return 0.0
 
-        total = len(trades)
-        individual_count = sum(1 for t in trades if not is_etf(t.get("symbol", "")))
-        individual_ratio = individual_count / total
+        individual_ratio = stats.individual / stats.total
 
         # Individual stock picks = higher quality (more alpha potential)
         stock_score = individual_ratio * 60.0
@@ -376,59 +593,47 @@ class PoliticianScorer:
         # Larger trades = more conviction
         size_scores = {"small": 10, "medium": 25, "large": 40}
         avg_size_score = sum(
-            size_scores.get(parse_amount_bucket(t.get("amount_range", "")), 10)
-            for t in trades
-        ) / total
+            size_scores.get(bucket, 10) * n for bucket, n in stats.bucket_counts.items()
+        ) / stats.total
 
         return min(100.0, stock_score + avg_size_score)
 
-    def _score_committee_relevance(
-        self, trades: list[dict], committees: list[str]
-    ) -> float:
+    def _score_committee_relevance(self, stats: _TradeStats, committees: list[str]) -> float:
         """Score how often a politician trades in sectors relevant to their committees.
 
         Args:
-            trades: List of trade dicts.
+            stats: Aggregated trade features.
             committees: List of committee names.
 
         Returns:
             Relevance score 0-100.
         """
-        if not trades or not committees:
+        if not stats.total or not committees:
             return 50.0  # Neutral if no committee data
 
-        relevant_count = sum(
-            1 for t in trades
-            if check_committee_relevance(committees, t.get("symbol", ""))
-        )
-        relevance_ratio = relevant_count / len(trades)
+        # Committees are fixed per politician, so every individual-stock trade
+        # is relevant iff one of them maps to a sector (see check_committee_relevance).
+        relevant = 0 if _RELEVANT_COMMITTEES.isdisjoint(committees) else stats.individual
+        relevance_ratio = relevant / stats.total
 
         # High relevance = more suspicious/valuable signal
         return min(100.0, relevance_ratio * 100.0 + 20.0)
 
-    def _score_timing_pattern(self, trades: list[dict]) -> float:
+    def _score_timing_pattern(self, stats: _TradeStats) -> float:
         """Score based on filing delay patterns.
 
         Late filers who trade large amounts are more suspicious/valuable.
 
         Args:
-            trades: List of trade dicts.
+            stats: Aggregated trade features.
 
         Returns:
             Timing score 0-100.
         """
-        lags: list[int] = []
-        for t in trades:
-            lag = calculate_disclosure_lag(
-                t.get("date_traded", ""), t.get("date_filed", "")
-            )
-            if lag is not None:
-                lags.append(lag)
-
-        if not lags:
+        if not stats.lag_count:
             return 50.0
 
-        avg_lag = sum(lags) / len(lags)
+        avg_lag = stats.lag_total / stats.lag_count
 
         # Late filers (>30 days) with large trades = suspicious
         # Score increases with delay up to a point
@@ -449,46 +654,87 @@ class PoliticianScorer:
         Args:
             ps: PoliticianScore to save.
         """
-        self.db.execute(
-            """INSERT INTO politician_scores
-               (politician, total_trades, win_rate, score, tier,
-                trade_size_preference, filing_delay_avg_days, committees,
-                best_sectors, last_updated)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'))
-               ON CONFLICT(politician) DO UPDATE SET
-                 total_trades = excluded.total_trades,
-                 win_rate = excluded.win_rate,
-                 score = excluded.score,
-                 tier = excluded.tier,
-                 trade_size_preference = excluded.trade_size_preference,
-                 filing_delay_avg_days = excluded.filing_delay_avg_days,
-                 committees = excluded.committees,
-                 best_sectors = excluded.best_sectors,
-                 last_updated = datetime('now')""",
-            (
-                ps.politician,
-                ps.total_trades,
-                ps.win_rate,
-                ps.score,
-                ps.tier,
-                ps.trade_size_preference,
-                ps.filing_delay_avg_days,
-                json.dumps(ps.committees),
-                json.dumps(ps.best_sectors),
-            ),
-        )
-        self.db.connect().commit()
+        self._save_scores([ps])
+
+    def _save_scores(self, scores: list[PoliticianScore]) -> None:
+        """Persist politician scores with one executemany and a single commit.
+
+        Args:
+            scores: PoliticianScores to save.
+        """
+        if not scores:
+            return
+        with self.db.transaction() as conn:
+            conn.executemany(_SQL_UPSERT_SCORE, [_score_params(ps) for ps in scores])
+        for ps in scores:
+            self._profile_cache.pop(ps.politician, None)
+
+    def score_politicians(self, names: Iterable[str]) -> list[PoliticianScore]:
+        """Score several politicians, writing all results in one transaction.
+
+        Politicians without trades are skipped (score_politician would return
+        an unsaved empty score for them).
+
+        Args:
+            names: Politician names as stored in congress_trades.
+
+        Returns:
+            PoliticianScore objects for politicians that have trades.
+        """
+        unique = list(dict.fromkeys(name for name in names if name))
+        scores: list[PoliticianScore] = []
+        for start in range(0, len(unique), IN_QUERY_CHUNK):
+            chunk = unique[start : start + IN_QUERY_CHUNK]
+            placeholders = ", ".join("?" * len(chunk))
+            self._backfill_trade_columns(chunk)
+            committees_by_politician = {
+                row["politician"]: _decode_committees(row)
+                for row in self.db.fetchall(
+                    "SELECT politician, committees FROM politician_scores "
+                    f"WHERE politician IN ({placeholders})",
+                    tuple(chunk),
+                )
+            }
+            rows = self.db.fetchall(
+                _SQL_TRADE_STATS.format(where=f"WHERE politician IN ({placeholders})"),
+                tuple(chunk),
+            )
+            scores.extend(
+                self._compute_score(
+                    row["politician"],
+                    _TradeStats.from_row(row),
+                    committees_by_politician.get(row["politician"], []),
+                )
+                for row in rows
+            )
+        self._save_scores(scores)
+        return scores
 
     def score_all(self) -> list[PoliticianScore]:
         """Score all politicians with trades in the database.
 
+        Trade aggregates come from one GROUP BY query (SQLite does the
+        counting, so raw trades never reach Python), committees from one more,
+        and all scores are written with a single executemany in one
+        transaction, so the pass costs one commit instead of one per politician.
+
         Returns:
             List of PoliticianScore objects, sorted by score descending.
         """
-        rows = self.db.fetchall(
-            "SELECT DISTINCT politician FROM congress_trades"
-        )
-        scores = [self.score_politician(row["politician"]) for row in rows]
+        self._backfill_trade_columns()
+        committees_by_politician = {
+            row["politician"]: _decode_committees(row)
+            for row in self.db.fetchall("SELECT politician, committees FROM politician_scores")
+        }
+        scores = [
+            self._compute_score(
+                row["politician"],
+                _TradeStats.from_row(row),
+                committees_by_politician.get(row["politician"], []),
+            )
+            for row in self.db.fetchall(_SQL_ALL_TRADE_STATS)
+        ]
+        self._save_scores(scores)
         scores.sort(key=lambda s: s.score, reverse=True)
         return scores
 
@@ -518,12 +764,9 @@ class PoliticianScorer:
             score += 0.05
 
         # Politician tier bonus (0-0.4)
-        existing = self.db.fetchone(
-            "SELECT score, tier FROM politician_scores WHERE politician = ?",
-            (trade.get("politician", ""),),
-        )
-        if existing:
-            score += (existing["score"] / 100.0) * 0.4
+        profile = self._get_profile(trade.get("politician", ""))
+        if profile:
+            score += (profile.score / 100.0) * 0.4
         else:
             score += 0.15  # Unknown politician gets neutral
 
@@ -538,19 +781,20 @@ class PoliticianScorer:
         Returns:
             List of politician score dicts.
         """
-        rows = self.db.fetchall(
+        # Rows are already fresh dicts (dict_row_factory); no per-row copy needed.
+        return self.db.fetchall(
             """SELECT * FROM politician_scores
                ORDER BY score DESC
                LIMIT ?""",
             (n,),
         )
-        return [dict(r) for r in rows]
 
     def enrich_trade(self, trade: dict) -> dict:
         """Enrich a trade dict with scoring metadata.
 
         Adds politician_score, disclosure_lag_days, trade_size_bucket,
-        and committee_relevant fields.
+        and committee_relevant fields, plus the politician's stored win_rate
+        and avg_return_90d when they have been scored.
 
         Args:
             trade: Raw trade dict.
@@ -572,22 +816,15 @@ class PoliticianScorer:
         enriched["disclosure_lag_days"] = lag
 
         # Politician score and tier
-        existing = self.db.fetchone(
-            "SELECT score, tier, committees FROM politician_scores WHERE politician = ?",
-            (trade.get("politician", ""),),
-        )
-        if existing:
-            enriched["politician_score"] = existing["score"]
-            enriched["politician_tier"] = existing["tier"]
-            committees = []
-            if existing.get("committees"):
-                try:
-                    committees = json.loads(existing["committees"])
-                except (json.JSONDecodeError, TypeError):
-                    pass
+        profile = self._get_profile(trade.get("politician", ""))
+        if profile:
+            enriched["politician_score"] = profile.score
+            enriched["politician_tier"] = profile.tier
             enriched["committee_relevant"] = (
-                1 if check_committee_relevance(committees, trade.get("symbol", "")) else 0
+                1 if check_committee_relevance(profile.committees, trade.get("symbol", "")) else 0
             )
+            enriched["win_rate"] = profile.win_rate
+            enriched["avg_return_90d"] = profile.avg_return_90d
         else:
             enriched["politician_score"] = None
             enriched["politician_tier"] = "unknown"
@@ -595,6 +832,64 @@ class PoliticianScorer:
 
         return enriched
 
+    def enrich_many(self, trades: list[dict]) -> list[dict]:
+        """Enrich a batch of trades, loading uncached profiles up front.
+
+        Politicians without a fresh profile-cache entry are fetched with
+        chunked IN (...) queries instead of one lookup per trade.
+
+        Args:
+            trades: Raw trade dicts.
+
+        Returns:
+            Enriched trade dicts, in input order.
+        """
+        now = time.monotonic()
+        missing = [
+            name
+            for name in {t.get("politician", "") for t in trades}
+            if not self._profile_fresh(name, now)
+        ]
+        for start in range(0, len(missing), IN_QUERY_CHUNK):
+            chunk = missing[start : start + IN_QUERY_CHUNK]
+            placeholders = ", ".join("?" * len(chunk))
+            rows = self.db.fetchall(
+                f"SELECT politician, {_PROFILE_COLUMNS} FROM politician_scores "
+                f"WHERE politician IN ({placeholders})",
+                tuple(chunk),
+            )
+            found = {r["politician"]: _profile_from_row(r) for r in rows}
+            for name in chunk:
+                self._profile_cache[name] = (found.get(name), now)
+        return [self.enrich_trade(t) for t in trades]
+
+    def _profile_fresh(self, politician: str, now: float) -> bool:
+        """Whether the politician's cached profile is younger than the TTL."""
+        cached = self._profile_cache.get(politician)
+        return cached is not None and now - cached[1] < PROFILE_CACHE_TTL_SECONDS
+
+    def _get_profile(self, politician: str) -> PoliticianProfile | None:
+        """Return a politician's stored score, tier, and decoded committees.
+
+        Looked up once per politician and cached until this scorer rewrites
+        their score or PROFILE_CACHE_TTL_SECONDS pass, so committees JSON is
+        decoded once rather than per trade and rescoring elsewhere is picked
+        up within the TTL.
+
+        Args:
+            politician: Politician name.
+
+        Returns:
+            (score, tier, committees) or None if the politician is unscored.
+        """
+        now = time.monotonic()
+        if self._profile_fresh(politician, now):
+            return self._profile_cache[politician][0]
+        existing = self.db.fetchone(_SQL_GET_PROFILE, (politician,))
+        profile = _profile_from_row(existing) if existing else None
+        self._profile_cache[politician] = (profile, now)
+        return profile
+
     def build_reasoning(self, trade: dict) -> str:
         """Build a rich reasoning string for a congress trade signal.
 
@@ -612,24 +907,14 @@ class PoliticianScorer:
         lag = trade.get("disclosure_lag_days")
         relevant = trade.get("committee_relevant", 0)
 
-        # Tier emoji
-        tier_emoji = {"whale": "🐋", "notable": "⭐", "average": "📊", "noise": "🔇"}
-        emoji = tier_emoji.get(tier, "❓")
-
-        # Get win rate from DB
-        ps = self.db.fetchone(
-            "SELECT win_rate, avg_return_90d FROM politician_scores WHERE politician = ?",
-            (politician,),
-        )
+        emoji = TIER_EMOJI.get(tier, "❓")
 
-        parts = [
-            f"{emoji} {politician} ({tier}",
-        ]
-        if score is not None:
-            parts[0] += f", score {score:.0f}"
-        parts[0] += f") bought {symbol}"
+        win_rate = trade.get("win_rate")
+        avg_return_90d = trade.get("avg_return_90d")
+        score_note = f", score {score:.0f}" if score is not None else ""
+        parts = [f"{emoji} {politician} ({tier}{score_note}) bought {symbol}"]
 
-        if amount:
+        if amount and amount != "unknown":
             parts.append(f"— {amount}")
 
         if lag is not None:
@@ -638,10 +923,9 @@ class PoliticianScorer:
         if relevant:
             parts.append("Committee: sector-relevant")
 
-        if ps:
-            if ps.get("win_rate"):
-                parts.append(f"{ps['win_rate']:.0f}% win rate")
-            if ps.get("avg_return_90d"):
-                parts.append(f"+{ps['avg_return_90d']:.1f}% avg 90d return")
+        if win_rate:
+            parts.append(f"{win_rate:.0f}% win rate")
+        if avg_return_90d:
+            parts.append(f"+{avg_return_90d:.1f}% avg 90d return")
 
         return ". ".join(parts) + "."
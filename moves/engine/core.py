@@ -5,7 +5,9 @@ All pipeline methods now accept user_id for multi-user scoping.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from typing import Any
 
 from broker.base import Broker
@@ -19,6 +21,7 @@ from engine import (
 )
 from engine.approval import ApprovalWorkflow
 from engine.discovery import DiscoveryEngine
+from engine.pricing import get_price
 from engine.principles import PrinciplesEngine
 from engine.risk import RiskManager
 from engine.signals import SignalEngine
@@ -27,6 +30,25 @@ from engine.whatif import WhatIfEngine
 
 logger = logging.getLogger(__name__)
 
+# How long get_system_status reuses a user's exposure reading
+# (override with settings["status_cache_ttl"])
+STATUS_CACHE_TTL_SECONDS = 2.0
+
+# Startup/status counters in one round-trip; the LEFT JOIN keeps a row even
+# before the first portfolio snapshot. Doubles as the DB connectivity check.
+_SQL_STATUS = """SELECT
+    (SELECT COUNT(*) FROM signals WHERE status = :pending AND user_id = :user_id)
+        AS pending_signals,
+    (SELECT COUNT(*) FROM risk_limits WHERE user_id = :user_id) AS risk_limits_count,
+    pv.total_value, pv.cash
+    FROM (SELECT 1) LEFT JOIN (
+        SELECT total_value, cash FROM portfolio_value
+        WHERE user_id = :user_id ORDER BY date DESC LIMIT 1
+    ) AS pv"""
+_SQL_INSERT_AUDIT = (
+    "INSERT INTO audit_log (actor, action, details, entity_type, entity_id) VALUES (?, ?, ?, ?, ?)"
+)
+
 
 class MoneyMovesCore:
     """Central orchestrator for the Money Moves system."""
@@ -50,6 +72,10 @@ class MoneyMovesCore:
             broker=broker,
             risk_manager=self.risk_manager,
         )
+        self._status_cache_ttl = float(
+            self.settings.get("status_cache_ttl", STATUS_CACHE_TTL_SECONDS)
+        )
+        self._exposure_cache: dict[int, tuple[dict[str, Any], float]] = {}
 
     async def startup(self, user_id: int) -> dict[str, Any]:
         """Initialize all engines and verify system health.
@@ -62,34 +88,34 @@ class MoneyMovesCore:
         """
         warnings: list[str] = []
 
+        # Start the broker round-trip, then run the single status query while
+        # it is in flight. The query stays on the loop thread: the shared
+        # connection (and MockBroker's reads of it) must not cross threads.
+        balance_task = asyncio.create_task(self.broker.get_account_balance())
+        await asyncio.sleep(0)
         try:
-            self.db.fetchone("SELECT 1")
+            status = self._fetch_status(user_id)
         except Exception as exc:
+            balance_task.cancel()
             msg = f"Database connectivity check failed: {exc}"
             logger.error(msg)
             return {"status": "error", "message": msg}
 
         try:
-            await self.broker.get_account_balance()
+            await balance_task
         except Exception as exc:
             warnings.append(f"Broker connection issue: {exc}")
             logger.warning("Broker connectivity check failed: %s", exc)
 
-        limits = self.db.fetchall(
-            "SELECT * FROM risk_limits WHERE user_id = ?", (user_id,)
-        )
-        if not limits:
+        limits_count = status["risk_limits_count"]
+        if not limits_count:
             warnings.append("No risk limits configured")
 
         kill_active = self.risk_manager.is_kill_switch_active(user_id)
         if kill_active:
             warnings.append("Kill switch is ACTIVE — trading halted")
 
-        pending = self.db.fetchone(
-            "SELECT COUNT(*) as cnt FROM signals WHERE status = ? AND user_id = ?",
-            (SignalStatus.PENDING, user_id),
-        )
-        pending_count = pending["cnt"] if pending else 0
+        pending_count = status["pending_signals"]
 
         mode = self.settings.get("mode", "mock")
         logger.info(
@@ -100,21 +126,21 @@ class MoneyMovesCore:
             len(warnings),
         )
 
-        _audit(self.db, "system_startup", f"Mode: {mode}, warnings: {len(warnings)}")
+        self._audit("system_startup", f"Mode: {mode}, warnings: {len(warnings)}")
 
         return {
             "status": "ok" if not warnings else "ok_with_warnings",
             "mode": mode,
             "kill_switch_active": kill_active,
             "pending_signals": pending_count,
-            "risk_limits_count": len(limits),
+            "risk_limits_count": limits_count,
             "warnings": warnings,
         }
 
     async def shutdown(self) -> None:
         """Gracefully shut down all engines."""
         logger.info("MoneyMovesCore shutting down")
-        _audit(self.db, "system_shutdown", "Graceful shutdown")
+        self._audit("system_shutdown", "Graceful shutdown")
         self.db.close()
 
     async def process_signal(self, signal_id: int, user_id: int) -> dict[str, Any]:
@@ -151,7 +177,7 @@ class MoneyMovesCore:
         approval_result = self.approval_workflow.process_signal(signal, user_id)
 
         if approval_result["status"] == "auto_approved":
-            exec_result = await self.execute_approved_signal(signal_id, user_id)
+            exec_result = await self.execute_approved_signal(signal_id, user_id, signal=signal)
             return {
                 "status": "executed" if exec_result.get("status") == "executed" else "exec_failed",
                 "signal_id": signal_id,
@@ -163,21 +189,28 @@ class MoneyMovesCore:
             "signal_id": signal_id,
         }
 
-    async def execute_approved_signal(self, signal_id: int, user_id: int) -> dict[str, Any]:
+    async def execute_approved_signal(
+        self, signal_id: int, user_id: int, signal: Signal | None = None
+    ) -> dict[str, Any]:
         """Execute an approved signal through the broker.
 
         Args:
             signal_id: ID of the approved signal.
             user_id: ID of the owning user.
+            signal: The signal if the caller already loaded it; fetched otherwise.
 
         Returns:
             Dict with execution result.
         """
-        signal = self.signal_engine.get_signal(signal_id, user_id)
+        if signal is None:
+            signal = self.signal_engine.get_signal(signal_id, user_id)
         if not signal:
             return {"status": "error", "message": f"Signal {signal_id} not found"}
 
-        shares = self._estimate_shares(signal, user_id)
+        # NAV is read from the shared connection here on the loop thread; only
+        # the quote lookup, which may hit the network, runs on a worker thread.
+        nav = self.risk_manager._get_nav(user_id) if signal.size_pct else 0.0
+        shares = await asyncio.to_thread(self._estimate_shares, signal, nav)
         order = Order(
             signal_id=signal_id,
             symbol=signal.symbol,
@@ -190,13 +223,13 @@ class MoneyMovesCore:
             result = await self.broker.place_order(order)
         except Exception as exc:
             logger.error("Order execution failed for signal %d: %s", signal_id, exc)
-            _audit(self.db, "order_failed", f"Signal {signal_id}: {exc}")
+            self._audit("order_failed", f"Signal {signal_id}: {exc}")
             return {"status": "error", "message": str(exc)}
 
         if result.filled_price is not None:
             self.signal_engine.mark_executed(signal_id, user_id)
-            _audit(
-                self.db,
+            self.invalidate_status(user_id)
+            self._audit(
                 "signal_executed",
                 f"Signal {signal_id}: {signal.action} {shares} {signal.symbol} "
                 f"@ {result.filled_price:.2f}",
@@ -221,55 +254,99 @@ class MoneyMovesCore:
             Dict with DB status, broker status, kill switch state, etc.
         """
         try:
-            self.db.fetchone("SELECT 1")
+            status = self._fetch_status(user_id)
             db_ok = True
         except Exception:
+            status = {}
             db_ok = False
 
-        kill_active = self.risk_manager.is_kill_switch_active(user_id)
-
-        pending = self.db.fetchone(
-            "SELECT COUNT(*) as cnt FROM signals WHERE status = ? AND user_id = ?",
-            (SignalStatus.PENDING, user_id),
-        )
-        pending_count = pending["cnt"] if pending else 0
-
-        pv = self.db.fetchone(
-            "SELECT * FROM portfolio_value WHERE user_id = ? ORDER BY date DESC LIMIT 1",
-            (user_id,),
-        )
-
-        exposure = self.risk_manager.calculate_exposure(user_id)
+        kill_active, exposure = self._risk_snapshot(user_id)
 
         return {
             "db_connected": db_ok,
             "kill_switch_active": kill_active,
-            "pending_signals": pending_count,
-            "portfolio_value": pv["total_value"] if pv else 0,
-            "cash": pv["cash"] if pv else 0,
+            "pending_signals": status.get("pending_signals", 0),
+            "portfolio_value": status.get("total_value") or 0,
+            "cash": status.get("cash") or 0,
             "exposure": exposure,
             "mode": self.settings.get("mode", "mock"),
         }
 
-    def _estimate_shares(self, signal: Signal, user_id: int) -> float:
+    def _risk_snapshot(self, user_id: int) -> tuple[bool, dict[str, Any]]:
+        """Return the user's kill switch state and exposure for status reads.
+
+        Exposure is memoized per user for the status cache TTL so dashboards
+        polling get_system_status don't recompute it on every request. The
+        kill switch is a single-row lookup and is always read fresh, so a
+        toggle made through any code path shows up on the next read.
+        startup() and trading paths read the risk manager directly.
+
+        Args:
+            user_id: ID of the owning user.
+
+        Returns:
+            Tuple of (kill switch active, exposure dict).
+        """
+        kill_active = self.risk_manager.is_kill_switch_active(user_id)
+
+        now = time.monotonic()
+        cached = self._exposure_cache.get(user_id)
+        if cached is not None and now - cached[1] < self._status_cache_ttl:
+            return kill_active, cached[0]
+
+        exposure = self.risk_manager.calculate_exposure(user_id)
+        self._exposure_cache[user_id] = (exposure, now)
+        return kill_active, exposure
+
+    def invalidate_status(self, user_id: int | None = None) -> None:
+        """Drop memoized status readings so the next read is fresh.
+
+        Args:
+            user_id: User whose readings to drop, or None for all users.
+        """
+        if user_id is None:
+            self._exposure_cache.clear()
+        else:
+            self._exposure_cache.pop(user_id, None)
+
+    def _fetch_status(self, user_id: int) -> dict[str, Any]:
+        """Fetch the startup/status counters in a single query.
+
+        Args:
+            user_id: ID of the owning user.
+
+        Returns:
+            Dict with pending_signals, risk_limits_count, and the latest
+            portfolio total_value/cash (None before the first snapshot).
+        """
+        return self.db.fetchone(_SQL_STATUS, {"pending": SignalStatus.PENDING, "user_id": user_id})
+
+    def _audit(self, action: str, details: str = "") -> None:
+        """Write and commit an audit log entry for core orchestrator actions.
+
+        Written synchronously on the shared connection: order and execution
+        entries must not be lost to a background writer's lock timeout.
+        """
+        self.db.execute(
+            _SQL_INSERT_AUDIT, (ActorType.ENGINE.value, action, details, "system", None)
+        )
+        self.db.connect().commit()
+
+    def _estimate_shares(self, signal: Signal, nav: float) -> float:
         """Estimate number of shares for an order.
 
+        Touches no database state, so it is safe to run on a worker thread.
+
         Args:
             signal: Signal with optional size_pct.
-            user_id: ID of the owning user.
+            nav: The owning user's net asset value.
 
         Returns:
             Estimated share count (minimum 1).
         """
-        if not signal.size_pct:
-            return 1.0
-
-        nav = self.risk_manager._get_nav(user_id)
-        if nav <= 0:
+        if not signal.size_pct or nav <= 0:
             return 1.0
 
-        from engine.pricing import get_price
-
         try:
             price_data = get_price(signal.symbol)
             price = price_data.get("price", 0)
@@ -280,13 +357,3 @@ class MoneyMovesCore:
             logger.warning("Could not estimate shares for %s", signal.symbol)
 
         return 1.0
-
-
-def _audit(db: Database, action: str, details: str = "") -> None:
-    """Create an audit log entry for core orchestrator actions."""
-    db.execute(
-        "INSERT INTO audit_log (actor, action, details, entity_type, entity_id) "
-        "VALUES (?, ?, ?, ?, ?)",
-        (ActorType.ENGINE.value, action, details, "system", None),
-    )
-    db.connect().commit()
@@ -10,6 +10,7 @@ Classes:
 
 from __future__ import annotations
 
+import json
 import logging
 from typing import Any
 
@@ -39,15 +40,46 @@ SECTOR_MAP: dict[str, str] = {
 }
 
 
+# Fixed statements, kept byte-identical so the connection's statement cache
+# (see Database.STATEMENT_CACHE_SIZE) reuses the compiled form on every scan.
+_SQL_ACTIVE_THESES = (
+    "SELECT id, title, symbols, universe_keywords "
+    "FROM theses WHERE status IN ('active', 'strengthening')"
+)
+# Candidate symbols (JSON array) not held in any open position
+_SQL_UNHELD_SYMBOLS = (
+    "SELECT value AS symbol FROM json_each(?) WHERE NOT EXISTS "
+    "(SELECT 1 FROM positions WHERE symbol = value AND shares > 0)"
+)
+
+# Static keyword -> ticker mapping for mock mode, keyed by lowercased keyword
+_KEYWORD_MAP: dict[str, tuple[str, ...]] = {
+    "ai": ("NVDA", "AMD", "MSFT", "GOOG", "AVGO"),
+    "semiconductors": ("NVDA", "AMD", "AVGO", "QCOM", "INTC"),
+    "cloud": ("MSFT", "GOOG", "AMZN", "CRM", "ORCL"),
+    "ev": ("TSLA",),
+    "software": ("MSFT", "CRM", "ORCL", "PANW"),
+    "hardware": ("AAPL", "NVDA", "AMD", "AVGO"),
+}
+
+
 def get_sector(symbol: str) -> str:
     """Get the sector for a given ticker symbol.
 
+    Symbols are normally stored uppercase, so only mixed/lowercase input pays
+    for building an uppercased copy.
+
     Args:
         symbol: Stock ticker symbol.
 
     Returns:
         Sector name string, or 'Unknown' if not in the mapping.
     """
+    sector = SECTOR_MAP.get(symbol)
+    if sector is not None:
+        return sector
+    if symbol.isupper():
+        return "Unknown"
     return SECTOR_MAP.get(symbol.upper(), "Unknown")
 
 
@@ -68,6 +100,8 @@ class DiscoveryEngine:
             db: Database instance for thesis and signal access.
         """
         self.db = db
+        # thesis_id -> (raw universe_keywords JSON, parsed keywords)
+        self._keyword_cache: dict[int, tuple[str, list[str]]] = {}
 
     def scan_universe(self) -> list[dict[str, Any]]:
         """Scan for new tickers aligned with active theses.
@@ -79,50 +113,70 @@ class DiscoveryEngine:
             List of dicts with 'symbol', 'thesis_id', and 'reason' keys for
             each newly discovered ticker.
         """
-        theses = self.db.fetchall(
-            "SELECT id, title, symbols, universe_keywords "
-            "FROM theses WHERE status IN ('active', 'strengthening')"
-        )
-
-        discoveries: list[dict[str, Any]] = []
-        existing_symbols = {
-            row["symbol"]
-            for row in self.db.fetchall("SELECT DISTINCT symbol FROM positions WHERE shares > 0")
+        theses = [
+            (thesis, self._thesis_keywords(thesis["id"], thesis.get("universe_keywords", "[]")))
+            for thesis in self.db.fetchall(_SQL_ACTIVE_THESES)
+        ]
+
+        # Let SQL drop already-held candidates so only new symbols come back
+        candidates = {
+            symbol
+            for _, keywords in theses
+            for keyword in keywords
+            for symbol in self._search_keyword(keyword)
         }
+        unheld: set[str] = set()
+        if candidates:
+            unheld = {
+                row["symbol"]
+                for row in self.db.fetchall(_SQL_UNHELD_SYMBOLS, (json.dumps(sorted(candidates)),))
+            }
 
-        for thesis in theses:
-            keywords_raw = thesis.get("universe_keywords", "[]")
-            try:
-                import json
-
-                keywords = (
-                    json.loads(keywords_raw)
-                    if isinstance(keywords_raw, str)
-                    else keywords_raw
-                )
-            except (json.JSONDecodeError, TypeError):
-                keywords = []
-
+        discoveries: list[dict[str, Any]] = []
+        for thesis, keywords in theses:
             for keyword in keywords:
                 matched = self._search_keyword(keyword)
-                for symbol in matched:
-                    if symbol not in existing_symbols:
-                        discoveries.append(
-                            {
-                                "symbol": symbol,
-                                "thesis_id": thesis["id"],
-                                "reason": (
-                                    f"Matches keyword '{keyword}' "
-                                    f"from thesis: {thesis['title']}"
-                                ),
-                            }
-                        )
-                        existing_symbols.add(symbol)
+                new_symbols = [sym for sym in matched if sym in unheld]
+                if not new_symbols:
+                    continue
+                reason = f"Matches keyword '{keyword}' from thesis: {thesis['title']}"
+                discoveries.extend(
+                    {"symbol": symbol, "thesis_id": thesis["id"], "reason": reason}
+                    for symbol in new_symbols
+                )
+                unheld.difference_update(new_symbols)
 
         logger.info("Universe scan found %d new tickers", len(discoveries))
         return discoveries
 
-    def _search_keyword(self, keyword: str) -> list[str]:
+    def _thesis_keywords(self, thesis_id: int, keywords_raw: Any) -> list[str]:
+        """Return a thesis's parsed universe_keywords, reusing earlier parses.
+
+        The parse is keyed on the raw JSON text, so an edited thesis is
+        re-parsed on the next scan without relying on updated_at.
+
+        Args:
+            thesis_id: Thesis primary key.
+            keywords_raw: universe_keywords column value (JSON text or a list).
+
+        Returns:
+            List of keywords, empty if missing or malformed.
+        """
+        if not isinstance(keywords_raw, str):
+            return keywords_raw or []
+
+        cached = self._keyword_cache.get(thesis_id)
+        if cached is not None and cached[0] == keywords_raw:
+            return cached[1]
+
+        try:
+            keywords = json.loads(keywords_raw) or []
+        except (json.JSONDecodeError, TypeError):
+            keywords = []
+        self._keyword_cache[thesis_id] = (keywords_raw, keywords)
+        return keywords
+
+    def _search_keyword(self, keyword: str) -> tuple[str, ...]:
         """Search for tickers matching a keyword.
 
         In mock mode, returns from a static mapping. Production would use
@@ -132,19 +186,6 @@ class DiscoveryEngine:
             keyword: Search keyword (e.g., 'AI', 'semiconductors').
 
         Returns:
-            List of matching ticker symbols.
+            Tuple of matching ticker symbols (shared; do not mutate).
         """
-        # Static keyword -> ticker mapping for mock mode
-        keyword_map: dict[str, list[str]] = {
-            "AI": ["NVDA", "AMD", "MSFT", "GOOG", "AVGO"],
-            "semiconductors": ["NVDA", "AMD", "AVGO", "QCOM", "INTC"],
-            "cloud": ["MSFT", "GOOG", "AMZN", "CRM", "ORCL"],
-            "EV": ["TSLA"],
-            "software": ["MSFT", "CRM", "ORCL", "PANW"],
-            "hardware": ["AAPL", "NVDA", "AMD", "AVGO"],
-        }
-        kl = keyword.lower()
-        for k, v in keyword_map.items():
-            if kl == k.lower():
-                return v
-        return []
+        return _KEYWORD_MAP.get(keyword.lower(), ())
@@ -70,6 +70,11 @@ from engine import (
 
 logger = logging.getLogger(__name__)
 
+_SQL_INSERT_SIGNAL = """INSERT INTO signals
+    (action, symbol, thesis_id, confidence, source, horizon, reasoning,
+     size_pct, funding_plan, status, created_at)
+    VALUES (?,?,?,?,?,?,?,?,?,?,?)"""
+
 # Thesis strength multipliers for confidence scoring.
 # Maps thesis status strings to the multiplier applied to the base confidence score.
 # Invalidated and archived theses produce a 0.0 multiplier, effectively blocking
@@ -160,10 +165,7 @@ class SignalEngine:
         """
         now = datetime.now(UTC).isoformat()
         cursor = self.db.execute(
-            """INSERT INTO signals
-               (action, symbol, thesis_id, confidence, source, horizon, reasoning,
-                size_pct, funding_plan, status, created_at)
-               VALUES (?,?,?,?,?,?,?,?,?,?,?)""",
+            _SQL_INSERT_SIGNAL,
             (
                 signal.action.value,
                 signal.symbol,
@@ -185,6 +187,58 @@ class SignalEngine:
         _audit(self.db, "signal_created", "signal", signal.id)
         return signal
 
+    def create_signals_bulk(self, signals: list[Signal]) -> list[Signal]:
+        """Create many signals in one transaction.
+
+        Equivalent to calling create_signal() for each signal, but inserts all
+        rows and their 'signal_created' audit entries under a single commit.
+        Each ID is read from its own INSERT's cursor.lastrowid rather than
+        derived from last_insert_rowid() afterwards, since other writers
+        (e.g. the audit writer threads) share the connection and may insert
+        in between.
+
+        Args:
+            signals: Signal models to persist, typically all PENDING.
+
+        Returns:
+            The same Signal models, in order, with id and created_at populated.
+
+        Side effects:
+            - Inserts one row per signal into the signals table.
+            - Inserts one audit_log entry per signal with action 'signal_created'.
+            - Commits the database transaction once.
+        """
+        if not signals:
+            return []
+
+        now = datetime.now(UTC).isoformat()
+        rows = [
+            (
+                signal.action.value,
+                signal.symbol,
+                signal.thesis_id,
+                signal.confidence,
+                signal.source.value,
+                signal.horizon,
+                signal.reasoning,
+                signal.size_pct,
+                signal.funding_plan,
+                signal.status.value,
+                now,
+            )
+            for signal in signals
+        ]
+        with self.db.transaction() as conn:
+            for signal, row in zip(signals, rows, strict=True):
+                signal.id = conn.execute(_SQL_INSERT_SIGNAL, row).lastrowid
+                signal.created_at = now
+            conn.executemany(
+                """INSERT INTO audit_log (actor, action, entity_type, entity_id)
+                   VALUES (?,?,?,?)""",
+                [(ActorType.ENGINE.value, "signal_created", "signal", s.id) for s in signals],
+            )
+        return signals
+
     def get_signal(self, signal_id: int) -> Signal | None:
         """Retrieve a signal by its database ID.
 
@@ -69,6 +69,43 @@ class TestSharpeRatio:
         assert engine.sharpe_ratio(days=365) == 0.0
 
 
+class TestDailyReturns:
+    """Test the float32 daily return series feeding the risk metrics."""
+
+    def test_float32_returns_match_float64_within_tolerance(self, db: Database) -> None:
+        """Quantized returns stay within 1e-5 of the exact float64 computation."""
+        from datetime import UTC, datetime, timedelta
+
+        import numpy as np
+
+        base = datetime.now(UTC).date()
+        navs = [100000 * (1 + 0.013 * ((i * 7) % 5 - 2)) + i * 37.5 for i in range(60)]
+        _insert_nav_series(
+            db, [((base - timedelta(days=60 - i)).isoformat(), v) for i, v in enumerate(navs)]
+        )
+
+        returns = AnalyticsEngine(db)._daily_returns(365)
+        expected = [(navs[i] - navs[i - 1]) / navs[i - 1] for i in range(1, len(navs))]
+
+        assert returns.dtype == np.float32
+        assert np.max(np.abs(returns.astype(np.float64) - expected)) < 1e-5
+
+    def test_non_positive_prev_nav_skipped(self, db: Database) -> None:
+        """A zero NAV cannot be divided by, so the following period is dropped."""
+        from datetime import UTC, datetime, timedelta
+
+        import numpy as np
+
+        base = datetime.now(UTC).date()
+        navs = [100.0, 0.0, 50.0, 55.0]
+        _insert_nav_series(
+            db, [((base - timedelta(days=4 - i)).isoformat(), v) for i, v in enumerate(navs)]
+        )
+
+        returns = AnalyticsEngine(db)._daily_returns(365)
+        assert np.allclose(returns, [-1.0, 0.1])
+
+
 class TestMaxDrawdown:
     """Test drawdown detection."""
 
@@ -154,6 +191,19 @@ class TestWinRate:
         assert "manual" in result
         assert "thesis_update" in result
 
+    def test_group_by_trades_without_signal_are_unknown(self, seeded_db: Database) -> None:
+        """Trades with no linked signal group under 'unknown', not 'None'."""
+        _insert_trades(
+            seeded_db,
+            [
+                (100, 1000, 1, 0.8, "manual"),
+                (-20, 400, None, None, None),
+            ],
+        )
+        result = AnalyticsEngine(seeded_db).win_rate(group_by="source")
+        assert result["unknown"] == {"win_rate": 0.0, "total_trades": 1, "wins": 0, "losses": 1}
+        assert result["manual"]["wins"] == 1
+
 
 class TestStressTest:
     """Test stress test calculations."""
@@ -181,6 +231,41 @@ class TestVaR:
         engine = AnalyticsEngine(seeded_db)
         assert engine.var_95() == 0.0
 
+    def test_var_uses_historical_percentile_with_enough_history(self, db: Database) -> None:
+        """With >= 30 returns VaR is the empirical 5th-percentile loss, not 1.645 sigma."""
+        from datetime import UTC, datetime, timedelta
+
+        import numpy as np
+
+        base = datetime.now(UTC).date()
+        navs = [100000.0]
+        for i in range(40):
+            step = -0.08 if i in (5, 15, 22) else (0.004 if i % 2 else -0.002)
+            navs.append(navs[-1] * (1 + step))
+        _insert_nav_series(
+            db, [((base - timedelta(days=41 - i)).isoformat(), v) for i, v in enumerate(navs)]
+        )
+
+        engine = AnalyticsEngine(db)
+        returns = engine._daily_returns(252)
+        assert engine.var_95() == -float(np.percentile(returns, 5))
+        assert abs(engine.var_95() - 0.08) < 1e-6
+
+    def test_var_parametric_fallback_for_short_history(self, db: Database) -> None:
+        """Fewer than 30 returns falls back to mean - 1.645 * std."""
+        from datetime import UTC, datetime, timedelta
+
+        base = datetime.now(UTC).date()
+        navs = [100000.0, 99000.0, 100500.0, 98000.0, 99500.0]
+        _insert_nav_series(
+            db, [((base - timedelta(days=5 - i)).isoformat(), v) for i, v in enumerate(navs)]
+        )
+
+        engine = AnalyticsEngine(db)
+        returns = engine._daily_returns(252)
+        expected = -(float(returns.mean()) - 1.645 * float(returns.std(ddof=1)))
+        assert abs(engine.var_95() - expected) < 1e-9
+
 
 class TestNavSnapshot:
     """Test NAV snapshot creation."""
@@ -200,6 +285,38 @@ class TestNavSnapshot:
         rows = seeded_db.fetchall("SELECT * FROM exposure_snapshots")
         assert len(rows) == 1
 
+    def test_snapshot_exposure_sums_value_by_thesis(self, seeded_db: Database) -> None:
+        """by_thesis sums shares * price per thesis, with unlinked positions under None."""
+        import json
+
+        for symbol, shares, cost, thesis_id in [
+            ("NVDA", 10, 100.0, 1),
+            ("AVGO", 5, 200.0, 1),
+            ("MSFT", 2, 300.0, 7),
+            ("AAPL", 4, 50.0, None),
+        ]:
+            seeded_db.execute(
+                "INSERT INTO positions (symbol, shares, avg_cost, side, thesis_id) "
+                "VALUES (?, ?, ?, 'long', ?)",
+                (symbol, shares, cost, thesis_id),
+            )
+        seeded_db.connect().commit()
+
+        AnalyticsEngine(seeded_db).snapshot_exposure()
+        row = seeded_db.fetchone("SELECT by_thesis FROM exposure_snapshots")
+        assert json.loads(row["by_thesis"]) == {"1": 2000.0, "7": 600.0, "None": 200.0}
+
+    def test_sum_by_thesis_groups_missing_key_under_none(self) -> None:
+        """Positions without a thesis_id key are grouped under "none", not a KeyError."""
+        from engine.analytics import _sum_by_thesis
+
+        positions = [
+            {"thesis_id": 3, "shares": 2, "price": 10.0},
+            {"thesis_id": None, "shares": 1, "price": 5.0},
+            {"shares": 4, "price": 2.5},
+        ]
+        assert _sum_by_thesis(positions) == {"3": 20.0, "None": 5.0, "none": 10.0}
+
 
 class TestCalibration:
     """Test calibration analysis."""
@@ -209,6 +326,39 @@ class TestCalibration:
         engine = AnalyticsEngine(seeded_db)
         assert engine.calibration() == []
 
+    def test_buckets_predicted_vs_actual(self, seeded_db: Database) -> None:
+        """Trades land in floor(confidence*10) buckets, ordered numerically."""
+        _insert_trades(
+            seeded_db,
+            [
+                (100, 1000, 1, 0.72, "manual"),
+                (-50, 500, 1, 0.78, "manual"),
+                (80, 800, 1, 0.15, "manual"),
+                (30, 300, 1, 1.0, "manual"),
+            ],
+        )
+        result = AnalyticsEngine(seeded_db).calibration()
+
+        assert [b["bucket"] for b in result] == ["10%-20%", "70%-80%", "90%-100%"]
+        seventy = result[1]
+        assert seventy["count"] == 2
+        assert seventy["actual"] == 0.5
+        assert abs(seventy["predicted"] - 0.75) < 1e-9
+        assert result[2]["count"] == 1
+
+
+class TestCorrelation:
+    """Test the Pearson correlation helper."""
+
+    def test_perfectly_anticorrelated_series(self) -> None:
+        """Mirror-image series correlate at -1."""
+        corr = AnalyticsEngine._correlation([0.01, 0.02, -0.01, 0.03], [-0.01, -0.02, 0.01, -0.03])
+        assert abs(corr + 1.0) < 1e-9
+
+    def test_constant_series_returns_zero(self) -> None:
+        """Zero variance makes correlation undefined; report 0.0 instead of NaN."""
+        assert AnalyticsEngine._correlation([0.01, 0.01, 0.01], [0.02, -0.01, 0.03]) == 0.0
+
 
 class TestNavHistory:
     """Test NAV history retrieval."""
@@ -220,3 +370,11 @@ class TestNavHistory:
         assert len(history) >= 1
         assert "date" in history[0]
         assert "nav" in history[0]
+
+    def test_tuple_reads_leave_connection_dict_rows(self, seeded_db: Database) -> None:
+        """Analytics' tuple cursors must not change the shared dict row factory."""
+        engine = AnalyticsEngine(seeded_db)
+        engine.nav_history()
+        engine.max_drawdown()
+        row = seeded_db.fetchone("SELECT total_value FROM portfolio_value")
+        assert row["total_value"] == 100000
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+import sqlite3
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from engine import Signal, SignalAction
-from engine.approval import ApprovalWorkflow
+from engine.approval import ApprovalWorkflow, AuditWriter
 
 
 @pytest.fixture
@@ -106,6 +107,37 @@ class TestAutoApproveRules:
         object.__setattr__(signal, "source", "rebalance")
         assert workflow.should_auto_approve(signal) is True
 
+    def test_rebalance_skips_database(self, workflow, mock_db):
+        """Rebalance signals are decided without any settings or portfolio queries."""
+        signal = Signal(
+            id=1,
+            action=SignalAction.BUY,
+            symbol="VTI",
+            size_pct=5.0,
+            thesis_id=1,
+            confidence=0.95,
+        )
+        object.__setattr__(signal, "source", "rebalance")
+        assert workflow.should_auto_approve(signal) is True
+        mock_db.fetch_one.assert_not_called()
+
+    def test_confirmed_thesis_skips_portfolio_lookup(self, workflow, mock_db):
+        """Rule 2 approval short-circuits before the portfolio_value query."""
+        mock_db.fetch_one.side_effect = lambda q, p=None: (
+            {"status": "confirmed"} if "theses" in q else None
+        )
+        signal = Signal(
+            id=1,
+            action=SignalAction.BUY,
+            symbol="NVDA",
+            size_pct=0.3,
+            thesis_id=1,
+            confidence=0.95,
+        )
+        assert workflow.should_auto_approve(signal) is True
+        queries = [c.args[0] for c in mock_db.fetch_one.call_args_list]
+        assert not any("portfolio_value" in q for q in queries)
+
     def test_no_rules_match(self, workflow):
         """Signal with no matching rules is not auto-approved."""
         signal = Signal(
@@ -151,6 +183,59 @@ class TestProcessSignal:
         assert result["status"] == "pending"
 
 
+class TestProcessSignalsBatch:
+    """Tests for bulk signal routing."""
+
+    def test_batch_approves_with_single_update_and_audit_write(self, workflow, mock_db):
+        """Qualifying signals share one UPDATE; every signal gets one audit row."""
+        mock_db.fetch_one.side_effect = lambda q, p=None: (
+            {"total_value": 100000} if "portfolio_value" in q else None
+        )
+        mock_db.fetch_all.return_value = [{"id": 7, "status": "confirmed"}]
+        signals = [
+            Signal(id=1, action=SignalAction.BUY, symbol="AAPL", size_pct=0.3, confidence=0.5),
+            Signal(id=2, action=SignalAction.BUY, symbol="NVDA", thesis_id=7, confidence=0.95),
+            Signal(id=3, action=SignalAction.BUY, symbol="MSFT", size_pct=5.0, confidence=0.5),
+        ]
+
+        results = workflow.process_signals(signals)
+
+        assert [r["status"] for r in results] == ["auto_approved", "auto_approved", "pending"]
+        updates = [c for c in mock_db.execute.call_args_list if "UPDATE signals" in c.args[0]]
+        assert len(updates) == 1
+        assert updates[0].args[1][2:] == (1, 2)
+        assert mock_db.fetch_all.call_count == 1
+        workflow.flush_audit()
+        writer_conn = mock_db.open_connection.return_value
+        written = [row for c in writer_conn.executemany.call_args_list for row in c.args[1]]
+        assert len(written) == 3
+
+    def test_batch_matches_single_signal_decisions(self, workflow, mock_db):
+        """Bulk routing reaches the same verdicts as should_auto_approve."""
+        mock_db.fetch_one.side_effect = lambda q, p=None: (
+            {"total_value": 100000}
+            if "portfolio_value" in q
+            else {"status": "active"}
+            if "theses" in q
+            else None
+        )
+        mock_db.fetch_all.return_value = [{"id": 7, "status": "active"}]
+        signals = [
+            Signal(id=1, action=SignalAction.BUY, symbol="NVDA", thesis_id=7, confidence=0.95),
+            Signal(id=2, action=SignalAction.BUY, symbol="AAPL", size_pct=0.2, confidence=0.5),
+        ]
+
+        expected = [workflow.should_auto_approve(s) for s in signals]
+        results = workflow.process_signals(signals)
+        assert [r["status"] == "auto_approved" for r in results] == expected
+
+    def test_empty_batch_is_noop(self, workflow, mock_db):
+        """No signals means no queries or writes."""
+        assert workflow.process_signals([]) == []
+        mock_db.fetch_one.assert_not_called()
+        mock_db.executemany.assert_not_called()
+
+
 class TestModifySignal:
     """Tests for signal modification."""
 
@@ -167,6 +252,33 @@ class TestModifySignal:
         assert result["success"] is True
         mock_db.execute.assert_called()
 
+    def test_modify_price_merges_funding_plan(self, workflow, mock_db):
+        """Limit price is written as JSON and keeps existing funding plan keys."""
+        import json
+
+        mock_db.fetch_one.return_value = {
+            "id": 1,
+            "status": "pending",
+            "symbol": "AAPL",
+            "funding_plan": '{"action": "BUY", "shares": 10}',
+        }
+
+        result = workflow.modify_signal(1, price_override=187.5)
+
+        assert result["success"] is True
+        update = next(c for c in mock_db.execute.call_args_list if "UPDATE signals" in c.args[0])
+        plan = json.loads(update.args[1][0])
+        assert plan == {"action": "BUY", "shares": 10, "limit_price": 187.5}
+
+    def test_modify_rejects_non_finite_price(self, workflow, mock_db):
+        """NaN/inf limit prices are refused instead of writing invalid JSON."""
+        mock_db.fetch_one.return_value = {"id": 1, "status": "pending", "symbol": "AAPL"}
+
+        result = workflow.modify_signal(1, price_override=float("nan"))
+
+        assert result["success"] is False
+        mock_db.execute.assert_not_called()
+
     def test_modify_nonexistent(self, workflow, mock_db):
         """Modifying nonexistent signal fails."""
         mock_db.fetch_one.return_value = None
@@ -195,3 +307,146 @@ class TestModifySignal:
 
         result = workflow.modify_signal(1)
         assert result["success"] is False
+
+
+class TestSettingsCache:
+    """Tests for memoized settings lookups."""
+
+    def test_setting_read_once_within_ttl(self, workflow, mock_db):
+        """Repeated lookups of the same key hit the settings table once."""
+        mock_db.fetch_one.return_value = {"value": "250"}
+
+        assert workflow._get_setting("auto_approve_max_value", 500.0) == 250.0
+        assert workflow._get_setting("auto_approve_max_value", 500.0) == 250.0
+        assert mock_db.fetch_one.call_count == 1
+
+    def test_invalidate_settings_forces_reread(self, workflow, mock_db):
+        """invalidate_settings makes the next lookup see updated values."""
+        mock_db.fetch_one.return_value = {"value": "250"}
+        workflow._get_setting("auto_approve_max_value", 500.0)
+
+        mock_db.fetch_one.return_value = {"value": "1000"}
+        workflow.invalidate_settings()
+        assert workflow._get_setting("auto_approve_max_value", 500.0) == 1000.0
+
+    def test_expired_setting_is_reread(self, workflow, mock_db):
+        """Entries older than the TTL are refreshed from the database."""
+        mock_db.fetch_one.return_value = {"value": "250"}
+        with patch("engine.approval.time.monotonic", return_value=1000.0):
+            workflow._get_setting("auto_approve_max_value", 500.0)
+
+        mock_db.fetch_one.return_value = {"value": "300"}
+        with patch("engine.approval.time.monotonic", return_value=1061.0):
+            assert workflow._get_setting("auto_approve_max_value", 500.0) == 300.0
+
+
+class TestAuditWriter:
+    """Tests for write-behind audit logging."""
+
+    def test_audit_rows_written_in_batches_off_thread(self, workflow, mock_db):
+        """Audit entries bypass the shared connection and land via executemany after flush."""
+        for i in range(5):
+            workflow.process_signal(
+                Signal(id=i, action=SignalAction.BUY, symbol="AAPL", confidence=0.5)
+            )
+        workflow.flush_audit()
+
+        assert not any("audit_log" in c.args[0] for c in mock_db.execute.call_args_list)
+        assert not mock_db.executemany.called
+        writer_conn = mock_db.open_connection.return_value
+        written = [row for c in writer_conn.executemany.call_args_list for row in c.args[1]]
+        assert [row[1] for row in written] == ["signal_pending_approval"] * 5
+        assert writer_conn.commit.called
+
+    def test_full_queue_falls_back_to_synchronous_write(self, workflow, mock_db):
+        """When the queue is full the entry is written inline instead of dropped."""
+        import queue
+
+        writer = workflow._audit_writer
+        writer._thread = MagicMock()  # pretend started so nothing drains the queue
+        writer._queue = queue.Queue(maxsize=1)
+        writer._queue.put_nowait(("engine", "x", "", ""))
+
+        mock_db.fetch_one.return_value = {"id": 1, "status": "pending", "symbol": "AAPL"}
+        workflow.modify_signal(1, size_override=2.0)
+
+        writer_conn = mock_db.open_connection.return_value
+        assert len(writer_conn.executemany.call_args_list) == 1
+        assert writer_conn.commit.called
+
+    def test_custom_statement(self, mock_db):
+        """Writers can target another audit_log shape."""
+        writer = AuditWriter(mock_db, "INSERT INTO audit_log (action) VALUES (?)")
+        writer.put(("startup",))
+        writer.put(("shutdown",))
+        writer.flush()
+
+        writer_conn = mock_db.open_connection.return_value
+        sqls = {c.args[0] for c in writer_conn.executemany.call_args_list}
+        assert sqls == {"INSERT INTO audit_log (action) VALUES (?)"}
+
+    def test_rows_commit_outside_open_transaction(self, db):
+        """Rows commit on the writer's connection, not in a caller's transaction."""
+        writer = AuditWriter(
+            db, "INSERT INTO audit_log (actor, action) VALUES (?, ?)", name="test-audit-writer"
+        )
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                db.execute("INSERT INTO audit_log (actor, action) VALUES ('user', 'rolled_back')")
+                writer.put(("engine", "kept"))
+                raise RuntimeError("abort")
+        writer.close()
+
+        actions = [r["action"] for r in db.fetchall("SELECT action FROM audit_log")]
+        assert actions == ["kept"]
+
+    def test_workflow_audit_rows_land_in_audit_log(self, db):
+        """The default statement matches the audit_log schema end to end."""
+        workflow = ApprovalWorkflow(
+            db=db, signal_engine=MagicMock(), broker=MagicMock(), risk_manager=MagicMock()
+        )
+        workflow.process_signal(Signal(id=7, action=SignalAction.BUY, symbol="AAPL"))
+        workflow.flush_audit()
+
+        row = db.fetchone("SELECT actor, action, details FROM audit_log")
+        assert row == {
+            "actor": "engine",
+            "action": "signal_pending_approval",
+            "details": f"Signal 7: {SignalAction.BUY} AAPL awaiting manual review",
+        }
+        assert workflow._audit_writer.failed_count == 0
+
+    def test_auto_approval_commits_before_audit_write(self, db):
+        """The approval UPDATE is committed, so the writer's connection never waits on it."""
+        workflow = ApprovalWorkflow(
+            db=db, signal_engine=MagicMock(), broker=MagicMock(), risk_manager=MagicMock()
+        )
+        db.execute("INSERT INTO signals (action, symbol, status) VALUES ('buy', 'SPY', 'pending')")
+        db.connect().commit()
+        signal = Signal(id=1, action=SignalAction.BUY, symbol="SPY")
+        object.__setattr__(signal, "source", "rebalance")
+
+        with patch("engine.approval.AUDIT_BUSY_TIMEOUT_SECONDS", 0.1):
+            assert workflow.process_signal(signal)["status"] == "auto_approved"
+            workflow.flush_audit()
+
+        assert not db.connect().in_transaction
+        assert db.fetchone("SELECT action FROM audit_log")["action"] == "signal_auto_approved"
+
+    def test_failed_batch_kept_and_raised_on_close(self, db):
+        """A batch the thread cannot write is retried on close and surfaces its error."""
+        writer = AuditWriter(db, "INSERT INTO no_such_table (x) VALUES (?)", name="test-audit")
+        writer.put(("lost?",))
+        writer._queue.join()
+        assert writer.failed_count == 1
+
+        writer.sql = "INSERT INTO audit_log (actor, action) VALUES ('engine', ?)"
+        writer.flush()
+        assert writer.failed_count == 0
+        assert db.fetchone("SELECT action FROM audit_log")["action"] == "lost?"
+
+        writer.sql = "INSERT INTO no_such_table (x) VALUES (?)"
+        writer.put(("again",))
+        with pytest.raises(sqlite3.OperationalError):
+            writer.close()
+        assert writer.failed_count == 1
@@ -6,11 +6,24 @@ House Stock Watcher parsing, and deduplication using mocked HTTP responses.
 
 from __future__ import annotations
 
+import json
+import sqlite3
+import threading
+import time
+from datetime import UTC, datetime, timedelta
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from engine.congress import CongressTradesEngine
+from engine.congress import (
+    HSW_CACHE_MAX_AGE_SECONDS,
+    SUMMARY_RECENT_LIMIT,
+    CongressTradesEngine,
+    _last_request,
+    _normalize_action,
+    _normalize_ticker,
+    _throttle,
+)
 from engine.signals import SignalEngine
 
 SAMPLE_HTML = """
@@ -81,6 +94,29 @@ SAMPLE_HOUSE_STOCK_WATCHER_JSON = [
 DEFAULT_USER_ID = 1
 
 
+def _trade(**overrides) -> dict:
+    """Build a stored-trade dict, defaulting to a Pelosi NVDA buy."""
+    trade = {
+        "politician": "Pelosi",
+        "symbol": "NVDA",
+        "action": "buy",
+        "amount_range": "",
+        "date_filed": "2026-01-15",
+        "date_traded": "2026-01-10",
+        "source_url": "",
+    }
+    trade.update(overrides)
+    return trade
+
+
+@pytest.fixture(autouse=True)
+def _reset_throttle():
+    """Keep per-host request spacing from leaking between tests."""
+    _last_request.clear()
+    yield
+    _last_request.clear()
+
+
 @pytest.fixture
 def congress_engine(seeded_db):
     """CongressTradesEngine with seeded database."""
@@ -112,7 +148,8 @@ class TestFetchRecent:
 
         # Force Capitol Trades path by making S3 fail first
         with patch.object(
-            congress_engine, "_fetch_house_stock_watcher",
+            congress_engine,
+            "_fetch_house_stock_watcher",
             side_effect=Exception("skip"),
         ):
             trades = congress_engine.fetch_recent(days=30)
@@ -122,6 +159,81 @@ class TestFetchRecent:
         assert trades[0]["action"] == "buy"
         assert trades[1]["action"] == "sell"
 
+    def test_parse_html_nested_markup_and_short_rows(self, congress_engine):
+        """Cell text includes nested elements; short rows and empty pages yield nothing."""
+        html = (
+            "<table><tbody>"
+            "<tr><td><a href='/p/1'>Nancy <b>Pelosi</b></a></td><td> nvda </td>"
+            "<td>Purchase</td><td>$1K</td><td>2026-01-15</td></tr>"
+            "<tr><td>Only</td><td>two</td></tr>"
+            "</tbody></table>"
+        )
+        cutoff = datetime(2026, 1, 1, tzinfo=UTC)
+        trades = congress_engine._parse_capitol_trades_html(html, cutoff)
+        assert len(trades) == 1
+        assert trades[0]["politician"] == "Nancy Pelosi"
+        assert trades[0]["symbol"] == "NVDA"
+        assert congress_engine._parse_capitol_trades_html("  ", cutoff) == []
+
+    @patch("engine.congress.httpx.Client")
+    def test_http_client_reused_across_fetches(self, mock_client_cls, congress_engine):
+        """One pooled client serves repeated scrapes and is closed by close()."""
+        mock_resp = MagicMock()
+        mock_resp.json.return_value = []
+        mock_client_cls.return_value.get.return_value = mock_resp
+
+        congress_engine._fetch_house_stock_watcher(days=7)
+        congress_engine._fetch_house_stock_watcher(days=7)
+        assert mock_client_cls.call_count == 1
+        assert mock_client_cls.return_value.get.call_count == 2
+
+        congress_engine.close()
+        mock_client_cls.return_value.close.assert_called_once()
+
+    def test_fetch_skips_scrape_when_house_answers_in_time(self, congress_engine):
+        """A prompt S3 result is returned without starting the fallback scrape."""
+        with (
+            patch("engine.congress.httpx.Client"),
+            patch.object(
+                congress_engine, "_fetch_house_stock_watcher", return_value=[{"symbol": "NVDA"}]
+            ),
+            patch.object(congress_engine, "_scrape_capitol_trades") as scrape,
+        ):
+            assert congress_engine.fetch_recent(days=7) == [{"symbol": "NVDA"}]
+        scrape.assert_not_called()
+
+    def test_slow_house_hedges_and_waits_for_scrape(self, congress_engine):
+        """A slow S3 request starts the scrape, which finishes before fetch_recent returns."""
+        scraped = threading.Event()
+
+        def slow_house(days, force):
+            time.sleep(0.1)
+            return [{"symbol": "NVDA"}]
+
+        def scrape(days):
+            scraped.set()
+            return []
+
+        with (
+            patch("engine.congress.httpx.Client"),
+            patch("engine.congress.CAPITOL_HEDGE_DELAY", 0.01),
+            patch.object(congress_engine, "_fetch_house_stock_watcher", side_effect=slow_house),
+            patch.object(congress_engine, "_scrape_capitol_trades", side_effect=scrape),
+        ):
+            assert congress_engine.fetch_recent(days=7) == [{"symbol": "NVDA"}]
+            assert scraped.is_set()
+
+    def test_fetch_falls_back_when_house_empty(self, congress_engine):
+        """Capitol Trades results are used when S3 returns nothing."""
+        with (
+            patch("engine.congress.httpx.Client"),
+            patch.object(congress_engine, "_fetch_house_stock_watcher", return_value=[]),
+            patch.object(
+                congress_engine, "_scrape_capitol_trades", return_value=[{"symbol": "AVGO"}]
+            ),
+        ):
+            assert congress_engine.fetch_recent(days=7) == [{"symbol": "AVGO"}]
+
     def test_fetch_graceful_on_error(self, congress_engine):
         """Returns empty list when all HTTP sources fail."""
         with patch("engine.congress.httpx.Client", side_effect=Exception("network error")):
@@ -129,13 +241,68 @@ class TestFetchRecent:
         assert trades == []
 
 
+class TestNormalizeAction:
+    """Tests for transaction-type normalization."""
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            ("purchase", "buy"),
+            ("sale (full)", "sell"),
+            ("sale_partial", "sell"),
+            ("exchange", "exchange"),
+            ("stock purchase (spouse)", "buy"),
+            ("partial sale", "sell"),
+            ("gift", "gift"),
+        ],
+    )
+    def test_known_and_fallback_labels(self, raw, expected):
+        """Exact labels hit the map; other labels use substring fallback."""
+        assert _normalize_action(raw) == expected
+
+
+class TestNormalizeTicker:
+    """Tests for ticker uppercasing and validation."""
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [("nvda", "NVDA"), ("Msft", "MSFT"), ("", None), ("--", None), ("BRK.B", None)],
+    )
+    def test_uppercases_and_rejects_non_letters(self, raw, expected):
+        """Only ASCII letters survive; everything else is rejected."""
+        assert _normalize_ticker(raw) == expected
+
+
+class TestParseDate:
+    """Tests for the regex-based date parser."""
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            ("2024-01-15", (2024, 1, 15)),
+            ("01/15/2024", (2024, 1, 15)),
+            ("1/5/24", (2024, 1, 5)),
+            ("12/31/69", (1969, 12, 31)),
+            ("2023-02-29", None),
+            ("--", None),
+            ("2024-01-15T00:00", None),
+        ],
+    )
+    def test_formats_match_strptime_semantics(self, raw, expected):
+        """ISO and US formats parse; invalid dates and junk return None."""
+        parsed = CongressTradesEngine._parse_date(raw)
+        if expected is None:
+            assert parsed is None
+        else:
+            assert (parsed.year, parsed.month, parsed.day) == expected
+            assert parsed.tzinfo is not None
+
+
 class TestHouseStockWatcherParsing:
     """Tests for parsing House Stock Watcher S3 JSON data."""
 
     def test_parse_valid_entry(self, congress_engine):
         """Valid S3 JSON entry is parsed correctly."""
-        from datetime import UTC, datetime, timedelta
-
         cutoff = datetime.now(UTC) - timedelta(days=30)
         result = congress_engine._parse_house_stock_watcher_entry(
             SAMPLE_HOUSE_STOCK_WATCHER_JSON[0], cutoff
@@ -148,8 +315,6 @@ class TestHouseStockWatcherParsing:
 
     def test_parse_sale_entry(self, congress_engine):
         """Sale entries are parsed with action='sell'."""
-        from datetime import UTC, datetime, timedelta
-
         cutoff = datetime.now(UTC) - timedelta(days=30)
         result = congress_engine._parse_house_stock_watcher_entry(
             SAMPLE_HOUSE_STOCK_WATCHER_JSON[1], cutoff
@@ -159,8 +324,6 @@ class TestHouseStockWatcherParsing:
 
     def test_skips_old_entries(self, congress_engine):
         """Entries older than cutoff are skipped."""
-        from datetime import UTC, datetime, timedelta
-
         cutoff = datetime.now(UTC) - timedelta(days=7)
         result = congress_engine._parse_house_stock_watcher_entry(
             SAMPLE_HOUSE_STOCK_WATCHER_JSON[2], cutoff
@@ -169,8 +332,6 @@ class TestHouseStockWatcherParsing:
 
     def test_skips_invalid_ticker(self, congress_engine):
         """Entries with '--' ticker are skipped."""
-        from datetime import UTC, datetime, timedelta
-
         cutoff = datetime.now(UTC) - timedelta(days=30)
         result = congress_engine._parse_house_stock_watcher_entry(
             SAMPLE_HOUSE_STOCK_WATCHER_JSON[3], cutoff
@@ -199,22 +360,128 @@ class TestHouseStockWatcherParsing:
         assert "MSFT" in symbols
 
 
+class TestHouseStockWatcherPrefilter:
+    """Tests for the cheap date prefilter on the S3 dataset."""
+
+    def test_old_iso_rows_skip_full_parse(self, congress_engine):
+        """Rows dated before the cutoff never reach the per-row parser."""
+        today = datetime.now(UTC).date()
+        rows = [
+            {"transaction_date": "2019-03-01", "ticker": "OLD", "type": "purchase"},
+            {"transaction_date": "01/15/2019", "ticker": "USD", "type": "purchase"},
+            {"transaction_date": today.isoformat(), "ticker": "NEW", "type": "purchase"},
+        ]
+        mock_resp = MagicMock()
+        mock_resp.json.return_value = rows
+        with (
+            patch("engine.congress.httpx.Client") as mock_client_cls,
+            patch.object(
+                congress_engine,
+                "_parse_house_stock_watcher_entry",
+                wraps=congress_engine._parse_house_stock_watcher_entry,
+            ) as parse_spy,
+        ):
+            mock_client_cls.return_value.get.return_value = mock_resp
+            trades = congress_engine._fetch_house_stock_watcher(days=7)
+
+        assert [t["symbol"] for t in trades] == ["NEW"]
+        parsed = [c.args[0]["ticker"] for c in parse_spy.call_args_list]
+        assert parsed == ["USD", "NEW"]
+
+
+class TestHouseStockWatcherCache:
+    """Tests for the on-disk conditional-GET cache of the S3 dataset."""
+
+    @staticmethod
+    def _response(status: int, rows: list[dict] | None = None) -> MagicMock:
+        resp = MagicMock()
+        resp.status_code = status
+        resp.headers = {"ETag": '"v1"', "Last-Modified": "Mon, 12 Oct 2026 00:00:00 GMT"}
+        if rows is not None:
+            resp.json.return_value = rows
+            resp.content = json.dumps(rows).encode()
+        return resp
+
+    @pytest.fixture
+    def cached_engine(self, seeded_db, tmp_path):
+        engine = CongressTradesEngine(seeded_db, cache_dir=tmp_path)
+        engine._client = MagicMock()
+        return engine
+
+    @pytest.fixture
+    def rows(self):
+        today = datetime.now(UTC).date().isoformat()
+        return [{"transaction_date": today, "ticker": "NVDA", "type": "purchase"}]
+
+    def test_not_modified_reuses_cached_body(self, cached_engine, rows):
+        """A 304 answer is served from the copy stored by the previous fetch."""
+        client = cached_engine._client
+        client.get.return_value = self._response(200, rows)
+        cached_engine._fetch_house_stock_watcher(days=7)
+
+        client.get.return_value = self._response(304)
+        trades = cached_engine._fetch_house_stock_watcher(days=7)
+
+        assert [t["symbol"] for t in trades] == ["NVDA"]
+        headers = client.get.call_args.kwargs["headers"]
+        assert headers["If-None-Match"] == '"v1"'
+        assert headers["If-Modified-Since"] == "Mon, 12 Oct 2026 00:00:00 GMT"
+
+    def test_force_skips_validators(self, cached_engine, rows):
+        """force=True downloads unconditionally even with a cached copy."""
+        client = cached_engine._client
+        client.get.return_value = self._response(200, rows)
+        cached_engine._fetch_house_stock_watcher(days=7)
+        cached_engine._fetch_house_stock_watcher(days=7, force=True)
+        assert client.get.call_args.kwargs["headers"] == {}
+
+    def test_expired_cache_is_ignored(self, cached_engine, rows):
+        """Copies older than the max age are re-downloaded without validators."""
+        client = cached_engine._client
+        client.get.return_value = self._response(200, rows)
+        cached_engine._fetch_house_stock_watcher(days=7)
+        later = time.time() + HSW_CACHE_MAX_AGE_SECONDS + 1
+        with patch("engine.congress.time.time", return_value=later):
+            cached_engine._fetch_house_stock_watcher(days=7)
+        assert client.get.call_args.kwargs["headers"] == {}
+
+
+class TestThrottle:
+    """Tests for per-host request spacing."""
+
+    def test_first_request_to_host_does_not_wait(self):
+        """Hosts with no earlier request go straight through."""
+        with patch("engine.congress.time.sleep") as sleep:
+            _throttle("first.example.test")
+        sleep.assert_not_called()
+
+    def test_back_to_back_requests_wait_remaining_gap(self):
+        """A second request to the same host sleeps only the unspent gap."""
+        with (
+            patch("engine.congress.time.monotonic", side_effect=[100.0, 100.25]),
+            patch("engine.congress.time.sleep") as sleep,
+        ):
+            _throttle("same.example.test", min_gap=1.0)
+            _throttle("same.example.test", min_gap=1.0)
+        sleep.assert_called_once_with(0.75)
+
+    def test_other_hosts_are_not_delayed(self):
+        """Spacing is tracked per host."""
+        with (
+            patch("engine.congress.time.monotonic", side_effect=[200.0, 200.1]),
+            patch("engine.congress.time.sleep") as sleep,
+        ):
+            _throttle("a.example.test", min_gap=1.0)
+            _throttle("b.example.test", min_gap=1.0)
+        sleep.assert_not_called()
+
+
 class TestStoreTrades:
     """Tests for storing trades and deduplication."""
 
     def test_store_inserts_new(self, congress_engine):
         """New trades are inserted into the database."""
-        trades = [
-            {
-                "politician": "Pelosi",
-                "symbol": "NVDA",
-                "action": "buy",
-                "amount_range": "$1M+",
-                "date_filed": "2026-01-15",
-                "date_traded": "2026-01-10",
-                "source_url": "https://example.com",
-            }
-        ]
+        trades = [_trade(amount_range="$1M+", source_url="https://example.com")]
         count = congress_engine.store_trades(trades)
         assert count == 1
 
@@ -224,52 +491,79 @@ class TestStoreTrades:
 
     def test_store_skips_duplicates(self, congress_engine):
         """Duplicate trades (same member+symbol+date) are skipped."""
-        trade = {
-            "politician": "Pelosi",
-            "symbol": "NVDA",
-            "action": "buy",
-            "amount_range": "$1M+",
-            "date_filed": "2026-01-15",
-            "date_traded": "2026-01-10",
-            "source_url": "https://example.com",
-        }
+        trade = _trade(amount_range="$1M+", source_url="https://example.com")
         assert congress_engine.store_trades([trade]) == 1
         assert congress_engine.store_trades([trade]) == 0
 
     def test_store_multiple_dedup(self, congress_engine):
         """Multiple trades with same key are deduplicated."""
         trades = [
-            {
-                "politician": "Pelosi",
-                "symbol": "NVDA",
-                "action": "buy",
-                "amount_range": "$1M+",
-                "date_filed": "2026-01-15",
-                "date_traded": "2026-01-10",
-                "source_url": "https://example.com",
-            },
-            {
-                "politician": "Pelosi",
-                "symbol": "NVDA",
-                "action": "buy",
-                "amount_range": "$1M+",
-                "date_filed": "2026-01-15",
-                "date_traded": "2026-01-10",
-                "source_url": "https://example.com",
-            },
-            {
-                "politician": "Pelosi",
-                "symbol": "NVDA",
-                "action": "buy",
-                "amount_range": "$1M+",
-                "date_filed": "2026-01-16",
-                "date_traded": "2026-01-11",
-                "source_url": "https://example.com",
-            },
+            _trade(amount_range="$1M+", source_url="https://example.com"),
+            _trade(amount_range="$1M+", source_url="https://example.com"),
+            _trade(
+                amount_range="$1M+",
+                date_filed="2026-01-16",
+                date_traded="2026-01-11",
+                source_url="https://example.com",
+            ),
         ]
         count = congress_engine.store_trades(trades)
         assert count == 2  # Two unique trades
 
+    def test_store_mixed_batch_counts_only_new(self, congress_engine):
+        """Already-stored rows in a batch are ignored and not counted."""
+        base = _trade(amount_range="$1M+", source_url="https://example.com")
+        congress_engine.store_trades([base])
+
+        batch = [base, {**base, "symbol": "AMD"}, {**base, "date_traded": "2026-01-12"}]
+        assert congress_engine.store_trades(batch) == 2
+        total = congress_engine.db.fetchone("SELECT COUNT(*) AS n FROM congress_trades")
+        assert total["n"] == 3
+
+    def test_stored_trades_skip_enrichment_and_rescoring(self, congress_engine):
+        """Known trades are dropped before enrichment; only new politicians are rescored."""
+        congress_engine.store_trades([_trade()])
+        scorer = congress_engine.scorer
+
+        batch = [_trade(), _trade(politician="Crenshaw", symbol="MSFT")]
+        with (
+            patch.object(scorer, "enrich_many", wraps=scorer.enrich_many) as enrich,
+            patch.object(scorer, "score_politicians") as rescore,
+        ):
+            assert congress_engine.store_trades(batch) == 1
+
+        assert [t["politician"] for t in enrich.call_args.args[0]] == ["Crenshaw"]
+        assert set(rescore.call_args.args[0]) == {"Crenshaw"}
+
+    def test_stored_key_lookup_probes_dedup_index(self, congress_engine):
+        """The batch key lookup uses json_extract (pre-3.38 SQLite) and seeks the index."""
+        from engine.congress import _SQL_STORED_TRADE_KEYS
+
+        assert "->>" not in _SQL_STORED_TRADE_KEYS
+        plan = congress_engine.db.fetchall(
+            "EXPLAIN QUERY PLAN " + _SQL_STORED_TRADE_KEYS, ('[["Pelosi", "NVDA", "2026-01-10"]]',)
+        )
+        assert any("ux_congress_trades_dedup" in r["detail"] for r in plan)
+
+    def test_store_rolls_back_whole_batch_on_error(self, congress_engine):
+        """A failing row aborts the batch without leaving earlier rows behind."""
+        good = _trade()
+        bad = {**good, "symbol": "AMD", "action": object()}  # cannot be bound
+        with pytest.raises(sqlite3.Error):
+            congress_engine.store_trades([good, bad])
+        assert not congress_engine.db.connect().in_transaction
+        total = congress_engine.db.fetchone("SELECT COUNT(*) AS n FROM congress_trades")
+        assert total["n"] == 0
+
+    def test_dedup_index_enforced_by_schema(self, congress_engine):
+        """The unique (politician, symbol, date_traded) index rejects raw duplicates."""
+        sql = (
+            "INSERT OR IGNORE INTO congress_trades (politician, symbol, action, date_traded) "
+            "VALUES ('Pelosi', 'NVDA', 'buy', '2026-01-10')"
+        )
+        assert congress_engine.db.execute(sql).rowcount == 1
+        assert congress_engine.db.execute(sql).rowcount == 0
+
 
 class TestCheckOverlap:
     """Tests for cross-referencing trades with portfolio."""
@@ -278,24 +572,8 @@ class TestCheckOverlap:
         """Trades matching thesis symbols are detected as overlapping."""
         congress_engine.store_trades(
             [
-                {
-                    "politician": "Pelosi",
-                    "symbol": "NVDA",
-                    "action": "buy",
-                    "amount_range": "",
-                    "date_filed": "2026-01-15",
-                    "date_traded": "2026-01-10",
-                    "source_url": "",
-                },
-                {
-                    "politician": "Someone",
-                    "symbol": "XYZ",
-                    "action": "buy",
-                    "amount_range": "",
-                    "date_filed": "2026-01-15",
-                    "date_traded": "2026-01-10",
-                    "source_url": "",
-                },
+                _trade(),
+                _trade(politician="Someone", symbol="XYZ"),
             ]
         )
         overlapping = congress_engine.check_overlap(DEFAULT_USER_ID)
@@ -303,25 +581,87 @@ class TestCheckOverlap:
         assert "NVDA" in symbols
         assert "XYZ" not in symbols
 
+    def test_overlap_with_watch_list_beyond_parameter_limit(self, congress_engine):
+        """Watch lists larger than SQLite's bound-parameter limit still match."""
+        symbols = ["NVDA"] + [f"S{i:05d}" for i in range(40_000)]
+        congress_engine.db.execute(
+            "INSERT INTO theses (title, thesis_text, strategy, status, symbols, user_id) "
+            "VALUES ('Broad', 'x', 'long', 'active', ?, ?)",
+            (json.dumps(symbols), DEFAULT_USER_ID),
+        )
+        congress_engine.db.connect().commit()
+        congress_engine.store_trades(
+            [
+                _trade(symbol="S39999"),
+            ]
+        )
+        overlapping = congress_engine.check_overlap(DEFAULT_USER_ID)
+        assert [t["symbol"] for t in overlapping] == ["S39999"]
+        assert congress_engine.get_summary(DEFAULT_USER_ID)["net_by_symbol"] == {"S39999": 1}
+
+    def test_overlap_includes_positions_and_ignores_bad_thesis_json(self, congress_engine):
+        """Position symbols count as watched; malformed thesis JSON is skipped."""
+        db = congress_engine.db
+        db.execute(
+            "INSERT INTO positions (account_id, symbol, shares, avg_cost, side, user_id) "
+            "VALUES (1, 'MSFT', 10, 400.0, 'long', ?)",
+            (DEFAULT_USER_ID,),
+        )
+        db.execute(
+            "INSERT INTO theses (title, thesis_text, strategy, status, symbols, user_id) "
+            "VALUES ('Broken', 'x', 'long', 'active', 'not json', ?)",
+            (DEFAULT_USER_ID,),
+        )
+        db.connect().commit()
+        congress_engine.store_trades(
+            [
+                _trade(politician="A", symbol="MSFT"),
+                _trade(politician="B", symbol="NVDA"),
+                _trade(politician="C", symbol="XYZ"),
+            ]
+        )
+        symbols = [t["symbol"] for t in congress_engine.check_overlap(DEFAULT_USER_ID)]
+        assert symbols == ["MSFT", "NVDA"]
+
     def test_no_overlap_returns_empty(self, seeded_db):
         """No overlap returns empty list when no trades match."""
         engine = CongressTradesEngine(seeded_db)
         engine.store_trades(
             [
-                {
-                    "politician": "Someone",
-                    "symbol": "ZZZZZ",
-                    "action": "buy",
-                    "amount_range": "",
-                    "date_filed": "2026-01-15",
-                    "date_traded": "2026-01-10",
-                    "source_url": "",
-                },
+                _trade(politician="Someone", symbol="ZZZZZ"),
             ]
         )
         assert engine.check_overlap(DEFAULT_USER_ID) == []
 
 
+class TestOverlapCache:
+    """Tests for per-user memoization of check_overlap."""
+
+    def test_overlap_reused_until_new_trades_stored(self, congress_engine):
+        """Repeat calls skip the DB; storing new trades invalidates the cache."""
+        trade = _trade()
+        congress_engine.store_trades([trade])
+        assert len(congress_engine.check_overlap(DEFAULT_USER_ID)) == 1
+
+        with patch.object(congress_engine.db, "fetchall") as spy:
+            assert len(congress_engine.check_overlap(DEFAULT_USER_ID)) == 1
+        spy.assert_not_called()
+
+        congress_engine.store_trades([{**trade, "date_traded": "2026-01-11"}])
+        assert len(congress_engine.check_overlap(DEFAULT_USER_ID)) == 2
+
+    def test_overlap_expires_after_ttl(self, congress_engine):
+        """Entries older than the TTL are recomputed."""
+        with patch("engine.congress.time.monotonic", return_value=1000.0):
+            congress_engine.check_overlap(DEFAULT_USER_ID)
+        with (
+            patch("engine.congress.time.monotonic", return_value=1061.0),
+            patch.object(congress_engine.db, "fetchall", wraps=congress_engine.db.fetchall) as spy,
+        ):
+            congress_engine.check_overlap(DEFAULT_USER_ID)
+        spy.assert_called_once()
+
+
 class TestGenerateSignals:
     """Tests for signal generation from overlapping trades."""
 
@@ -330,15 +670,7 @@ class TestGenerateSignals:
         engine = congress_engine_with_signals
         engine.store_trades(
             [
-                {
-                    "politician": "Pelosi",
-                    "symbol": "NVDA",
-                    "action": "buy",
-                    "amount_range": "$1M+",
-                    "date_filed": "2026-01-15",
-                    "date_traded": "2026-01-10",
-                    "source_url": "",
-                },
+                _trade(amount_range="$1M+"),
             ]
         )
         signals = engine.generate_signals(DEFAULT_USER_ID)
@@ -353,15 +685,7 @@ class TestGenerateSignals:
         engine = congress_engine_with_signals
         engine.store_trades(
             [
-                {
-                    "politician": "Someone",
-                    "symbol": "NVDA",
-                    "action": "sell",
-                    "amount_range": "",
-                    "date_filed": "2026-01-15",
-                    "date_traded": "2026-01-10",
-                    "source_url": "",
-                },
+                _trade(politician="Someone", action="sell"),
             ]
         )
         signals = engine.generate_signals(DEFAULT_USER_ID)
@@ -372,6 +696,34 @@ class TestGenerateSignals:
         assert congress_engine.generate_signals(DEFAULT_USER_ID) == []
 
 
+class TestThesisMapCache:
+    """Tests for per-user memoization of the parsed thesis map."""
+
+    def test_thesis_map_reused_until_theses_change(self, congress_engine):
+        """The parsed map is reused while unchanged and rebuilt after a thesis write."""
+        first = congress_engine._load_thesis_map(DEFAULT_USER_ID)
+        assert set(first) == {"NVDA", "AVGO"}
+        assert congress_engine._load_thesis_map(DEFAULT_USER_ID) is first
+
+        congress_engine.db.execute(
+            "INSERT INTO theses (title, status, symbols, user_id) "
+            "VALUES ('Cloud', 'active', '[\"MSFT\"]', 1)"
+        )
+        congress_engine.db.connect().commit()
+
+        assert "MSFT" in congress_engine._load_thesis_map(DEFAULT_USER_ID)
+
+    def test_generate_signals_parses_theses_once(self, congress_engine_with_signals):
+        """generate_signals decodes thesis symbols in Python only once."""
+        engine = congress_engine_with_signals
+        with patch.object(engine.db, "fetchall", wraps=engine.db.fetchall) as spy:
+            engine.generate_signals(DEFAULT_USER_ID)
+        thesis_queries = [
+            c for c in spy.call_args_list if c.args[0].startswith("SELECT id, symbols FROM theses")
+        ]
+        assert len(thesis_queries) == 1
+
+
 class TestPoliticianScoreRefresh:
     """Tests for politician score refresh on trade ingestion."""
 
@@ -380,15 +732,13 @@ class TestPoliticianScoreRefresh:
         # Insert enough trades for a politician to get scored
         trades = []
         for i in range(5):
-            trades.append({
-                "politician": "Pelosi",
-                "symbol": "NVDA",
-                "action": "buy",
-                "amount_range": "$1,000,001 - $5,000,000",
-                "date_filed": f"2026-01-{15 + i}",
-                "date_traded": f"2026-01-{10 + i}",
-                "source_url": "",
-            })
+            trades.append(
+                _trade(
+                    amount_range="$1,000,001 - $5,000,000",
+                    date_filed=f"2026-01-{15 + i}",
+                    date_traded=f"2026-01-{10 + i}",
+                )
+            )
         congress_engine.store_trades(trades)
 
         # Check that politician_scores was populated
@@ -402,24 +752,8 @@ class TestPoliticianScoreRefresh:
         """refresh_all_scores rescores all politicians."""
         # Store trades for two politicians
         trades = [
-            {
-                "politician": "Pelosi",
-                "symbol": "NVDA",
-                "action": "buy",
-                "amount_range": "$1M+",
-                "date_filed": "2026-01-15",
-                "date_traded": "2026-01-10",
-                "source_url": "",
-            },
-            {
-                "politician": "Crenshaw",
-                "symbol": "MSFT",
-                "action": "buy",
-                "amount_range": "$100K",
-                "date_filed": "2026-01-15",
-                "date_traded": "2026-01-10",
-                "source_url": "",
-            },
+            _trade(amount_range="$1M+"),
+            _trade(politician="Crenshaw", symbol="MSFT", amount_range="$100K"),
         ]
         congress_engine.store_trades(trades)
 
@@ -435,27 +769,45 @@ class TestGetSummary:
         engine = congress_engine
         engine.store_trades(
             [
-                {
-                    "politician": "A",
-                    "symbol": "NVDA",
-                    "action": "buy",
-                    "amount_range": "",
-                    "date_filed": "2026-01-15",
-                    "date_traded": "2026-01-10",
-                    "source_url": "",
-                },
-                {
-                    "politician": "B",
-                    "symbol": "NVDA",
-                    "action": "buy",
-                    "amount_range": "",
-                    "date_filed": "2026-01-15",
-                    "date_traded": "2026-01-11",
-                    "source_url": "",
-                },
+                _trade(politician="A"),
+                _trade(politician="B", date_traded="2026-01-11"),
             ]
         )
         summary = engine.get_summary(DEFAULT_USER_ID)
         assert summary["total_trades"] == 2
         assert summary["overlapping"] == 2
         assert summary["net_by_symbol"]["NVDA"] == 2
+
+    def test_summary_nets_buys_against_sells(self, congress_engine):
+        """Sells subtract from the per-symbol net and land in recent_sells."""
+        base = {"symbol": "NVDA", "amount_range": "", "date_filed": "2026-01-15", "source_url": ""}
+        congress_engine.store_trades(
+            [
+                {**base, "politician": "A", "action": "buy", "date_traded": "2026-01-10"},
+                {**base, "politician": "B", "action": "sell", "date_traded": "2026-01-11"},
+                {**base, "politician": "C", "action": "sell", "date_traded": "2026-01-12"},
+            ]
+        )
+        summary = congress_engine.get_summary(DEFAULT_USER_ID)
+        assert summary["overlapping"] == 3
+        assert summary["net_by_symbol"]["NVDA"] == -1
+        assert [t["politician"] for t in summary["recent_sells"]] == ["C", "B"]
+
+    def test_summary_exchange_only_symbol_has_no_net(self, congress_engine):
+        """Exchanges count as overlapping but don't create a net entry."""
+        congress_engine.store_trades([_trade(politician="A", action="exchange")])
+        summary = congress_engine.get_summary(DEFAULT_USER_ID)
+        assert summary["overlapping"] == 1
+        assert summary["net_by_symbol"] == {}
+
+    def test_summary_recent_lists_are_bounded(self, congress_engine):
+        """recent_buys is capped at SUMMARY_RECENT_LIMIT, newest first."""
+        trades = [
+            _trade(politician=f"P{i}", date_filed="2026-02-01", date_traded=f"2026-01-{i + 1:02d}")
+            for i in range(SUMMARY_RECENT_LIMIT + 5)
+        ]
+        congress_engine.store_trades(trades)
+        summary = congress_engine.get_summary(DEFAULT_USER_ID)
+        assert summary["net_by_symbol"]["NVDA"] == SUMMARY_RECENT_LIMIT + 5
+        assert len(summary["recent_buys"]) == SUMMARY_RECENT_LIMIT
+        assert summary["recent_buys"][0]["date_traded"] == "2026-01-25"
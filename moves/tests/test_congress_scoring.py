@@ -6,6 +6,8 @@ trade enrichment, and integration with congress signal generation.
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import pytest
 
 from engine.congress_scoring import (
@@ -44,6 +46,16 @@ class TestParseAmountBucket:
     def test_no_dollar_sign(self) -> None:
         assert parse_amount_bucket("50,001 - 100,000") == "medium"
 
+    def test_irregular_tail_uses_regex(self) -> None:
+        assert parse_amount_bucket("$1,001 - 15,000") == "small"
+        assert parse_amount_bucket("Over $50,000,000 (spouse)") == "large"
+
+    def test_repeat_labels_hit_cache(self) -> None:
+        parse_amount_bucket("$250,001 - $500,000")
+        hits = parse_amount_bucket.cache_info().hits
+        assert parse_amount_bucket("$250,001 - $500,000") == "large"
+        assert parse_amount_bucket.cache_info().hits == hits + 1
+
 
 # ── Disclosure Lag ──
 
@@ -67,6 +79,15 @@ class TestDisclosureLag:
         """Filing before trade should return 0."""
         assert calculate_disclosure_lag("2024-06-15", "2024-06-10") == 0
 
+    def test_iso_fast_path_across_leap_day(self) -> None:
+        assert calculate_disclosure_lag("2024-02-28", "2024-03-01") == 2
+
+    def test_impossible_iso_date(self) -> None:
+        assert calculate_disclosure_lag("2024-02-30", "2024-03-01") is None
+
+    def test_missing_date(self) -> None:
+        assert calculate_disclosure_lag("2024-02-28", None) is None
+
 
 # ── Tier Assignment ──
 
@@ -111,6 +132,10 @@ class TestIsEtf:
     def test_case_insensitive(self) -> None:
         assert is_etf("spy") is True
 
+    def test_mixed_case_and_empty(self) -> None:
+        assert is_etf("Qqq") is True
+        assert is_etf("") is False
+
 
 # ── Committee Relevance ──
 
@@ -130,6 +155,9 @@ class TestCommitteeRelevance:
     def test_broad_only_not_relevant(self) -> None:
         assert check_committee_relevance(["Appropriations"], "NVDA") is False
 
+    def test_unknown_and_relevant_mix(self) -> None:
+        assert check_committee_relevance(["Ethics", "Judiciary"], "NVDA") is True
+
 
 # ── PoliticianScorer Integration ──
 
@@ -154,6 +182,13 @@ class TestPoliticianScorer:
         )
         scorer.db.connect().commit()
 
+    def test_ensure_columns_skips_existing(self, scorer) -> None:
+        cols = {r["name"] for r in scorer.db.fetchall("PRAGMA table_info(congress_trades)")}
+        assert {"politician_score", "disclosure_lag_days", "trade_size_bucket"} <= cols
+        with patch.object(scorer.db, "transaction") as txn:
+            scorer._ensure_columns()
+        txn.assert_not_called()
+
     def test_score_politician_no_trades(self, scorer) -> None:
         result = scorer.score_politician("Nobody")
         assert result.total_trades == 0
@@ -180,6 +215,86 @@ class TestPoliticianScorer:
         assert results[0].politician == "Alice"
         assert results[0].score > results[1].score
 
+    def test_score_all_matches_per_politician_scoring(self, scorer) -> None:
+        self._insert_trade(scorer, "Alice", "NVDA", amount="$500,001 - $1,000,000")
+        self._insert_trade(scorer, "Alice", "SPY", date_filed="2024-08-20")
+        self._insert_trade(scorer, "Bob", "XLE", action="sell")
+        scorer.db.execute(
+            "INSERT INTO politician_scores (politician, committees) VALUES (?, ?)",
+            ("Alice", '["Armed Services"]'),
+        )
+        scorer.db.connect().commit()
+
+        batched = {ps.politician: ps for ps in scorer.score_all()}
+        single = {name: scorer.score_politician(name) for name in ("Alice", "Bob")}
+        assert batched == single
+        assert batched["Alice"].committees == ["Armed Services"]
+
+    def test_trade_stats_aggregated_in_sql(self, scorer) -> None:
+        from engine.congress_scoring import _SQL_POLITICIAN_TRADE_STATS, _TradeStats
+
+        self._insert_trade(scorer, "Rep. Test", "NVDA", amount="$500,001 - $1,000,000")
+        self._insert_trade(scorer, "Rep. Test", "SPY", action="sell",
+                           amount="$1,001 - $15,000", date_filed="bad")
+        scorer._backfill_trade_columns(["Rep. Test"])
+
+        row = scorer.db.fetchone(_SQL_POLITICIAN_TRADE_STATS, ("Rep. Test",))
+        stats = _TradeStats.from_row(row)
+        assert (stats.total, stats.buys, stats.individual) == (2, 1, 1)
+        assert stats.bucket_counts == {"large": 1, "small": 1}
+        assert (stats.lag_total, stats.lag_count) == (30, 1)
+        assert stats.symbols == ["NVDA"]
+
+    def test_backfill_skips_write_when_nothing_missing(self, scorer) -> None:
+        self._insert_trade(scorer, "Rep. Test", "NVDA")
+        self._insert_trade(scorer, "Rep. Test", "SPY", date_filed="bad")
+        scorer._backfill_trade_columns()
+
+        with patch.object(scorer.db, "transaction") as txn:
+            scorer._backfill_trade_columns()
+            scorer._backfill_trade_columns(["Rep. Test"])
+        txn.assert_not_called()
+
+    def test_backfill_survives_reconnect(self, scorer) -> None:
+        """Scoring keeps working after the shared connection is closed and reopened."""
+        scorer.db.close()
+        self._insert_trade(scorer, "Rep. Test", "NVDA")
+        scorer.db.execute(
+            "UPDATE congress_trades SET trade_size_bucket = NULL, disclosure_lag_days = NULL"
+        )
+        scorer.db.connect().commit()
+
+        assert scorer.score_politician("Rep. Test").total_trades == 1
+        row = scorer.db.fetchone(
+            "SELECT trade_size_bucket, disclosure_lag_days FROM congress_trades"
+        )
+        assert row == {"trade_size_bucket": "medium", "disclosure_lag_days": 30}
+
+    def test_politician_lookups_use_indexes(self, scorer) -> None:
+        """Per-politician scoring queries seek an index instead of scanning."""
+        from engine.congress_scoring import (
+            _SQL_BACKFILL_CANDIDATES,
+            _SQL_GET_PROFILE,
+            _SQL_POLITICIAN_TRADE_STATS,
+        )
+
+        for sql in (
+            _SQL_POLITICIAN_TRADE_STATS,
+            _SQL_BACKFILL_CANDIDATES + " AND politician = ?",
+            _SQL_GET_PROFILE,
+        ):
+            plan = scorer.db.fetchall("EXPLAIN QUERY PLAN " + sql, ("Rep. Test",))
+            assert any("USING INDEX" in r["detail"] for r in plan), sql
+
+    def test_score_politicians_commits_once(self, scorer) -> None:
+        for name in ("Alice", "Bob"):
+            self._insert_trade(scorer, name, "NVDA")
+        with patch.object(scorer, "_save_scores", wraps=scorer._save_scores) as save:
+            scores = scorer.score_politicians(["Alice", "Bob", "Nobody", ""])
+        save.assert_called_once()
+        assert sorted(ps.politician for ps in scores) == ["Alice", "Bob"]
+        assert scorer.db.fetchone("SELECT COUNT(*) AS n FROM politician_scores")["n"] == 2
+
     def test_score_trade(self, scorer) -> None:
         trade = {"politician": "Unknown", "symbol": "NVDA", "amount_range": "$250,001 - $500,000"}
         score = scorer.score_trade(trade)
@@ -211,6 +326,54 @@ class TestPoliticianScorer:
         assert "politician_score" in enriched
         assert "committee_relevant" in enriched
 
+    def test_enrich_trade_caches_profile_lookups(self, scorer) -> None:
+        self._insert_trade(scorer, "Rep. Test", "NVDA")
+        scorer.score_politician("Rep. Test")
+        trades = [
+            {"politician": "Rep. Test", "symbol": sym, "amount_range": "", "date_traded": ""}
+            for sym in ("NVDA", "AAPL", "MSFT")
+        ]
+        with patch.object(scorer.db, "fetchone", wraps=scorer.db.fetchone) as spy:
+            enriched = [scorer.enrich_trade(t) for t in trades]
+            scorer.score_trade(trades[0])
+        assert spy.call_count == 1
+        assert all(e["politician_score"] is not None for e in enriched)
+
+    def test_profile_cache_invalidated_on_rescore(self, scorer) -> None:
+        self._insert_trade(scorer, "Rep. Test", "NVDA")
+        trade = {"politician": "Rep. Test", "symbol": "NVDA"}
+        assert scorer.enrich_trade(trade)["politician_score"] is None
+        scorer.score_politician("Rep. Test")
+        assert scorer.enrich_trade(trade)["politician_score"] is not None
+
+    def test_profile_cache_expires_for_rescoring_elsewhere(self, scorer) -> None:
+        """A rescore by another scorer instance is seen once the TTL lapses."""
+        self._insert_trade(scorer, "Rep. Test", "NVDA")
+        trade = {"politician": "Rep. Test", "symbol": "NVDA"}
+        with patch("engine.congress_scoring.time.monotonic", return_value=1000.0):
+            assert scorer.enrich_trade(trade)["politician_score"] is None
+
+        PoliticianScorer(scorer.db).score_politician("Rep. Test")
+
+        with patch("engine.congress_scoring.time.monotonic", return_value=1030.0):
+            assert scorer.enrich_trade(trade)["politician_score"] is None
+        with patch("engine.congress_scoring.time.monotonic", return_value=1061.0):
+            assert scorer.enrich_trade(trade)["politician_score"] is not None
+
+    def test_enrich_many_prefetches_in_one_query(self, scorer) -> None:
+        for name in ("Alice", "Bob"):
+            self._insert_trade(scorer, name, "NVDA")
+        scorer.score_all()
+        trades = [{"politician": p, "symbol": "NVDA"} for p in ("Alice", "Bob", "Nobody")]
+        with (
+            patch.object(scorer.db, "fetchall", wraps=scorer.db.fetchall) as fetchall,
+            patch.object(scorer.db, "fetchone", wraps=scorer.db.fetchone) as fetchone,
+        ):
+            enriched = scorer.enrich_many(trades)
+        assert fetchall.call_count == 1
+        fetchone.assert_not_called()
+        assert [e["politician_tier"] != "unknown" for e in enriched] == [True, True, False]
+
     def test_get_top_politicians(self, scorer) -> None:
         self._insert_trade(scorer, "Alice", "NVDA", amount="$500,001 - $1,000,000")
         self._insert_trade(scorer, "Bob", "SPY", amount="$1,001 - $15,000")
@@ -236,6 +399,21 @@ class TestPoliticianScorer:
         assert "Rep. Pelosi" in reasoning
         assert "NVDA" in reasoning
 
+    def test_build_reasoning_reads_enriched_stats(self, scorer) -> None:
+        self._insert_trade(scorer, "Rep. Pelosi", "NVDA", amount="$250,001 - $500,000")
+        scorer.score_politician("Rep. Pelosi")
+        trade = scorer.enrich_trade({"politician": "Rep. Pelosi", "symbol": "NVDA"})
+        with patch.object(scorer.db, "fetchone") as fetchone:
+            reasoning = scorer.build_reasoning(trade)
+        fetchone.assert_not_called()
+        assert f"{trade['win_rate']:.0f}% win rate" in reasoning
+
+    def test_build_reasoning_without_amount(self, scorer) -> None:
+        reasoning = scorer.build_reasoning(
+            {"politician": "Rep. New", "symbol": "NVDA", "politician_score": 72.4}
+        )
+        assert reasoning == "❓ Rep. New (unknown, score 72) bought NVDA."
+
     def test_persists_to_db(self, scorer) -> None:
         self._insert_trade(scorer, "Rep. Test", "NVDA")
         scorer.score_politician("Rep. Test")
@@ -288,7 +466,7 @@ class TestCongressScoringIntegration:
 
         # Setup signal engine mock
         signal_engine = MagicMock()
-        signal_engine.create_signal.side_effect = lambda s: s
+        signal_engine.create_signals_bulk.side_effect = lambda signals: signals
 
         engine = CongressTradesEngine(db, signal_engine)
         signals = engine.generate_signals(user_id=1)
@@ -324,7 +502,7 @@ class TestCongressScoringIntegration:
         db.connect().commit()
 
         signal_engine = MagicMock()
-        signal_engine.create_signal.side_effect = lambda s: s
+        signal_engine.create_signals_bulk.side_effect = lambda signals: signals
 
         engine = CongressTradesEngine(db, signal_engine)
         signals = engine.generate_signals(user_id=1)
@@ -0,0 +1,157 @@
+"""Tests for the MoneyMovesCore orchestrator."""
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from db.database import Database
+from engine import Signal, SignalAction
+from engine.core import MoneyMovesCore
+
+
+@pytest.fixture
+def core(seeded_db: Database) -> MoneyMovesCore:
+    """Core wired to the seeded database, a mock broker and a mock risk manager."""
+    broker = MagicMock()
+    broker.get_account_balance = AsyncMock(return_value={"cash": 50000})
+    moves = MoneyMovesCore(seeded_db, broker)
+    moves.risk_manager = MagicMock()
+    moves.risk_manager.is_kill_switch_active.return_value = False
+    moves.risk_manager.calculate_exposure.return_value = {"gross_exposure": 0.5}
+    return moves
+
+
+class TestStatus:
+    """Tests for startup() and get_system_status()."""
+
+    def test_status_counters_from_one_query(self, core: MoneyMovesCore) -> None:
+        """The status bundle reports pending signals, limits and the latest snapshot."""
+        core.db.execute(
+            "INSERT INTO signals (action, symbol, status, user_id) "
+            "VALUES ('buy', 'NVDA', 'pending', 1)"
+        )
+        status = core.get_system_status(1)
+
+        assert status["db_connected"] is True
+        assert status["pending_signals"] == 1
+        assert status["portfolio_value"] == 100000
+        assert status["cash"] == 50000
+
+    @pytest.mark.asyncio
+    async def test_startup_reports_broker_failure_as_warning(self, core: MoneyMovesCore) -> None:
+        """A broker error during the concurrent checks is a warning, not a failure."""
+        core.broker.get_account_balance.side_effect = RuntimeError("offline")
+
+        result = await core.startup(1)
+
+        assert result["status"] == "ok_with_warnings"
+        assert result["risk_limits_count"] == 7
+        assert result["warnings"] == ["Broker connection issue: offline"]
+
+    @pytest.mark.asyncio
+    async def test_startup_queries_on_loop_thread(self, core: MoneyMovesCore) -> None:
+        """The status query shares the loop thread with the broker's DB access."""
+        threads: list[int] = []
+        fetch = core._fetch_status
+
+        def record(user_id: int) -> dict:
+            threads.append(threading.get_ident())
+            return fetch(user_id)
+
+        core._fetch_status = record
+        result = await core.startup(1)
+
+        assert result["status"] == "ok"
+        assert threads == [threading.get_ident()]
+
+    @pytest.mark.asyncio
+    async def test_shutdown_commits_audit_rows(self, core: MoneyMovesCore) -> None:
+        """Startup/shutdown audit rows are committed before the database closes."""
+        await core.startup(1)
+        await core.shutdown()
+
+        rows = Database(core.db.db_path).fetchall(
+            "SELECT action FROM audit_log WHERE entity_type = 'system' ORDER BY id"
+        )
+        assert [r["action"] for r in rows] == ["system_startup", "system_shutdown"]
+
+    def test_risk_snapshot_reused_within_ttl(self, core: MoneyMovesCore) -> None:
+        """Repeated status reads reuse the exposure reading."""
+        core.get_system_status(1)
+        core.get_system_status(1)
+
+        assert core.risk_manager.calculate_exposure.call_count == 1
+
+    def test_kill_switch_read_fresh_within_ttl(self, core: MoneyMovesCore) -> None:
+        """A kill switch toggled elsewhere shows up on the very next status read."""
+        assert core.get_system_status(1)["kill_switch_active"] is False
+        core.risk_manager.is_kill_switch_active.return_value = True
+
+        assert core.get_system_status(1)["kill_switch_active"] is True
+        assert core.risk_manager.calculate_exposure.call_count == 1
+
+    def test_invalidate_status_forces_fresh_reading(self, core: MoneyMovesCore) -> None:
+        """invalidate_status drops the memoized reading for the user."""
+        core.get_system_status(1)
+        core.invalidate_status(1)
+        core.get_system_status(1)
+
+        assert core.risk_manager.calculate_exposure.call_count == 2
+
+
+class TestProcessSignal:
+    """Tests for the signal processing pipeline."""
+
+    @pytest.mark.asyncio
+    async def test_auto_approved_signal_loaded_once(self, core: MoneyMovesCore) -> None:
+        """Auto-approved execution reuses the signal process_signal already loaded."""
+        signal = Signal(id=5, action=SignalAction.BUY, symbol="NVDA", confidence=0.95)
+        core.signal_engine = MagicMock()
+        core.signal_engine.get_signal.return_value = signal
+        core.approval_workflow = MagicMock()
+        core.approval_workflow.process_signal.return_value = {"status": "auto_approved"}
+        core.broker.place_order = AsyncMock(
+            return_value=MagicMock(filled_price=100.0, order_id="o1", filled_shares=1.0)
+        )
+
+        result = await core.process_signal(5, 1)
+
+        assert result["status"] == "executed"
+        assert core.signal_engine.get_signal.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_sizing_reads_nav_on_loop_thread(self, core: MoneyMovesCore) -> None:
+        """Only the quote lookup leaves the loop thread; the NAV read does not."""
+        nav_threads: list[int] = []
+        core.risk_manager._get_nav.side_effect = lambda _uid: (
+            nav_threads.append(threading.get_ident()) or 10000.0
+        )
+        core.signal_engine = MagicMock()
+        core.broker.place_order = AsyncMock(
+            return_value=MagicMock(filled_price=100.0, order_id="o1", filled_shares=5.0)
+        )
+        signal = Signal(id=5, action=SignalAction.BUY, symbol="NVDA", size_pct=0.05)
+
+        with patch("engine.core.get_price", return_value={"price": 100.0}):
+            await core.execute_approved_signal(5, 1, signal=signal)
+
+        assert nav_threads == [threading.get_ident()]
+        assert core.broker.place_order.call_args.args[0].shares == 5.0
+
+    @pytest.mark.asyncio
+    async def test_execution_audit_committed_immediately(self, core: MoneyMovesCore) -> None:
+        """The execution audit row is visible to other connections without any flush."""
+        signal = Signal(id=5, action=SignalAction.BUY, symbol="NVDA", confidence=0.95)
+        core.signal_engine = MagicMock()
+        core.broker.place_order = AsyncMock(
+            return_value=MagicMock(filled_price=100.0, order_id="o1", filled_shares=1.0)
+        )
+
+        await core.execute_approved_signal(5, 1, signal=signal)
+
+        row = Database(core.db.db_path).fetchone("SELECT action, details FROM audit_log")
+        assert row["action"] == "signal_executed"
+        assert row["details"].startswith("Signal 5:")
@@ -42,6 +42,10 @@ schema-initialized SQLite database in a temporary directory.
 
 from __future__ import annotations
 
+import sqlite3
+
+import pytest
+
 from db.database import Database
 
 
@@ -100,6 +104,16 @@ def test_wal_mode(db: Database) -> None:
     assert row["journal_mode"] == "wal"
 
 
+def test_synchronous_normal(db: Database) -> None:
+    """Verify that commits run with synchronous=NORMAL (1).
+
+    Under WAL this skips the per-commit fsync, so batched writes such as
+    congress trade ingestion aren't bound by disk flush latency.
+    """
+    row = db.fetchone("PRAGMA synchronous")
+    assert row["synchronous"] == 1
+
+
 def test_foreign_keys(db: Database) -> None:
     """Verify that SQLite foreign key enforcement is enabled.
 
@@ -164,6 +178,27 @@ def test_transaction_rollback(db: Database) -> None:
     assert row is None
 
 
+def test_transaction_immediate(db: Database) -> None:
+    """Verify that transaction(immediate=True) holds the write lock from the start.
+
+    A second connection must be unable to begin its own write transaction
+    while the immediate transaction is open, and the work still commits.
+    """
+    other = sqlite3.connect(str(db.db_path), timeout=0)
+    try:
+        with db.transaction(immediate=True) as conn:
+            assert conn.in_transaction
+            with pytest.raises(sqlite3.OperationalError):
+                other.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                """INSERT INTO accounts (name, broker, account_type, account_hash, purpose)
+                   VALUES ('imm', 'mock', 'individual_brokerage', 'h', 'test')"""
+            )
+    finally:
+        other.close()
+    assert db.fetchone("SELECT * FROM accounts WHERE name = 'imm'") is not None
+
+
 def test_schema_version(db: Database) -> None:
     """Verify that get_schema_version() returns 0 for a fresh database.
 
@@ -187,3 +222,31 @@ def test_apply_migration(db: Database) -> None:
     new_version = current + 10
     db.apply_migration(new_version, "-- noop", "test migration")
     assert db.get_schema_version() == new_version
+
+
+def test_hot_path_indexes_used(db: Database) -> None:
+    """Verify the congress symbol and NAV-date lookups are index seeks.
+
+    EXPLAIN QUERY PLAN should report the migration-006 indexes rather than a
+    full table scan for the symbol filter in check_overlap/get_summary and the
+    latest-NAV ORDER BY date DESC LIMIT 1 lookup.
+    """
+    plan = db.fetchall(
+        "EXPLAIN QUERY PLAN SELECT symbol, action, COUNT(*) FROM congress_trades "
+        "WHERE symbol IN ('NVDA', 'AAPL') GROUP BY symbol, action"
+    )
+    assert any("idx_congress_trades_symbol" in r["detail"] for r in plan)
+
+    plan = db.fetchall(
+        "EXPLAIN QUERY PLAN SELECT total_value FROM portfolio_value ORDER BY date DESC LIMIT 1"
+    )
+    assert any("idx_portfolio_value_date" in r["detail"] for r in plan)
+
+
+def test_status_indexes_used(db: Database) -> None:
+    """Verify pending-signal counts and the open-position scan use migration-007 indexes."""
+    plan = db.fetchall("EXPLAIN QUERY PLAN SELECT COUNT(*) FROM signals WHERE status = 'pending'")
+    assert any("idx_signals_status" in r["detail"] for r in plan)
+
+    plan = db.fetchall("EXPLAIN QUERY PLAN SELECT DISTINCT symbol FROM positions WHERE shares > 0")
+    assert any("idx_positions_open_symbol" in r["detail"] for r in plan)
@@ -26,6 +26,7 @@ class TestGetSector:
         """get_sector should handle lowercase input."""
         assert get_sector("aapl") == "Technology"
         assert get_sector("nvda") == "Technology"
+        assert get_sector("Googl") == "Technology"
 
     def test_all_mapped_tickers_return_sector(self) -> None:
         """Every ticker in SECTOR_MAP should return a non-Unknown sector."""
@@ -50,15 +51,15 @@ class TestSearchKeyword:
         assert engine._search_keyword("Cloud") == engine._search_keyword("cloud")
 
     def test_unknown_keyword_returns_empty(self) -> None:
-        """Unknown keywords should return an empty list."""
+        """Unknown keywords should return an empty tuple."""
         engine = DiscoveryEngine.__new__(DiscoveryEngine)
-        assert engine._search_keyword("biotech") == []
-        assert engine._search_keyword("") == []
+        assert engine._search_keyword("biotech") == ()
+        assert engine._search_keyword("") == ()
 
     def test_ev_keyword(self) -> None:
         """EV keyword returns TSLA."""
         engine = DiscoveryEngine.__new__(DiscoveryEngine)
-        assert engine._search_keyword("EV") == ["TSLA"]
+        assert engine._search_keyword("EV") == ("TSLA",)
 
 
 class TestScanUniverse:
@@ -132,3 +133,24 @@ class TestScanUniverse:
         engine = DiscoveryEngine(seeded_db)
         discoveries = engine.scan_universe()
         assert discoveries == []
+
+    def test_scan_reparses_only_changed_keywords(self, seeded_db: Database) -> None:
+        """Repeat scans reuse parsed keywords until the thesis keywords change."""
+        seeded_db.execute(
+            "UPDATE theses SET universe_keywords = ? WHERE id = 1",
+            (json.dumps(["EV"]),),
+        )
+        seeded_db.connect().commit()
+        engine = DiscoveryEngine(seeded_db)
+        engine.scan_universe()
+        cached = engine._keyword_cache[1][1]
+
+        assert [d["symbol"] for d in engine.scan_universe()] == ["TSLA"]
+        assert engine._keyword_cache[1][1] is cached
+
+        seeded_db.execute(
+            "UPDATE theses SET universe_keywords = ? WHERE id = 1",
+            (json.dumps(["cloud"]),),
+        )
+        seeded_db.connect().commit()
+        assert "AMZN" in [d["symbol"] for d in engine.scan_universe()]
@@ -65,6 +65,32 @@ def test_create_signal(seeded_db) -> None:
     assert signal.status == SignalStatus.PENDING
 
 
+def test_create_signals_bulk(seeded_db) -> None:
+    """Verify that create_signals_bulk() assigns the same IDs create_signal() would.
+
+    Inserts a single signal first so the batch does not start at ID 1, then
+    checks that every returned signal maps to its own persisted row and has a
+    matching 'signal_created' audit entry.
+    """
+    engine = SignalEngine(seeded_db)
+    engine.create_signal(Signal(action=SignalAction.BUY, symbol="AAPL", confidence=0.5))
+    batch = [
+        Signal(action=SignalAction.BUY, symbol=sym, confidence=0.3) for sym in ("NVDA", "AVGO")
+    ]
+
+    created = engine.create_signals_bulk(batch)
+
+    assert [s.symbol for s in created] == ["NVDA", "AVGO"]
+    for s in created:
+        assert engine.get_signal(s.id).symbol == s.symbol
+        audit = seeded_db.fetchone(
+            "SELECT 1 FROM audit_log WHERE action = 'signal_created' AND entity_id = ?",
+            (s.id,),
+        )
+        assert audit is not None
+    assert engine.create_signals_bulk([]) == []
+
+
 def test_approve_signal(seeded_db) -> None:
     """Verify that approve_signal() transitions a signal from PENDING to APPROVED.
 